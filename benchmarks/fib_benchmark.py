@@ -0,0 +1,50 @@
+# -----------------------------------------------------------------------------
+# Copyright (C) 2019-2020 The python-ndn authors
+#
+# This file is part of python-ndn.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+# Compare longest prefix match of NameFib against pygtrie, with N per-user prefixes.
+# Usage: python benchmarks/fib_benchmark.py [N]
+import sys
+import time
+from ndn.encoding import Name
+from ndn.name_tree import NameTrie, NameFib, PrefixTreeNode
+
+
+def bench(fib, prefixes, interests):
+    for prefix in prefixes:
+        fib.setdefault(prefix, PrefixTreeNode())
+    start = time.perf_counter()
+    for name in interests:
+        step = fib.longest_prefix(name)
+        assert step
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    prefixes = [Name.from_str('/example'), Name.from_str('/example/app')]
+    prefixes += [Name.from_str(f'/example/app/user/{i}') for i in range(count)]
+    # Interest names are decoded from the wire as memoryviews
+    interests = [Name.from_bytes(Name.to_bytes(f'/example/app/user/{i}/files/report.pdf/v=1/seg={i % 7}'))
+                 for i in range(count)]
+    interests += [Name.from_bytes(Name.to_bytes(f'/example/app/other/{i}')) for i in range(count)]
+    for label, fib in (('pygtrie', NameTrie()), ('NameFib', NameFib())):
+        elapsed = bench(fib, prefixes, interests)
+        print(f'{label:>8}: {elapsed / len(interests) * 1e6:.2f} us/lookup')
+
+
+if __name__ == '__main__':
+    main()
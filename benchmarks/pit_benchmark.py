@@ -0,0 +1,66 @@
+# -----------------------------------------------------------------------------
+# Copyright (C) 2019-2020 The python-ndn authors
+#
+# This file is part of python-ndn.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+# Compare the PIT of NDNApp (v2) against a plain name trie, with N outstanding exact-match Interests.
+# Usage: python benchmarks/pit_benchmark.py [N]
+import sys
+import time
+from ndn.appv2 import PendingInterestTable, InterestTreeNode
+from ndn.encoding import Name
+from ndn.name_tree import NameTrie
+
+
+def bench_trie(names, data_names):
+    pit = NameTrie()
+    start = time.perf_counter()
+    for name in names:
+        pit.setdefault(name, InterestTreeNode())
+    mid = time.perf_counter()
+    for name in data_names:
+        for prefix, _node in list(pit.prefixes(name)):
+            del pit[prefix]
+    end = time.perf_counter()
+    return mid - start, end - mid
+
+
+def bench_table(names, data_names):
+    pit = PendingInterestTable()
+    start = time.perf_counter()
+    for name in names:
+        pit.setdefault(name, False)
+    mid = time.perf_counter()
+    for name in data_names:
+        for node, _is_prefix in pit.match(name):
+            pit.remove(node)
+    end = time.perf_counter()
+    assert len(pit) == 0
+    return mid - start, end - mid
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    names = [Name.from_str(f'/example/testApp/object/v=1/seg={i}') for i in range(count)]
+    # Data names are decoded from the wire as memoryviews
+    data_names = [Name.from_bytes(Name.to_bytes(name)) for name in names]
+    for label, func in (('NameTrie', bench_trie), ('PendingInterestTable', bench_table)):
+        insert, match = func(names, data_names)
+        print(f'{label:>22}: insert {insert / count * 1e6:.2f} us/Interest, '
+              f'match {match / count * 1e6:.2f} us/Data')
+
+
+if __name__ == '__main__':
+    main()
@@ -59,7 +59,7 @@ async def fetch_missing_data():
         del local_sv[enc.Name.to_bytes(name_node_id)]
         for node_id, seq in local_sv.items():
             fetched_seq = fetched_dict.get(node_id, 0)
-            node_name = enc.Name.from_bytes(node_id) + group_prefix
+            node_name = node_id + group_prefix
             if fetched_seq < seq:
                 fetched_dict[node_id] = seq
                 for i in range(fetched_seq+1, seq+1):
@@ -23,10 +23,10 @@ from .utils import gen_nonce
 from .encoding import BinaryStr, TypeNumber, LpTypeNumber, parse_interest, \
     parse_tl_num, parse_data, DecodeError, Name, NonStrictName, MetaInfo, \
     make_data, InterestParam, make_interest, FormalName, SignaturePtrs, parse_lp_packet, Component
-from .security import Keychain, sha256_digest_checker, params_sha256_checker, NullSigner
+from .security import Keychain, sha256_digest_checker, params_sha256_checker, NullSigner, VerificationPool
 from .transport.face import Face
 from .app_support.nfd_mgmt import make_command, parse_response
-from .name_tree import NameTrie, InterestTreeNode, PrefixTreeNode
+from .name_tree import NameTrie, NameFib, InterestTreeNode, PrefixTreeNode
 from .types import NetworkError, InterestTimeout, Validator, Route, InterestCanceled, \
     InterestNack, ValidationFailure
 from .client_conf import read_client_conf, default_face, default_keychain
@@ -40,19 +40,23 @@ class NDNApp:
     :ivar keychain: the Keychain to store Identities and Keys, providing Signers.
     :ivar int_validator: the default validator for Interest packets.
     :ivar data_validator: the default validator for Data packets.
+    :ivar verification_pool: the pool verifying signatures off the event loop, used by validators
+        like :any:`CascadeChecker` created for this app. ``None`` means verifying on the event loop.
     """
     face: Face = None
     keychain: Keychain = None
     _int_tree: NameTrie = None
-    _prefix_tree: NameTrie = None
+    _prefix_tree: NameFib = None
     int_validator: Validator = None
     data_validator: Validator = None
+    verification_pool: Optional[VerificationPool] = None
     _autoreg_routes: List[Tuple[FormalName, Route, Optional[Validator], bool, bool]]
     _prefix_register_semaphore: aio.Semaphore = None
     logger: logging.Logger
 
-    def __init__(self, face=None, keychain=None):
+    def __init__(self, face=None, keychain=None, verification_pool: Optional[VerificationPool] = None):
         self.logger = logging.getLogger(__name__)
+        self.verification_pool = verification_pool
         config = read_client_conf() if not face or not keychain else {}
         if face is not None:
             self.face = face
@@ -64,7 +68,7 @@ class NDNApp:
         else:
             self.keychain = default_keychain(config['pib'], config['tpm'])
         self._int_tree = NameTrie()
-        self._prefix_tree = NameTrie()
+        self._prefix_tree = NameFib()
         self.data_validator = sha256_digest_checker
         self.int_validator = sha256_digest_checker
         self._autoreg_routes = []
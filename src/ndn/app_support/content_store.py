@@ -0,0 +1,233 @@
+# -----------------------------------------------------------------------------
+# Copyright (C) 2019-2022 The python-ndn authors
+#
+# This file is part of python-ndn.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+import abc
+import struct
+import time
+from collections import OrderedDict
+from hashlib import sha256
+from typing import Optional
+from ..encoding import FormalName, BinaryStr, DataView, Component, DecodeError
+from ..name_tree import NameTrie
+
+
+class EvictionPolicy(metaclass=abc.ABCMeta):
+    """
+    The policy choosing which Data to evict when a :any:`ContentStore` is full.
+    Data are identified by the keys given by the content store.
+    """
+
+    @abc.abstractmethod
+    def on_insert(self, key: bytes):
+        pass
+
+    @abc.abstractmethod
+    def on_access(self, key: bytes):
+        pass
+
+    @abc.abstractmethod
+    def on_remove(self, key: bytes):
+        pass
+
+    @abc.abstractmethod
+    def victim(self) -> bytes:
+        """
+        Choose a Data to evict. Only called when the content store is not empty.
+
+        :return: the key of the Data.
+        """
+        pass
+
+
+class FifoPolicy(EvictionPolicy):
+    """
+    Evict the Data inserted the earliest.
+    """
+
+    def __init__(self):
+        self._queue = OrderedDict()
+
+    def on_insert(self, key: bytes):
+        self._queue[key] = None
+        self._queue.move_to_end(key)
+
+    def on_access(self, key: bytes):
+        pass
+
+    def on_remove(self, key: bytes):
+        self._queue.pop(key, None)
+
+    def victim(self) -> bytes:
+        return next(iter(self._queue))
+
+
+class LruPolicy(FifoPolicy):
+    """
+    Evict the Data used the least recently.
+    """
+
+    def on_access(self, key: bytes):
+        self._queue.move_to_end(key)
+
+
+class _CsEntry:
+    __slots__ = ('name', 'wire', 'fresh_until', '_digest')
+
+    def __init__(self, name: FormalName, wire: bytes, fresh_until: float):
+        self.name = name
+        self.wire = wire
+        self.fresh_until = fresh_until
+        self._digest = None
+
+    @property
+    def digest(self) -> bytes:
+        if self._digest is None:
+            self._digest = sha256(self.wire).digest()
+        return self._digest
+
+
+class ContentStore:
+    """
+    An in-memory content store of Data packets, bounded by the total size of packets.
+
+    :ivar capacity: the maximum total size of stored packets in bytes.
+    :vartype capacity: int
+    :ivar policy: the eviction policy.
+    :vartype policy: :any:`EvictionPolicy`
+    :ivar size: the current total size of stored packets in bytes.
+    :vartype size: int
+    :ivar hits: the number of lookups returning a Data.
+    :vartype hits: int
+    :ivar misses: the number of lookups returning nothing.
+    :vartype misses: int
+    :ivar evictions: the number of Data evicted.
+    :vartype evictions: int
+    """
+    capacity: int
+    policy: EvictionPolicy
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+    _exact: dict[bytes, _CsEntry]
+    _prefix: NameTrie
+
+    def __init__(self, capacity: int = 16 * 1024 * 1024, policy: Optional[EvictionPolicy] = None):
+        self.capacity = capacity
+        self.policy = policy if policy is not None else LruPolicy()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._exact = {}
+        self._prefix = NameTrie()
+
+    def __len__(self):
+        return len(self._exact)
+
+    @staticmethod
+    def _key(name: FormalName) -> bytes:
+        return b''.join(name)
+
+    def insert(self, wire: BinaryStr) -> bool:
+        """
+        Store a Data packet, replacing the one with the same name.
+
+        :param wire: the encoded Data packet.
+        :return: ``True`` if stored. ``False`` if it is larger than the capacity, or cannot be decoded.
+        """
+        if len(wire) > self.capacity:
+            return False
+        wire = bytes(wire)
+        try:
+            view = DataView(wire)
+            name = view.name
+            freshness_period = view.meta_info.freshness_period
+        except (DecodeError, TypeError, ValueError, IndexError, struct.error):
+            return False
+        # A Data without FreshnessPeriod is never fresh
+        fresh_until = time.monotonic() + freshness_period / 1000.0 if freshness_period else 0.0
+        key = self._key(name)
+        if key in self._exact:
+            self._remove(key)
+        entry = _CsEntry(name, wire, fresh_until)
+        self._exact[key] = entry
+        self._prefix[name] = entry
+        self.size += len(wire)
+        self.policy.on_insert(key)
+        while self.size > self.capacity:
+            self._remove(self.policy.victim())
+            self.evictions += 1
+        return True
+
+    def _remove(self, key: bytes):
+        entry = self._exact.pop(key)
+        del self._prefix[entry.name]
+        self.size -= len(entry.wire)
+        self.policy.on_remove(key)
+
+    def remove(self, name: FormalName):
+        """
+        Remove the Data with exactly the given name if it exists.
+
+        :param name: the Data name.
+        """
+        key = self._key(name)
+        if key in self._exact:
+            self._remove(key)
+
+    def clear(self):
+        for key in list(self._exact):
+            self._remove(key)
+
+    def find(self, name: FormalName, can_be_prefix: bool = False, must_be_fresh: bool = False) -> Optional[bytes]:
+        """
+        Find a Data satisfying an Interest.
+
+        :param name: the Interest name, which may end with an implicit digest.
+        :param can_be_prefix: the CanBePrefix of the Interest.
+        :param must_be_fresh: the MustBeFresh of the Interest.
+        :return: the encoded Data packet, or ``None`` if nothing matches.
+        """
+        digest = None
+        if name and Component.get_type(name[-1]) == Component.TYPE_IMPLICIT_SHA256:
+            digest = bytes(Component.get_value(name[-1]))
+            name = name[:-1]
+        now = time.monotonic()
+
+        def usable(ent: _CsEntry) -> bool:
+            return ((not must_be_fresh or ent.fresh_until > now)
+                    and (digest is None or ent.digest == digest))
+
+        ret = None
+        entry = self._exact.get(self._key(name))
+        if entry is not None and usable(entry):
+            ret = entry
+        elif can_be_prefix and digest is None:
+            try:
+                for entry in self._prefix.itervalues(prefix=name):
+                    if usable(entry):
+                        ret = entry
+                        break
+            except KeyError:
+                pass
+        if ret is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.policy.on_access(self._key(ret.name))
+        return ret.wire
@@ -18,7 +18,7 @@
 from typing import Optional
 from ..encoding import NonStrictName, Name, BinaryStr, InterestParam, FormalName
 from ..types import Route
-from ..name_tree import NameTrie, PrefixTreeNode
+from ..name_tree import NameFib, PrefixTreeNode
 
 
 class Dispatcher:
@@ -26,10 +26,10 @@ class Dispatcher:
     An Interest dispatcher that helps a producer application further dispatches Interests under some route.
     """
 
-    _tree: NameTrie = None
+    _tree: NameFib = None
 
     def __init__(self):
-        self._tree = NameTrie()
+        self._tree = NameFib()
 
     def register(self, name: NonStrictName, func: Route):
         """
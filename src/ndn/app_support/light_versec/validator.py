@@ -21,9 +21,10 @@
 # limitations under the License.
 # -----------------------------------------------------------------------------
 import logging
+from typing import Optional
 from ...encoding import BinaryStr, SignaturePtrs, FormalName, parse_data, Name
 from ...app import NDNApp, Validator
-from ...security import union_checker
+from ...security import union_checker, VerificationPool
 from ...security.validator.cascade_validator import CascadeChecker, PublicKeyStorage, MemoryKeyStorage
 from .checker import Checker
 
@@ -31,7 +32,8 @@ __all__ = ['lvs_validator']
 
 
 def lvs_validator(checker: Checker, app: NDNApp, trust_anchor: BinaryStr,
-                  storage: PublicKeyStorage = MemoryKeyStorage()) -> Validator:
+                  storage: PublicKeyStorage = MemoryKeyStorage(),
+                  pool: Optional[VerificationPool] = None) -> Validator:
     async def validate_name(name: FormalName, sig_ptrs: SignaturePtrs) -> bool:
         if (not sig_ptrs.signature_info or not sig_ptrs.signature_info.key_locator
                 or not sig_ptrs.signature_info.key_locator.name):
@@ -50,7 +52,7 @@ def lvs_validator(checker: Checker, app: NDNApp, trust_anchor: BinaryStr,
             raise ValueError('Trust anchor does not match all roots of trust of LVS model')
 
     sanity_check()
-    cas_checker = CascadeChecker(app, trust_anchor, storage)
+    cas_checker = CascadeChecker(app, trust_anchor, storage, pool)
     ret = union_checker(validate_name, cas_checker)
     cas_checker.next_level = ret
     return ret
@@ -0,0 +1,223 @@
+# -----------------------------------------------------------------------------
+# Copyright (C) 2019-2022 The python-ndn authors
+#
+# This file is part of python-ndn.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+import asyncio as aio
+from hashlib import sha256
+from typing import Optional
+from ..encoding import TlvModel, BytesField, RepeatedField, NonStrictName, FormalName, Name, Component, \
+    MetaInfo, Signer, make_data, DecodeError
+from ..security import DigestSha256Signer
+from ..appv2 import NDNApp, Validator, RetxPolicy, pass_all
+from ..types import ValidResult, InterestNack, InterestTimeout, ValidationFailure
+
+
+MANIFEST_COMPONENT = Component.from_str('32=manifest')
+DIGESTS_PER_MANIFEST = 128
+
+
+class ManifestTypeNumber:
+    SEGMENT_DIGEST = 0x8E
+    NEXT_MANIFEST = 0x8F
+
+
+class ManifestValue(TlvModel):
+    """
+    The Content of a manifest segment.
+
+    A segmented object ``/obj`` is described by a chain of manifest segments ``/obj/32=manifest/<seg>``.
+    Each of them lists the implicit SHA-256 digests of consecutive segments of the object,
+    and the implicit SHA-256 digest of the next manifest segment.
+    Only the first manifest segment is signed by the producer's key.
+    The others and all segments of the object are signed with DigestSha256,
+    and are verified by the digests listed in the chain.
+    """
+    segment_digests = RepeatedField(BytesField(ManifestTypeNumber.SEGMENT_DIGEST))
+    next_manifest = BytesField(ManifestTypeNumber.NEXT_MANIFEST)
+
+
+def split_digests(digests: list[bytes], digests_per_manifest: int = DIGESTS_PER_MANIFEST) -> list[list[bytes]]:
+    """
+    Split segment digests into the lists carried by each manifest segment.
+    An object without segments still has one empty manifest segment.
+
+    :param digests: the implicit SHA-256 digests of all segments, in order.
+    :param digests_per_manifest: the maximum number of digests in a manifest segment.
+    :return: the digests of each manifest segment.
+    """
+    if not digests:
+        return [[]]
+    return [digests[i:i + digests_per_manifest] for i in range(0, len(digests), digests_per_manifest)]
+
+
+def encode_manifest(segment_digests: list[bytes], next_manifest: Optional[bytes] = None) -> bytes:
+    """
+    Encode the Content of a manifest segment.
+
+    :param segment_digests: the implicit SHA-256 digests of the segments it covers.
+    :param next_manifest: the implicit SHA-256 digest of the next manifest segment, ``None`` for the last one.
+    :return: the encoded :any:`ManifestValue`.
+    """
+    manifest = ManifestValue()
+    manifest.segment_digests = segment_digests
+    manifest.next_manifest = next_manifest
+    return bytes(manifest.encode())
+
+
+def make_manifests(name: NonStrictName, digests: list[bytes], signer: Optional[Signer],
+                   freshness_period: Optional[int] = None,
+                   digests_per_manifest: int = DIGESTS_PER_MANIFEST) -> list[bytes]:
+    """
+    Make the manifest segments of a segmented object.
+    The chain is built from the end, since every manifest segment contains the digest of the next one.
+
+    :param name: the name of the object, without segment number.
+    :param digests: the implicit SHA-256 digests of all segments, in order.
+    :param signer: the signer of the first manifest segment.
+    :param freshness_period: the FreshnessPeriod of manifest segments.
+    :param digests_per_manifest: the maximum number of digests in a manifest segment.
+    :return: the encoded manifest segments, in order.
+    """
+    prefix = Name.normalize(name) + [MANIFEST_COMPONENT]
+    chunks = split_digests(digests, digests_per_manifest)
+    meta_info = MetaInfo(freshness_period=freshness_period, final_block_id=Component.from_segment(len(chunks) - 1))
+    digest_signer = DigestSha256Signer()
+    ret = [b''] * len(chunks)
+    next_manifest = None
+    for i in reversed(range(len(chunks))):
+        wire = bytes(make_data(prefix + [Component.from_segment(i)], meta_info,
+                               encode_manifest(chunks[i], next_manifest),
+                               signer=signer if i == 0 else digest_signer))
+        ret[i] = wire
+        next_manifest = sha256(wire).digest()
+    return ret
+
+
+class ManifestReader:
+    """
+    Verify the segments of an object against its manifest, fetching manifest segments when needed.
+
+    The first manifest segment is validated by ``validator``.
+    The following ones are fetched with their implicit digests in the Interest names,
+    so they are verified when they are matched.
+    Therefore, the whole object is verified by one signature.
+
+    The :meth:`validate` method is a :any:`Validator` for the segments, e.g. for a :any:`SegmentPipeline`.
+
+    :ivar name: the name of the object, without segment number.
+    :vartype name: :any:`FormalName`
+    :ivar digests: the segment digests known so far.
+    :vartype digests: list[bytes]
+    :ivar complete: whether the last manifest segment is fetched.
+    :vartype complete: bool
+    :ivar manifests_fetched: the number of manifest segments fetched.
+    :vartype manifests_fetched: int
+    """
+    name: FormalName
+    digests: list[bytes]
+    complete: bool
+    manifests_fetched: int
+
+    def __init__(self, app: NDNApp, name: NonStrictName, validator: Validator = pass_all, lifetime: int = 4000,
+                 must_be_fresh: bool = False, max_retries: int = 15):
+        """
+        :param app: the NDNApp.
+        :param name: the name of the object, without segment number.
+        :param validator: the validator for the first manifest segment.
+        :param lifetime: the InterestLifetime in milliseconds.
+        :param must_be_fresh: the MustBeFresh of the Interest for the first manifest segment.
+        :param max_retries: the maximum number of retransmissions of a manifest segment.
+        """
+        self.app = app
+        self.name = Name.normalize(name)
+        self.validator = validator
+        self.lifetime = lifetime
+        self.must_be_fresh = must_be_fresh
+        self.max_retries = max_retries
+        self.digests = []
+        self.complete = False
+        self.manifests_fetched = 0
+        self._next_manifest = None
+        self._lock = aio.Lock()
+
+    async def digest(self, seg_no: int) -> Optional[bytes]:
+        """
+        Get the implicit SHA-256 digest of a segment, fetching manifest segments until it is listed.
+
+        :param seg_no: the segment number.
+        :return: the digest, or ``None`` if the segment is beyond the end of the manifest.
+        :raises InterestNack: a manifest segment is Nacked.
+        :raises InterestTimeout: a manifest segment times out for ``max_retries`` times.
+        :raises ValidationFailure: the first manifest segment fails to validate.
+        :raises DecodeError: a manifest segment is malformed.
+        """
+        async with self._lock:
+            while seg_no >= len(self.digests) and not self.complete:
+                await self._fetch_next()
+        return self.digests[seg_no] if seg_no < len(self.digests) else None
+
+    async def _fetch_next(self):
+        name = self.name + [MANIFEST_COMPONENT, Component.from_segment(self.manifests_fetched)]
+        if self.manifests_fetched == 0:
+            validator = self.validator
+            must_be_fresh = self.must_be_fresh
+        else:
+            name.append(Component.from_bytes(self._next_manifest, Component.TYPE_IMPLICIT_SHA256))
+            validator = pass_all
+            must_be_fresh = False
+        trial_times = 0
+        while True:
+            try:
+                _, content, _ = await self.app.express(name, validator, must_be_fresh=must_be_fresh,
+                                                       can_be_prefix=False, lifetime=self.lifetime,
+                                                       retx=RetxPolicy())
+                break
+            except (InterestNack, InterestTimeout):
+                trial_times += 1
+                if trial_times > self.max_retries:
+                    raise
+        manifest = ManifestValue.parse(content if content is not None else b'', ignore_critical=True)
+        if manifest.segment_digests:
+            self.digests.extend(bytes(d) for d in manifest.segment_digests)
+        if manifest.next_manifest:
+            self._next_manifest = bytes(manifest.next_manifest)
+        else:
+            self.complete = True
+        self.manifests_fetched += 1
+
+    async def validate(self, name: FormalName, _sig, context) -> ValidResult:
+        """
+        Validate a segment by comparing its implicit SHA-256 digest with the manifest.
+        No signature is verified.
+
+        :param name: the segment name, ending with a segment number.
+        :param context: the :any:`PktContext` of the segment.
+        :return: PASS if the digest matches. FAIL if it does not, the segment is not listed,
+            or the manifest is invalid. TIMEOUT if the manifest cannot be retrieved,
+            which is not cached by a :any:`VerificationCache` since it may succeed later.
+        """
+        try:
+            seg_no = Component.to_number(name[-1])
+            expected = await self.digest(seg_no)
+        except (InterestNack, InterestTimeout):
+            return ValidResult.TIMEOUT
+        except (ValidationFailure, DecodeError, ValueError, IndexError):
+            return ValidResult.FAIL
+        if expected is None:
+            return ValidResult.FAIL
+        if sha256(context['raw_packet']).digest() != expected:
+            return ValidResult.FAIL
+        return ValidResult.PASS
@@ -0,0 +1,430 @@
+# -----------------------------------------------------------------------------
+# Copyright (C) 2019-2022 The python-ndn authors
+#
+# This file is part of python-ndn.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+import abc
+import asyncio as aio
+import logging
+import sys
+import time
+from collections import deque
+from typing import Optional, AsyncIterator
+from ..encoding import NonStrictName, FormalName, BinaryStr, Name, Component
+from ..encoding.ndnlp_v2 import NackReason
+from ..appv2 import NDNApp, Validator, pass_all
+from ..types import InterestNack, InterestTimeout
+from ..utils import RttEstimator
+
+
+class WindowControl(metaclass=abc.ABCMeta):
+    """
+    The congestion window of a :any:`SegmentPipeline`, i.e. the number of Interests allowed in flight.
+
+    :ivar window: the current window size. The pipeline uses its integer part, and at least one.
+    :vartype window: float
+    """
+    window: float
+
+    @abc.abstractmethod
+    def on_data(self):
+        """
+        Called when a segment is received without congestion signals.
+        """
+        pass
+
+    @abc.abstractmethod
+    def on_congestion(self):
+        """
+        Called when a timeout, a congestion Nack or a congestion mark is detected.
+        The pipeline calls it at most once per window of Interests.
+        """
+        pass
+
+
+class FixedWindow(WindowControl):
+    """
+    A window of fixed size.
+    """
+
+    def __init__(self, window: int = 8):
+        self.window = window
+
+    def on_data(self):
+        pass
+
+    def on_congestion(self):
+        pass
+
+
+class AimdWindow(WindowControl):
+    """
+    Additive-increase/multiplicative-decrease window, with slow start.
+
+    :ivar ssthresh: the slow start threshold.
+    :vartype ssthresh: float
+    :ivar increase: the window increase per window of received segments in congestion avoidance.
+    :vartype increase: float
+    :ivar decrease: the factor multiplied to the window on congestion.
+    :vartype decrease: float
+    :ivar min_window: the minimum window size.
+    :vartype min_window: float
+    """
+    ssthresh: float
+    increase: float
+    decrease: float
+    min_window: float
+
+    def __init__(self, initial_window: float = 2.0, ssthresh: float = float('inf'), increase: float = 1.0,
+                 decrease: float = 0.5, min_window: float = 1.0):
+        self.window = initial_window
+        self.ssthresh = ssthresh
+        self.increase = increase
+        self.decrease = decrease
+        self.min_window = min_window
+
+    def on_data(self):
+        if self.window < self.ssthresh:
+            self.window += 1.0
+        else:
+            self.window += self.increase / self.window
+
+    def on_congestion(self):
+        self.ssthresh = max(self.window * self.decrease, self.min_window)
+        self.window = self.ssthresh
+
+
+class CubicWindow(WindowControl):
+    """
+    CUBIC window following RFC 8312, with slow start and fast convergence.
+    The window grows as a cubic function of the time since the last congestion event.
+
+    :ivar ssthresh: the slow start threshold.
+    :vartype ssthresh: float
+    :ivar c: the scaling constant of the cubic function.
+    :vartype c: float
+    :ivar beta: the factor multiplied to the window on congestion.
+    :vartype beta: float
+    :ivar min_window: the minimum window size.
+    :vartype min_window: float
+    """
+    ssthresh: float
+    c: float
+    beta: float
+    min_window: float
+
+    def __init__(self, initial_window: float = 2.0, ssthresh: float = float('inf'), c: float = 0.4,
+                 beta: float = 0.7, min_window: float = 1.0):
+        self.window = initial_window
+        self.ssthresh = ssthresh
+        self.c = c
+        self.beta = beta
+        self.min_window = min_window
+        self._w_max = 0.0
+        self._last_w_max = 0.0
+        self._k = 0.0
+        self._epoch_start = time.monotonic()
+
+    def on_data(self):
+        if self.window < self.ssthresh:
+            self.window += 1.0
+            return
+        t = time.monotonic() - self._epoch_start
+        target = self.c * (t - self._k) ** 3 + self._w_max
+        if target > self.window:
+            self.window += (target - self.window) / self.window
+        else:
+            # Keep probing slowly around W_max
+            self.window += 0.01 / self.window
+
+    def on_congestion(self):
+        # Fast convergence: release bandwidth if the window stops at a lower point than last time
+        if self.window < self._last_w_max:
+            self._last_w_max = self.window
+            self._w_max = self.window * (1.0 + self.beta) / 2.0
+        else:
+            self._last_w_max = self.window
+            self._w_max = self.window
+        self.window = max(self.window * self.beta, self.min_window)
+        self.ssthresh = self.window
+        self._k = (self._w_max * (1.0 - self.beta) / self.c) ** (1.0 / 3.0)
+        self._epoch_start = time.monotonic()
+
+
+class SegmentPipeline:
+    """
+    Fetch a segmented object with multiple Interests in flight, delivering segments in order.
+    It is an async iterator of the Content of segments.
+
+    The number of Interests in flight is controlled by a :any:`WindowControl`.
+    Timeouts, Nacks with reason Congestion and Data with a CongestionMark are congestion signals.
+    Like ndncatchunks, the window is decreased at most once for the segments in flight at the time,
+    so losing several segments of a burst only decreases it once.
+    Segments lost are retransmitted before new ones are requested.
+    A segment is considered lost if no Data arrives within the RTO given by the :any:`RttEstimator` of the prefix,
+    or within the InterestLifetime if it is shorter.
+    The estimator is updated with the RTT of segments received without retransmission.
+    Like the window, the RTO is backed off at most once for the segments in flight.
+
+    The last segment is identified by the FinalBlockId of any received segment.
+
+    Segments received out of order are buffered until the missing ones arrive.
+    With ``bounded_reorder``, a segment is only requested if it is less than a window after the first
+    segment not delivered yet, so at most a window of segments is buffered whatever the losses are.
+    Segments are not requested while the consumer is processing a delivered one,
+    so a slow consumer does not make the buffer grow either.
+
+    :ivar name: the name prefix of the segments.
+    :vartype name: :any:`FormalName`
+    :ivar window_control: the window control.
+    :vartype window_control: :any:`WindowControl`
+    :ivar rtt_estimator: the RTT estimator of the prefix, shared with the NDNApp.
+    :vartype rtt_estimator: :any:`RttEstimator`
+    :ivar final_segment: the number of the last segment, or ``None`` if unknown.
+    :vartype final_segment: Optional[int]
+    :ivar received: the number of segments received.
+    :vartype received: int
+    :ivar retransmissions: the number of Interests retransmitted.
+    :vartype retransmissions: int
+    :ivar timeouts: the number of timeouts.
+    :vartype timeouts: int
+    :ivar nacks: the number of Nacks received.
+    :vartype nacks: int
+    :ivar congestion_marks: the number of Data received with a CongestionMark.
+    :vartype congestion_marks: int
+    :ivar window_decreases: the number of times the window is decreased.
+    :vartype window_decreases: int
+    :ivar interests_sent: the number of Interests sent, including retransmissions.
+    :vartype interests_sent: int
+    :ivar bytes_received: the total size of received Data packets.
+    :vartype bytes_received: int
+    :ivar content_bytes: the total size of the Content of delivered segments.
+    :vartype content_bytes: int
+    """
+    name: FormalName
+    window_control: WindowControl
+    rtt_estimator: RttEstimator
+    final_segment: Optional[int]
+    received: int
+    retransmissions: int
+    timeouts: int
+    nacks: int
+    congestion_marks: int
+    window_decreases: int
+    interests_sent: int
+    bytes_received: int
+    content_bytes: int
+
+    def __init__(self, app: NDNApp, name: NonStrictName, validator: Validator = pass_all,
+                 window_control: Optional[WindowControl] = None, lifetime: int = 4000, must_be_fresh: bool = False,
+                 max_retries: int = 15, ignore_congestion_marks: bool = False, bounded_reorder: bool = False):
+        """
+        :param app: the NDNApp.
+        :param name: the name prefix of the segments, which are named by appending a segment number component.
+        :param validator: the validator for the segments.
+        :param window_control: the window control. :any:`AimdWindow` is used if ``None``.
+        :param lifetime: the InterestLifetime in milliseconds.
+        :param must_be_fresh: the MustBeFresh of Interests.
+        :param max_retries: the maximum number of retransmissions of a segment. Negative means no limit.
+        :param ignore_congestion_marks: if ``True``, CongestionMarks do not decrease the window.
+        :param bounded_reorder: if ``True``, at most a window of segments is buffered for reordering.
+        """
+        self.app = app
+        self.name = Name.normalize(name)
+        self.validator = validator
+        self.window_control = window_control if window_control is not None else AimdWindow()
+        self.lifetime = lifetime
+        self.rtt_estimator = app.rtt_estimator(self.name)
+        self.must_be_fresh = must_be_fresh
+        self.max_retries = max_retries if max_retries >= 0 else sys.maxsize
+        self.ignore_congestion_marks = ignore_congestion_marks
+        self.bounded_reorder = bounded_reorder
+        self.final_segment = None
+        self.received = 0
+        self.retransmissions = 0
+        self.timeouts = 0
+        self.nacks = 0
+        self.congestion_marks = 0
+        self.window_decreases = 0
+        self.interests_sent = 0
+        self.bytes_received = 0
+        self.content_bytes = 0
+        self._start_time = None
+        self._end_time = None
+        self._in_flight: dict[aio.Task, int] = {}
+        self._retries: dict[int, int] = {}
+        self._retx_queue: deque[int] = deque()
+        self._received: dict[int, Optional[BinaryStr]] = {}
+        self._next_seg = 0
+        self._next_deliver = 0
+        self._recovery_point = 0
+        self.logger = logging.getLogger(__name__)
+
+    async def _fetch(self, seg_no: int):
+        name = self.name + [Component.from_segment(seg_no)]
+        loop = aio.get_running_loop()
+        sent_time = loop.time()
+        request = aio.ensure_future(self.app.express(
+            name, self.validator, must_be_fresh=self.must_be_fresh, can_be_prefix=False,
+            lifetime=self.lifetime))
+        try:
+            # Time out at the RTO. The lifetime is still an upper bound, as the Interest times out then
+            done, _ = await aio.wait([request], timeout=self.rtt_estimator.rto)
+        finally:
+            if not request.done():
+                request.cancel()
+                # A cancelled Interest raises InterestCanceled, which nobody is waiting for
+                request.add_done_callback(lambda t: t.cancelled() or t.exception())
+        if not done:
+            return None, None, InterestTimeout()
+        try:
+            _, content, context = request.result()
+        except (InterestNack, InterestTimeout) as e:
+            return None, None, e
+        # Karn's algorithm: the RTT is ambiguous once the segment is retransmitted
+        if seg_no not in self._retries:
+            self.rtt_estimator.add_measurement(loop.time() - sent_time)
+        return content, context, None
+
+    def __aiter__(self) -> AsyncIterator[Optional[BinaryStr]]:
+        return self._run()
+
+    @property
+    def elapsed(self) -> float:
+        """
+        The time in seconds from the first Interest to the last segment delivered, or until now if not finished.
+        """
+        if self._start_time is None:
+            return 0.0
+        end = self._end_time if self._end_time is not None else time.monotonic()
+        return end - self._start_time
+
+    async def _run(self) -> AsyncIterator[Optional[BinaryStr]]:
+        self._in_flight = {}
+        self._retries = {}
+        self._retx_queue = deque()
+        self._received = {}
+        self._next_seg = 0
+        self._next_deliver = 0
+        # A congestion signal from a segment requested before this one is ignored
+        self._recovery_point = 0
+        self._start_time = time.monotonic()
+        self._end_time = None
+        try:
+            while self.final_segment is None or self._next_deliver <= self.final_segment:
+                self._fill_window()
+                if not self._in_flight:
+                    break
+
+                done, _ = await aio.wait(self._in_flight, return_when=aio.FIRST_COMPLETED)
+                for task in done:
+                    seg_no = self._in_flight.pop(task)
+                    content, context, err = task.result()
+                    if self.final_segment is not None and seg_no > self.final_segment:
+                        continue
+                    if err is None:
+                        self._on_data(seg_no, content, context)
+                    else:
+                        self._on_error(seg_no, err)
+                self._drop_beyond_final()
+
+                while self._next_deliver in self._received:
+                    content = self._received.pop(self._next_deliver)
+                    self._next_deliver += 1
+                    if content is not None:
+                        self.content_bytes += len(content)
+                    yield content
+        finally:
+            self._end_time = time.monotonic()
+            for task in self._in_flight:
+                task.cancel()
+                # A cancelled Interest raises InterestCanceled, which nobody is waiting for
+                task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    def _fill_window(self):
+        # Fill the window, retransmissions first
+        window = max(int(self.window_control.window), 1)
+        while len(self._in_flight) < window:
+            if self._retx_queue:
+                seg_no = self._retx_queue.popleft()
+                self.retransmissions += 1
+            elif self.bounded_reorder and self._next_seg >= self._next_deliver + window:
+                break
+            elif self._next_seg == 0 or (self.received > 0 and (self.final_segment is None
+                                                                or self._next_seg <= self.final_segment)):
+                # Only segment 0 is requested until a Data tells the FinalBlockId
+                seg_no = self._next_seg
+                self._next_seg += 1
+            else:
+                break
+            self._in_flight[aio.create_task(self._fetch(seg_no))] = seg_no
+            self.interests_sent += 1
+
+    def _on_data(self, seg_no: int, content: Optional[BinaryStr], context):
+        self._on_segment(seg_no, content, context, self._received)
+        if context.get('congestion_mark') and not self.ignore_congestion_marks:
+            self.congestion_marks += 1
+            if seg_no >= self._recovery_point:
+                self._recovery_point = self._decrease_window(self._next_seg)
+        else:
+            self.window_control.on_data()
+
+    def _on_error(self, seg_no: int, err: Exception):
+        if isinstance(err, InterestTimeout):
+            self.timeouts += 1
+            congested = True
+            if seg_no >= self._recovery_point:
+                self.rtt_estimator.backoff()
+        else:
+            self.nacks += 1
+            if err.reason == NackReason.CONGESTION:
+                congested = True
+            elif err.reason == NackReason.DUPLICATE:
+                congested = False
+            else:
+                raise err
+        if congested and seg_no >= self._recovery_point:
+            self._recovery_point = self._decrease_window(self._next_seg)
+        self._retries[seg_no] = self._retries.get(seg_no, 0) + 1
+        if self._retries[seg_no] > self.max_retries:
+            raise err
+        self._retx_queue.append(seg_no)
+
+    def _drop_beyond_final(self):
+        # Cancel Interests beyond the final segment
+        if self.final_segment is None:
+            return
+        for task, seg_no in list(self._in_flight.items()):
+            if seg_no > self.final_segment:
+                task.cancel()
+                del self._in_flight[task]
+        if self._retx_queue:
+            self._retx_queue = deque(s for s in self._retx_queue if s <= self.final_segment)
+
+    def _on_segment(self, seg_no: int, content: Optional[BinaryStr], context, received: dict):
+        self.received += 1
+        self.bytes_received += len(context['raw_packet'])
+        final_block_id = context['meta_info'].final_block_id
+        if final_block_id is not None and self.final_segment is None:
+            try:
+                self.final_segment = Component.to_number(final_block_id)
+            except (ValueError, IndexError):
+                self.logger.warning(f'Invalid FinalBlockId {bytes(final_block_id).hex()}, ignored')
+        received[seg_no] = content
+
+    def _decrease_window(self, next_seg: int) -> int:
+        self.window_control.on_congestion()
+        self.window_decreases += 1
+        return next_seg
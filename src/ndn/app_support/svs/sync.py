@@ -58,11 +58,11 @@ class SvsInst:
     base_prefix: enc.FormalName
     on_missing_data: OnMissingDataFunc
 
-    local_sv: dict[bytes, int]
-    agg_sv: dict[bytes, int]
+    local_sv: dict[enc.Name.FrozenName, int]
+    agg_sv: dict[enc.Name.FrozenName, int]
     state: SvsState
     self_seq: int
-    self_node_id: bytes
+    self_node_id: enc.Name.FrozenName
     running: bool
     ndn_app: app.NDNApp | None
 
@@ -78,7 +78,7 @@ class SvsInst:
                  sync_interval: float = 30, suppression_interval: float = 0.2,
                  last_used_seq_num: int = 0):
         self.base_prefix = enc.Name.normalize(base_prefix)
-        self.self_node_id = enc.Name.to_bytes(self_node_id)
+        self.self_node_id = enc.Name.FrozenName(self_node_id)
         self.sync_interval = sync_interval
         self.suppression_interval = suppression_interval
         self.on_missing_data = on_missing_data
@@ -123,7 +123,7 @@ class SvsInst:
         for rsv in remote_sv:
             if not rsv.node_id:
                 continue
-            rsv_id = enc.Name.to_bytes(rsv.node_id)
+            rsv_id = enc.Name.FrozenName(rsv.node_id)
             rsv_seq = rsv.seq_no
             if rsv_id == self.self_node_id and rsv_seq > self.self_seq:
                 self.logger.error('Remote side has more local data for local node.')
@@ -162,7 +162,7 @@ class SvsInst:
         if need_fetch:
             self.on_missing_data(self)
 
-    def aggregate(self, rsv_dict: dict[bytes, int]):
+    def aggregate(self, rsv_dict: dict[enc.Name.FrozenName, int]):
         for rsv_id, rsv_seq in rsv_dict.items():
             asv_seq = self.local_sv.get(rsv_id, 0)
             self.agg_sv[rsv_id] = max(asv_seq, rsv_seq)
@@ -200,7 +200,8 @@ class SvsInst:
         sv_pkt.val.entries = []
         for lsv_id, lsv_seq in self.local_sv.items():
             cur = StateVecEntry()
-            cur.node_id = enc.Name.from_bytes(lsv_id)
+            # The encoded node ID is reused without decoding it
+            cur.node_id = lsv_id
             cur.seq_no = lsv_seq
             sv_pkt.val.entries.append(cur)
         sync_name = self.base_prefix + [sv_pkt.encode()]
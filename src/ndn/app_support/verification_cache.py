@@ -0,0 +1,99 @@
+# -----------------------------------------------------------------------------
+# Copyright (C) 2019-2022 The python-ndn authors
+#
+# This file is part of python-ndn.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+import time
+from collections import OrderedDict
+from typing import Optional, Any
+from ..types import ValidResult
+
+
+class VerificationCache:
+    """
+    A bounded cache of validation results of Data packets, keyed by the implicit SHA-256 digest of
+    the packet and the validator.
+    An identical packet validated by the same validator again gets the cached result without verifying
+    its signature.
+
+    Only PASS, ALLOW_BYPASS and FAIL are cached, since the other results may change if validated again.
+    Validators are compared by equality, so a validator created for every Interest,
+    like a lambda or a closure, never hits the cache.
+
+    :ivar capacity: the maximum number of results.
+    :vartype capacity: int
+    :ivar ttl: the time in seconds a result is kept.
+    :vartype ttl: float
+    :ivar hits: the number of lookups returning a result.
+    :vartype hits: int
+    :ivar misses: the number of lookups returning nothing.
+    :vartype misses: int
+    """
+    CACHEABLE = frozenset((ValidResult.PASS, ValidResult.ALLOW_BYPASS, ValidResult.FAIL))
+
+    capacity: int
+    ttl: float
+    hits: int
+    misses: int
+    _entries: OrderedDict[tuple[bytes, Any], tuple[float, ValidResult]]
+
+    def __init__(self, capacity: int = 4096, ttl: float = 60.0):
+        self.capacity = capacity
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, digest: bytes, validator: Any) -> Optional[ValidResult]:
+        """
+        Look up the validation result of a Data packet.
+
+        :param digest: the implicit SHA-256 digest of the Data packet.
+        :param validator: the validator.
+        :return: the cached result, or ``None`` if there is none or it has expired.
+        """
+        key = (digest, validator)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, digest: bytes, validator: Any, result: ValidResult):
+        """
+        Store the validation result of a Data packet.
+        Results other than PASS, ALLOW_BYPASS and FAIL are ignored.
+
+        :param digest: the implicit SHA-256 digest of the Data packet.
+        :param validator: the validator.
+        :param result: the result given by the validator.
+        """
+        if result not in self.CACHEABLE or self.capacity <= 0:
+            return
+        key = (digest, validator)
+        self._entries[key] = (time.monotonic() + self.ttl, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
@@ -19,8 +19,13 @@ import asyncio as aio
 import typing
 import struct
 import logging
+import time
+import heapq
+import itertools
+from collections import deque, OrderedDict
+from functools import partial
 from hashlib import sha256
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from .transport.face import Face
 from .transport.prefix_registerer import PrefixRegisterer
 from . import security as sec
@@ -30,6 +35,8 @@ from . import types
 from . import utils
 from .encoding import ndnlp_v2 as ndnlp
 from .client_conf import read_client_conf, default_face, default_keychain, default_registerer
+from .app_support.content_store import ContentStore
+from .app_support.verification_cache import VerificationCache
 
 
 DEFAULT_LIFETIME = 4000
@@ -50,14 +57,29 @@ Continuation function for :any:`IntHandler` to respond to an Interest.
     :return: True for success, False upon error.
 """
 
-IntHandler = typing.Callable[[enc.FormalName, typing.Optional[enc.BinaryStr], ReplyFunc, PktContext], None]
+AsyncReplyFunc = typing.Callable[[enc.BinaryStr], typing.Coroutine[any, None, bool]]
+r"""
+Awaitable variant of :any:`ReplyFunc`, given as ``context['async_reply']``.
+It waits until the face is writable before replying,
+so a producer answering a burst of Interests slows down instead of filling the sending buffer.
+
+..  function:: (data: BinaryStr) -> Coroutine[bool]
+
+    :param data: an encoded Data packet.
+    :type data: :any:`BinaryStr`
+    :return: True for success, False upon error.
+"""
+
+IntHandler = typing.Callable[[enc.FormalName, typing.Optional[enc.BinaryStr], ReplyFunc, PktContext],
+                             typing.Optional[typing.Coroutine[any, None, None]]]
 r"""
 Interest handler function associated with a name prefix.
 
 The function should use the provided ``reply`` callback to reply with Data, which can handle PIT
 token properly.
 
-..  function:: (name: FormalName, app_param: Optional[BinaryStr], reply: ReplyFunc, context: PktContext) -> None
+..  function:: (name: FormalName, app_param: Optional[BinaryStr], reply: ReplyFunc, context: PktContext) \
+        -> Optional[Coroutine]
 
     :param name: Interest name.
     :type name: :any:`FormalName`
@@ -69,12 +91,11 @@ token properly.
     :type context: :any:`PktContext`
 
 .. note::
-    Interest handler function must be a normal function instead of an ``async`` one.
-    This is on purpose, because an Interest is supposed to be replied ASAP,
-    even it cannot finish the request in time.
-    To provide some feedback, a better practice is replying with an Application NACK
-    (or some equivalent Data packet saying the operation cannot be finished in time).
-    If you want to use ``await`` in the handler, please use ``asyncio.create_task`` to create a new coroutine.
+    Interest handler function can be either a normal function or an ``async`` one.
+    A normal function is called inline when the Interest arrives, which is the fastest way to reply.
+    An ``async`` function is run until it returns or the deadline of the Interest passes,
+    in which case it is cancelled.
+    To bound the number of Interests handled at a time, attach the handler with an :any:`InterestQueue`.
 """
 
 Validator = typing.Callable[[enc.FormalName, enc.SignaturePtrs, PktContext],
@@ -97,10 +118,196 @@ async def pass_all(_name, _sig, _context):
     return types.ValidResult.PASS
 
 
+OverloadHandler = typing.Callable[[enc.FormalName, enc.InterestParam, ReplyFunc, PktContext], None]
+r"""
+Function called when an Interest is shed because the :any:`InterestQueue` of its route is full.
+It may reply with an application Nack or some other Data telling the consumer to slow down.
+
+..  function:: (name: FormalName, param: InterestParam, reply: ReplyFunc, context: PktContext) -> None
+
+    :param name: Interest name.
+    :type name: :any:`FormalName`
+    :param param: Interest parameters.
+    :type param: :any:`InterestParam`
+    :param reply: continuation function to respond with Data.
+    :type reply: :any:`ReplyFunc`
+    :param context: packet handler context.
+    :type context: :any:`PktContext`
+"""
+
+
+class InterestQueue:
+    """
+    Admission control for the Interests of a route.
+
+    At most ``max_concurrency`` Interests are validated and handled at a time.
+    An Interest is counted until its validator and handler return, so this only limits Interests whose
+    validator suspends, unless the handler is asynchronous.
+    Up to ``max_queue_size`` more Interests wait in a queue, and the rest are shed.
+    Interests whose deadlines have passed are dropped before validation.
+    The time Interests spend waiting is recorded, so that the mean and maximum queueing latency can be reported.
+
+    :ivar max_concurrency: the maximum number of Interests processed at a time.
+    :vartype max_concurrency: int
+    :ivar max_queue_size: the maximum number of waiting Interests.
+    :vartype max_queue_size: int
+    :ivar prioritize: if ``True``, waiting Interests are processed in the order of their deadlines.
+        Otherwise, in the order of arrival.
+    :vartype prioritize: bool
+    :ivar on_overload: called with each shed Interest.
+    :vartype on_overload: Optional[:any:`OverloadHandler`]
+    :ivar active: the number of Interests being processed.
+    :vartype active: int
+    :ivar admitted: the number of Interests passed to the validator.
+    :vartype admitted: int
+    :ivar shed: the number of Interests dropped because the queue was full.
+    :vartype shed: int
+    :ivar expired: the number of Interests dropped because their deadlines had passed.
+    :vartype expired: int
+    :ivar total_wait: the total time in seconds admitted Interests spent in the queue.
+    :vartype total_wait: float
+    :ivar max_wait: the longest time in seconds an admitted Interest spent in the queue.
+    :vartype max_wait: float
+    """
+    max_concurrency: int
+    max_queue_size: int
+    prioritize: bool
+    on_overload: typing.Optional[OverloadHandler]
+    active: int
+    admitted: int
+    shed: int
+    expired: int
+    total_wait: float
+    max_wait: float
+
+    def __init__(self, max_concurrency: int = 64, max_queue_size: int = 1024, prioritize: bool = False,
+                 on_overload: typing.Optional[OverloadHandler] = None):
+        self.max_concurrency = max_concurrency
+        self.max_queue_size = max_queue_size
+        self.prioritize = prioritize
+        self.on_overload = on_overload
+        self.active = 0
+        self.admitted = 0
+        self.shed = 0
+        self.expired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._queue = [] if prioritize else deque()
+        self._counter = itertools.count()
+        self._pumping = False
+
+    def __len__(self):
+        return len(self._queue)
+
+    @property
+    def mean_wait(self) -> float:
+        """
+        The mean time in seconds admitted Interests spent in the queue.
+        """
+        return self.total_wait / self.admitted if self.admitted else 0.0
+
+    def submit(self, deadline: int, run: typing.Callable[[], typing.Optional[aio.Task]],
+               shed: typing.Optional[typing.Callable[[], None]] = None):
+        """
+        Submit an Interest.
+
+        :param deadline: the deadline of the Interest, as a :any:`timestamp` in milliseconds.
+        :param run: the function starting to process the Interest,
+            returning the Task processing it or ``None`` if it is finished already.
+        :param shed: the function called if the Interest is shed.
+        """
+        if deadline < utils.timestamp():
+            self.expired += 1
+            return
+        if self.active < self.max_concurrency and not self._queue:
+            self._start(run)
+            return
+        if len(self._queue) >= self.max_queue_size:
+            self.shed += 1
+            if shed is not None:
+                shed()
+            return
+        item = (deadline, next(self._counter), time.monotonic(), run)
+        if self.prioritize:
+            heapq.heappush(self._queue, item)
+        else:
+            self._queue.append(item)
+        self._pump()
+
+    def _start(self, run: typing.Callable[[], typing.Optional[aio.Task]]):
+        self.admitted += 1
+        self.active += 1
+        task = run()
+        if task is None:
+            self.active -= 1
+        else:
+            task.add_done_callback(self._on_done)
+
+    def _on_done(self, _task: aio.Task):
+        self.active -= 1
+        self._pump()
+
+    def _pump(self):
+        if self._pumping:
+            return
+        self._pumping = True
+        try:
+            while self.active < self.max_concurrency and self._queue:
+                if self.prioritize:
+                    deadline, _, enqueued, run = heapq.heappop(self._queue)
+                else:
+                    deadline, _, enqueued, run = self._queue.popleft()
+                if deadline < utils.timestamp():
+                    self.expired += 1
+                    continue
+                wait = time.monotonic() - enqueued
+                self.total_wait += wait
+                if wait > self.max_wait:
+                    self.max_wait = wait
+                self._start(run)
+        finally:
+            self._pumping = False
+
+
+@dataclass
+class RetxPolicy:
+    """
+    Retransmission of an Interest expressed by :meth:`NDNApp.express` before its lifetime expires.
+
+    The Interest is retransmitted with a fresh nonce if no Data arrives within the RTO given by
+    the :any:`RttEstimator` of its prefix, or immediately after a Nack.
+    The RTO is multiplied by ``backoff`` after every timeout.
+    Earlier transmissions are not withdrawn, so a late Data still satisfies them until the lifetime expires.
+
+    :ivar max_retries: the maximum number of retransmissions.
+    :vartype max_retries: int
+    :ivar backoff: the factor multiplied to the RTO after a timeout.
+    :vartype backoff: float
+    :ivar rtt_prefix: the prefix whose RTT estimator is used.
+        ``None`` means the Interest name without the last component.
+    :vartype rtt_prefix: Optional[:any:`NonStrictName`]
+    """
+    max_retries: int = 3
+    backoff: float = 2.0
+    rtt_prefix: typing.Optional[enc.NonStrictName] = None
+
+
 @dataclass
 class PrefixTreeNode:
     callback: IntHandler = None
     validator: typing.Optional[Validator] = None
+    queue: typing.Optional[InterestQueue] = None
+
+
+def _lazy_sha256(wire: enc.BinaryStr) -> typing.Callable[[], bytes]:
+    digest = None
+
+    def get() -> bytes:
+        nonlocal digest
+        if digest is None:
+            digest = sha256(wire).digest()
+        return digest
+    return get
 
 
 @dataclass
@@ -112,20 +319,32 @@ class PendingIntEntry:
     validator: Validator
     implicit_sha256: enc.BinaryStr = b''
     task: typing.Optional[aio.Task] = None
+    forwarding_hint: typing.Optional[list[enc.FormalName]] = None
+    pit_token: typing.Optional[bytes] = None
 
-    async def satisfy(self, data: types.DataTuple):
+    async def satisfy(self, data: types.DataTuple, cache: typing.Optional[VerificationCache] = None,
+                      data_sha256: typing.Optional[typing.Callable[[], bytes]] = None,
+                      congestion_mark: typing.Optional[int] = None):
         name, meta_info, content, sig, raw_packet = data
         pkt_context = {
             'meta_info': meta_info,
             'sig_ptrs': sig,
             'raw_packet': raw_packet,
             'deadline': self.deadline,
+            'congestion_mark': congestion_mark,
         }
         if self.validator is not None:
-            try:
-                valid = await self.validator(name, sig, pkt_context)
-            except (aio.CancelledError, aio.TimeoutError):
-                valid = ValidResult.TIMEOUT
+            valid = None
+            if cache is not None:
+                digest = data_sha256() if data_sha256 is not None else sha256(raw_packet).digest()
+                valid = cache.get(digest, self.validator)
+            if valid is None:
+                try:
+                    valid = await self.validator(name, sig, pkt_context)
+                except (aio.CancelledError, aio.TimeoutError):
+                    valid = ValidResult.TIMEOUT
+                if cache is not None:
+                    cache.put(digest, self.validator, valid)
         else:
             valid = ValidResult.FAIL
         if self.future.cancelled() or self.future.done():
@@ -141,59 +360,192 @@ class PendingIntEntry:
 
 
 class InterestTreeNode:
-    pending_list: list[PendingIntEntry]
+    """
+    The Interests with the same name and CanBePrefix, keyed by their futures.
 
-    def __init__(self):
-        self.pending_list = []
+    :ivar name: the name of the Interests, without implicit digest.
+    :ivar can_be_prefix: the CanBePrefix of the Interests.
+    """
+    name: typing.Optional[enc.FormalName]
+    can_be_prefix: bool
+    pending: dict[aio.Future, PendingIntEntry]
+
+    def __init__(self, name: typing.Optional[enc.FormalName] = None, can_be_prefix: bool = False):
+        self.name = name
+        self.can_be_prefix = can_be_prefix
+        self.pending = {}
 
     def append_interest(self, future: aio.Future, deadline: int, param: enc.InterestParam,
-                        validator: Validator, implicit_sha256: enc.BinaryStr):
-        self.pending_list.append(
-            PendingIntEntry(future, deadline, param.can_be_prefix, param.must_be_fresh, validator, implicit_sha256))
+                        validator: Validator, implicit_sha256: enc.BinaryStr) -> PendingIntEntry:
+        entry = PendingIntEntry(future, deadline, param.can_be_prefix, param.must_be_fresh, validator,
+                                implicit_sha256, forwarding_hint=param.forwarding_hint)
+        self.pending[future] = entry
+        return entry
 
     def nack_interest(self, nack_reason: int) -> bool:
-        for entry in self.pending_list:
-            entry.future.set_exception(types.InterestNack(nack_reason))
+        for entry in self.pending.values():
+            if not entry.future.done():
+                entry.future.set_exception(types.InterestNack(nack_reason))
+        self.pending = {}
         return True
 
-    def satisfy(self, data: types.DataTuple, is_prefix: bool) -> bool:
-        unsatisfied_entries = []
-        raw_packet = data[4]
-        for entry in self.pending_list:
+    def satisfy(self, data: types.DataTuple, is_prefix: bool,
+                dispatch: typing.Callable[[typing.Coroutine], typing.Optional[aio.Task]] = utils.run_eagerly,
+                cache: typing.Optional[VerificationCache] = None,
+                data_sha256: typing.Optional[typing.Callable[[], bytes]] = None,
+                congestion_mark: typing.Optional[int] = None) -> bool:
+        if data_sha256 is None:
+            data_sha256 = _lazy_sha256(data[4])
+        satisfied = []
+        for future, entry in self.pending.items():
             if entry.can_be_prefix or not is_prefix:
                 if len(entry.implicit_sha256) > 0:
-                    data_sha256 = sha256(raw_packet).digest()
-                    passed = data_sha256 == entry.implicit_sha256
+                    passed = data_sha256() == entry.implicit_sha256
                 else:
                     passed = True
             else:
                 passed = False
             if passed:
-                # Try to validate the packet
-                aio.create_task(entry.satisfy(data))
-            else:
-                unsatisfied_entries.append(entry)
-        if unsatisfied_entries:
-            self.pending_list = unsatisfied_entries
-            return False
-        else:
-            return True
-
-    def timeout(self, future: aio.Future):
+                satisfied.append(future)
+        for future in satisfied:
+            entry = self.pending.pop(future)
+            # Try to validate the packet. A Task is only created if the validator suspends
+            entry.task = dispatch(entry.satisfy(data, cache, data_sha256, congestion_mark))
+        return not self.pending
+
+    def timeout(self, future: aio.Future) -> bool:
         # Exception is raised by outside code.
-        for ele in self.pending_list:
-            if ele.future is future and ele.task is not None:
-                ele.task.cancel()
-        self.pending_list = [ele for ele in self.pending_list if ele.future is not future]
-        return not self.pending_list
+        entry = self.pending.pop(future, None)
+        if entry is not None and entry.task is not None:
+            entry.task.cancel()
+        return not self.pending
 
     def cancel(self):
-        for entry in self.pending_list:
+        for entry in self.pending.values():
             entry.future.cancel()
             if entry.task is not None:
                 entry.task.cancel()
 
 
+class PendingInterestTable:
+    """
+    The table of expressed Interests waiting for Data.
+
+    Interests with CanBePrefix=False are kept in a hash table keyed by the encoded name,
+    so matching a Data against them takes a single lookup.
+    Only Interests with CanBePrefix=True are kept in a name trie,
+    which is not walked at all if there is no such Interest.
+    Interests with an implicit digest are stored under the name without the digest component.
+    """
+    _exact: dict[bytes, InterestTreeNode]
+    _prefix: name_tree.NameTrie
+
+    def __init__(self):
+        self._exact = {}
+        self._prefix = name_tree.NameTrie()
+
+    @staticmethod
+    def _key(name: enc.FormalName) -> bytes:
+        return b''.join(name)
+
+    def setdefault(self, name: enc.FormalName, can_be_prefix: bool) -> InterestTreeNode:
+        """
+        Get the node for Interests with the given name and CanBePrefix, creating it if absent.
+
+        :param name: the name without implicit digest.
+        :param can_be_prefix: the CanBePrefix of the Interest.
+        :return: the node.
+        """
+        if can_be_prefix:
+            node = self._prefix.get(name)
+            if node is None:
+                node = InterestTreeNode(name, True)
+                self._prefix[name] = node
+            return node
+        key = self._key(name)
+        node = self._exact.get(key)
+        if node is None:
+            node = InterestTreeNode(name, False)
+            self._exact[key] = node
+        return node
+
+    def get(self, name: enc.FormalName, can_be_prefix: bool) -> typing.Optional[InterestTreeNode]:
+        """
+        Get the node for Interests with the given name and CanBePrefix.
+
+        :param name: the name without implicit digest.
+        :param can_be_prefix: the CanBePrefix of the Interest.
+        :return: the node, or ``None`` if absent.
+        """
+        if can_be_prefix:
+            return self._prefix.get(name) if self._prefix else None
+        return self._exact.get(self._key(name))
+
+    def remove(self, node: InterestTreeNode):
+        """
+        Remove a node if it is still in the table.
+
+        :param node: the node.
+        """
+        if node.can_be_prefix:
+            if self._prefix.get(node.name) is node:
+                del self._prefix[node.name]
+        else:
+            key = self._key(node.name)
+            if self._exact.get(key) is node:
+                del self._exact[key]
+
+    def match(self, name: enc.FormalName) -> list[tuple[InterestTreeNode, bool]]:
+        """
+        Find the nodes that may be satisfied by a Data.
+
+        :param name: the Data name.
+        :return: a list of (node, is_prefix), where ``is_prefix`` tells whether the node's name is
+            a proper prefix of the Data name.
+        """
+        ret = []
+        node = self._exact.get(self._key(name))
+        if node is not None:
+            ret.append((node, False))
+        if self._prefix:
+            for prefix, node in self._prefix.prefixes(name):
+                ret.append((node, len(prefix) != len(name)))
+        return ret
+
+    def find(self, name: enc.FormalName) -> list[InterestTreeNode]:
+        """
+        Find the nodes of Interests with exactly the given name, e.g. when a Nack is received.
+
+        :param name: the Interest name.
+        :return: a list of nodes.
+        """
+        if name and enc.Component.get_type(name[-1]) == enc.Component.TYPE_IMPLICIT_SHA256:
+            name = name[:-1]
+        ret = []
+        node = self._exact.get(self._key(name))
+        if node is not None:
+            ret.append(node)
+        if self._prefix:
+            node = self._prefix.get(name)
+            if node is not None:
+                ret.append(node)
+        return ret
+
+    def nodes(self) -> typing.Iterator[InterestTreeNode]:
+        """
+        Iterate over all nodes.
+        """
+        yield from self._exact.values()
+        yield from self._prefix.itervalues()
+
+    def clear(self):
+        self._exact.clear()
+        self._prefix.clear()
+
+    def __len__(self):
+        return len(self._exact) + sum(1 for _ in self._prefix.itervalues())
+
+
 class NDNApp:
     """
     An NDN application.
@@ -201,15 +553,57 @@ class NDNApp:
     # PIT and FIB here are not real PIT/FIB, but a data structure that handles expressed Interests (for PIT)
     # and registered handlers & routes (for FIB). Since they share the functionality with real PIT and FIB,
     # I borrow the word to have a shorter variable name.
-    _pit: name_tree.NameTrie = None
-    _fib: name_tree.NameTrie = None
+    _pit: PendingInterestTable = None
+    _int_timeouts: utils.DeadlineQueue = None
+    _handler_deadlines: utils.DeadlineQueue = None
+    _fib: name_tree.NameFib = None
     face: Face = None
     registerer: PrefixRegisterer = None
     _autoreg_routes: list[enc.FormalName]
+    _order_tail: typing.Optional[aio.Task] = None
+    keep_order: bool = False
+    aggregate: bool = False
+    use_pit_token: bool = False
+    content_store: typing.Optional[ContentStore] = None
+    verification_cache: typing.Optional[VerificationCache] = None
+    _pit_tokens: dict[bytes, InterestTreeNode]
+    _next_pit_token: int = 0
+    _rtt_estimators: OrderedDict[bytes, utils.RttEstimator]
     logger: logging.Logger
+    MAX_RTT_ESTIMATORS = 1024
 
-    def __init__(self, face=None, client_conf=None, registerer=None):
+    def __init__(self, face=None, client_conf=None, registerer=None, keep_order=False, aggregate=False,
+                 use_pit_token=False, content_store: typing.Optional[ContentStore] = None,
+                 verification_cache: typing.Optional[VerificationCache] = None):
+        """
+        :param face: the face to NFD. Use the one specified in ``client_conf`` if ``None``.
+        :param client_conf: the client configuration.
+        :param registerer: the prefix registerer. Use the default one if ``None``.
+        :param keep_order: if ``True``, received packets are processed in order of arrival,
+            i.e. the handler of a packet is not called until the handlers of all previous packets finish,
+            even if some validator suspends. Otherwise, a packet whose validator suspends does not block others.
+        :param aggregate: if ``True``, :meth:`express` does not send an unsigned Interest if there is
+            a pending one with the same name, CanBePrefix, MustBeFresh and ForwardingHint.
+            The caller waits for the Data of the pending Interest instead, and validates it with its own validator.
+            It times out no later than the pending Interest.
+        :param use_pit_token: if ``True``, every expressed Interest is sent in an LpPacket with a PIT token.
+            A Data or Nack carrying the token back is matched to the Interest without looking up its name.
+            The forwarder must support PIT tokens, which NFD does on local faces.
+        :param content_store: if given, every Data sent by Interest handlers is stored in it,
+            and Interests that it can satisfy are answered without calling the handler.
+        :param verification_cache: if given, the results of validating received Data are cached in it,
+            so that fetching an identical Data again with the same validator does not verify the signature.
+            In that case, anything the validator puts into the context is not available.
+        """
         self.logger = logging.getLogger(__name__)
+        self.keep_order = keep_order
+        self.aggregate = aggregate
+        self.use_pit_token = use_pit_token
+        self.content_store = content_store
+        self.verification_cache = verification_cache
+        self._pit_tokens = {}
+        self._next_pit_token = utils.gen_nonce()
+        self._rtt_estimators = OrderedDict()
         config = client_conf if client_conf else {}
         if not face:
             if 'transport' not in config:
@@ -224,8 +618,10 @@ class NDNApp:
             self.registerer = default_registerer()
         self.registerer.set_app(app=self)
         self.face.callback = self._receive
-        self._pit = name_tree.NameTrie()
-        self._fib = name_tree.NameTrie()
+        self._pit = PendingInterestTable()
+        self._int_timeouts = utils.DeadlineQueue(self._on_interest_timeout, resolution=0.01)
+        self._handler_deadlines = utils.DeadlineQueue(self._on_handler_deadline, resolution=0.01)
+        self._fib = name_tree.NameFib()
         self._autoreg_routes = []
 
     @staticmethod
@@ -236,7 +632,7 @@ class NDNApp:
             config = read_client_conf() | client_conf
         return default_keychain(config['pib'], config['tpm'])
 
-    async def _receive(self, typ: int, data: enc.BinaryStr):
+    def _receive(self, typ: int, data: enc.BinaryStr):
         """
         Pipeline when a packet is received.
 
@@ -256,26 +652,29 @@ class NDNApp:
             else:
                 nack_reason = None
             pit_token = lp_pkt.pit_token
+            congestion_mark = lp_pkt.congestion_mark
             data = lp_pkt.fragment
             typ, _ = enc.parse_tl_num(data)
         else:
             nack_reason = None
             pit_token = None
+            congestion_mark = None
 
         if nack_reason is not None:
             try:
-                name, _, _, _ = enc.parse_interest(data, with_tl=True)
-            except (enc.DecodeError, TypeError, ValueError, struct.error):
+                name = enc.InterestView(data, with_tl=True).name
+            except (enc.DecodeError, TypeError, ValueError, IndexError, struct.error):
                 self.logger.warning('Unable to decode the fragment of LpPacket')
                 return
             if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug('NetworkNack received %s, reason=%s' % (enc.Name.to_str(name), nack_reason))
-            self._on_nack(name, nack_reason)
+            self._on_nack(name, nack_reason, pit_token)
         else:
             if typ == enc.TypeNumber.INTEREST:
                 try:
-                    name, param, app_param, sig = enc.parse_interest(data, with_tl=True)
-                except (enc.DecodeError, TypeError, ValueError, struct.error):
+                    view = enc.InterestView(data, with_tl=True)
+                    name, param, app_param, sig = view.name, view.int_param, view.app_param, view.sig_ptrs
+                except (enc.DecodeError, TypeError, ValueError, IndexError, struct.error):
                     self.logger.warning('Unable to decode received packet')
                     return
                 if self.logger.isEnabledFor(logging.DEBUG):
@@ -284,16 +683,17 @@ class NDNApp:
                             f'Interest received {enc.Name.to_str(name)} w/ token={bytes(pit_token).hex()}')
                     else:
                         self.logger.debug(f'Interest received {enc.Name.to_str(name)}')
-                await self._on_interest(name, pit_token, param, app_param, sig, raw_packet=data)
+                self._on_interest(name, pit_token, param, app_param, sig, raw_packet=data)
             elif typ == enc.TypeNumber.DATA:
                 try:
-                    name, meta_info, content, sig = enc.parse_data(data, with_tl=True)
-                except (enc.DecodeError, TypeError, ValueError, struct.error):
+                    view = enc.DataView(data, with_tl=True)
+                    name = view.name
+                except (enc.DecodeError, TypeError, ValueError, IndexError, struct.error):
                     self.logger.warning('Unable to decode received packet')
                     return
                 if self.logger.isEnabledFor(logging.DEBUG):
                     self.logger.debug(f'Data received {enc.Name.to_str(name)}')
-                await self._on_data(name, meta_info, content, sig, raw_packet=data)
+                self._on_data(view, raw_packet=data, pit_token=pit_token, congestion_mark=congestion_mark)
             else:
                 self.logger.warning('Unable to decode received packet')
 
@@ -325,9 +725,41 @@ class NDNApp:
             meta_info = enc.MetaInfo.from_dict(kwargs)
         return enc.make_data(name, meta_info, content, signer=signer)
 
-    async def _on_interest(self, name: enc.FormalName, pit_token: typing.Optional[enc.BinaryStr],
-                           param: enc.InterestParam, app_param: typing.Optional[enc.BinaryStr], sig: enc.SignaturePtrs,
-                           raw_packet: enc.BinaryStr):
+    def _dispatch(self, coro: typing.Coroutine) -> typing.Optional[aio.Task]:
+        """
+        Process a received packet with a coroutine in an eagerly started Task,
+        which does not need to be scheduled unless the coroutine suspends.
+
+        :param coro: the coroutine processing the packet.
+        :return: the Task running the coroutine, or ``None`` if the coroutine finished already.
+        """
+        if self.keep_order and self._order_tail is not None and not self._order_tail.done():
+            task = aio.create_task(self._run_after(self._order_tail, coro))
+        else:
+            try:
+                task = utils.run_eagerly(coro)
+            except Exception:
+                self.logger.exception('Unhandled exception when processing a received packet')
+                return None
+        if self.keep_order and task is not None:
+            self._order_tail = task
+        return task
+
+    @staticmethod
+    async def _run_after(previous: aio.Task, coro: typing.Coroutine):
+        try:
+            # Wait without propagating the exception of the previous one
+            await aio.wait([previous])
+        except aio.CancelledError:
+            coro.close()
+            raise
+        return await coro
+
+    def _on_interest(self, name: enc.FormalName, pit_token: typing.Optional[enc.BinaryStr],
+                     param: enc.InterestParam, app_param: typing.Optional[enc.BinaryStr], sig: enc.SignaturePtrs,
+                     raw_packet: enc.BinaryStr):
+        if self._reply_from_content_store(name, pit_token, param, app_param, sig):
+            return
         trie_step = self._fib.longest_prefix(name)
         if not trie_step:
             self.logger.warning('No route: %s' % name)
@@ -336,17 +768,10 @@ class NDNApp:
         if node.callback is None:
             self.logger.warning('No callback: %s' % name)
             return
-        sig_required = app_param is not None or sig.signature_info is not None
-        if sig_required:
-            if not await sec.params_sha256_checker(name, sig):
-                self.logger.warning('Drop malformed Interest: %s' % name)
-                return
 
         # Use context to handle misc parameters
-        if param.lifetime is not None:
-            deadline = utils.timestamp() + param.lifetime
-        else:
-            deadline = utils.timestamp() + DEFAULT_LIFETIME
+        lifetime = param.lifetime if param.lifetime is not None else DEFAULT_LIFETIME
+        deadline = utils.timestamp() + lifetime
         context = {
             'int_param': param,
             'pit_token': pit_token,
@@ -364,25 +789,84 @@ class NDNApp:
                 self._put_raw_packet(data)
             else:
                 self._put_raw_packet_with_pit_token(data, pit_token)
+            # Only Data actually sent is stored
+            if self.content_store is not None and self.content_store.capacity > 0:
+                self.content_store.insert(data)
+            return True
 
-        # In case the validator blocks the pipeline, create a task
-        async def submit_interest():
-            if sig_required:
-                # In v2, to enforce security, validator is required. Also, all interests with app_param are checked.
-                # The validator needs to manually pass it if the application wants to handle unsigned Interests with
-                # app_param.
-                if node.validator is not None:
-                    valid = await node.validator(name, sig, context)
-                else:
-                    valid = ValidResult.FAIL
-            else:
-                valid = ValidResult.PASS
-            if valid == ValidResult.PASS or valid == ValidResult.ALLOW_BYPASS:
-                node.callback(name, app_param, reply, context)
-            else:
-                self.logger.warning('Drop unvalidated Interest: %s' % name)
+        async def async_reply(data: enc.BinaryStr) -> bool:
+            await self.face.wait_writable()
+            return reply(data)
+        context['async_reply'] = async_reply
+
+        run = partial(self._run_handler, node, name, app_param, sig, reply, context)
+        if node.queue is None:
+            run()
+        else:
+            shed = None
+            if node.queue.on_overload is not None:
+                shed = partial(node.queue.on_overload, name, param, reply, context)
+            node.queue.submit(deadline, run, shed)
+
+    def _reply_from_content_store(self, name: enc.FormalName, pit_token: typing.Optional[enc.BinaryStr],
+                                  param: enc.InterestParam, app_param: typing.Optional[enc.BinaryStr],
+                                  sig: enc.SignaturePtrs) -> bool:
+        if self.content_store is None or app_param is not None or sig.signature_info is not None:
+            return False
+        data = self.content_store.find(name, bool(param.can_be_prefix), bool(param.must_be_fresh))
+        if data is None:
+            return False
+        if pit_token is None:
+            self._put_raw_packet(data)
+        else:
+            self._put_raw_packet_with_pit_token(data, pit_token)
+        return True
+
+    def _run_handler(self, node: PrefixTreeNode, name: enc.FormalName, app_param: typing.Optional[enc.BinaryStr],
+                     sig: enc.SignaturePtrs, reply: ReplyFunc, context: PktContext) -> typing.Optional[aio.Task]:
+        # Run eagerly until the validator or the handler suspends, in which case the Task is scheduled.
+        # The Task is cancelled at the deadline, which does not move however long the Interest waited in the queue
+        task = self._dispatch(self._process_interest(node, name, app_param, sig, reply, context))
+        if task is not None:
+            remaining = (context['deadline'] - utils.timestamp()) / 1000.0
+            self._handler_deadlines.add(aio.get_running_loop().time() + remaining, task)
+            task.add_done_callback(self._on_handler_done)
+        return task
+
+    async def _process_interest(self, node: PrefixTreeNode, name: enc.FormalName,
+                                app_param: typing.Optional[enc.BinaryStr], sig: enc.SignaturePtrs,
+                                reply: ReplyFunc, context: PktContext):
+        if app_param is not None or sig.signature_info is not None:
+            if not await sec.params_sha256_checker(name, sig):
+                self.logger.warning('Drop malformed Interest: %s' % name)
                 return
-        aio.create_task(submit_interest())
+            # In v2, to enforce security, validator is required. Also, all interests with app_param are checked.
+            # The validator needs to manually pass it if the application wants to handle unsigned Interests with
+            # app_param.
+            if node.validator is not None:
+                valid = await node.validator(name, sig, context)
+            else:
+                valid = ValidResult.FAIL
+        else:
+            valid = ValidResult.PASS
+        if valid == ValidResult.PASS or valid == ValidResult.ALLOW_BYPASS:
+            ret = node.callback(name, app_param, reply, context)
+            if aio.iscoroutine(ret):
+                await ret
+        else:
+            self.logger.warning('Drop unvalidated Interest: %s' % name)
+
+    @staticmethod
+    def _on_handler_deadline(task: aio.Task):
+        if not task.done():
+            task.cancel()
+
+    def _on_handler_done(self, task: aio.Task):
+        if task.cancelled():
+            self.logger.debug('Interest handling is cancelled at the deadline')
+        elif task.exception() is not None:
+            self.logger.error('Unhandled exception when processing a received packet',
+                              exc_info=task.exception())
 
     def _put_raw_packet(self, data: enc.BinaryStr):
         r"""
@@ -407,21 +891,15 @@ class NDNApp:
         :type pit_token: :any:`BinaryStr`
         :raises NetworkError: the face to NFD is down.
         """
-        if not self.face.running:
-            raise types.NetworkError('cannot send packet before connected')
-        pkt = ndnlp.LpPacket()
-        pkt.lp_packet = ndnlp.LpPacketValue()
-        pkt.lp_packet.pit_token = pit_token
-        pkt.lp_packet.fragment = data
-        wire = pkt.encode()
-        self.face.send(wire)
+        self._put_raw_packet_with_pit_token_nocopy(data, pit_token)
 
     def _put_raw_packet_with_pit_token_nocopy(self, data: enc.BinaryStr, pit_token: enc.BinaryStr):
         r"""
         Wrap a raw Data packet with PIT Token and send.
         Used to reply an Interest with PIT Token provided.
 
-        This function is reserved as a backup because it assumes the face to be stream face.
+        The LpPacket header and the Data are handed to the face as two buffers, so the Data is not copied
+        unless the face needs to.
 
         :param data: TLV encoded Data packet.
         :type data: :any:`BinaryStr`
@@ -429,16 +907,20 @@ class NDNApp:
         :type pit_token: :any:`BinaryStr`
         :raises NetworkError: the face to NFD is down.
         """
-        # To avoid extra copy, we manually encode the header and send it separately from Data body
-        # The format is: LP-T LP-L (PIT-TOKEN-TLV) FRAG-T FRAG-L
         if not self.face.running:
             raise types.NetworkError('cannot send packet before connected')
+        self.face.sendv((self._make_pit_token_header(pit_token, len(data)), data))
+
+    @staticmethod
+    def _make_pit_token_header(pit_token: enc.BinaryStr, frag_l: int) -> bytearray:
+        # To avoid extra copy, we manually encode the header and send it separately from the packet body
+        # The format is: LP-T LP-L (PIT-TOKEN-TLV) FRAG-T FRAG-L
         pt = ndnlp.LpPacketValue()
         pt.pit_token = pit_token
         pt_wire = pt.encode()
-        frag_l = len(data)
-        lp_l = len(pt_wire) + enc.get_tl_num_size(ndnlp.LpTypeNumber.FRAGMENT) + enc.get_tl_num_size(frag_l)
-        wire_l = enc.get_tl_num_size(ndnlp.LpTypeNumber.LP_PACKET) + enc.get_tl_num_size(lp_l) + lp_l
+        lp_l = (len(pt_wire) + enc.get_tl_num_size(ndnlp.LpTypeNumber.FRAGMENT) + enc.get_tl_num_size(frag_l)
+                + frag_l)
+        wire_l = enc.get_tl_num_size(ndnlp.LpTypeNumber.LP_PACKET) + enc.get_tl_num_size(lp_l) + lp_l - frag_l
         wire = bytearray(wire_l)
         pos = 0
         pos += enc.write_tl_num(ndnlp.LpTypeNumber.LP_PACKET, wire, pos)
@@ -447,11 +929,11 @@ class NDNApp:
         pos += len(pt_wire)
         pos += enc.write_tl_num(ndnlp.LpTypeNumber.FRAGMENT, wire, pos)
         pos += enc.write_tl_num(frag_l, wire, pos)
-        self.face.send(wire)
-        self.face.send(data)
+        return wire
 
     def attach_handler(self, name: enc.NonStrictName, handler: IntHandler,
-                       validator: typing.Optional[Validator] = None):
+                       validator: typing.Optional[Validator] = None,
+                       queue: typing.Optional[InterestQueue] = None):
         """
         Attach an Interest handler at a name prefix.
         Incoming Interests under the specified name prefix will be dispatched to the handler.
@@ -463,7 +945,8 @@ class NDNApp:
 
         :param name: name prefix.
         :type name: :any:`NonStrictName`
-        :param handler: Interest handler function.
+        :param handler: Interest handler function. It can be a coroutine function,
+            which is cancelled if it does not finish before the deadline of the Interest.
         :type handler: :any:`IntHandler`
         :param validator: validator for signed Interests.
             Non signed Interests, i.e. those without ApplicationParameters and SignatureInfo, are
@@ -474,6 +957,10 @@ class NDNApp:
             Those failing the validation are dropped silently.
             Those passing the validation are passed to the handler function.
         :type validator: Optional[:any:`Validator`]
+        :param queue: admission control for Interests under this prefix, which also limits
+            the number of coroutine handlers running concurrently.
+            If ``None``, every Interest is processed as soon as it arrives.
+        :type queue: Optional[:any:`InterestQueue`]
         """
         name = enc.Name.normalize(name)
         node = self._fib.setdefault(name, PrefixTreeNode())
@@ -481,6 +968,7 @@ class NDNApp:
             raise ValueError(f'Duplicated handler attachment: {enc.Name.to_str(name)}')
         node.callback = handler
         node.validator = validator
+        node.queue = queue
 
     def detach_handler(self, name: enc.NonStrictName):
         """
@@ -537,61 +1025,118 @@ class NDNApp:
             return None
         if validator is None:
             raise ValueError('Data Validator must not be None when expressing an Interest.')
-        final_name = enc.Name.normalize(final_name)
-        future = aio.get_running_loop().create_future()
-        # Handle implicit SHA256
-        if enc.Component.get_type(final_name[-1]) == enc.Component.TYPE_IMPLICIT_SHA256:
-            node_name = final_name[:-1]
-            implicit_sha256 = enc.Component.get_value(final_name[-1])
+        entry = self._add_pending_interest(enc.Name.normalize(final_name), interest_param, validator,
+                                           with_pit_token=self.use_pit_token)
+        if entry.pit_token is not None:
+            self.face.sendv((self._make_pit_token_header(entry.pit_token, len(raw_interest)), raw_interest))
         else:
-            node_name = final_name
-            implicit_sha256 = b''
-        node: InterestTreeNode = self._pit.setdefault(node_name, InterestTreeNode())
-        deadline = utils.timestamp()
-        if interest_param.lifetime is not None:
-            deadline += interest_param.lifetime
+            self.face.send(raw_interest)
+        return self._wait_for_data(entry.future)
+
+    @staticmethod
+    def _split_implicit_sha256(final_name: enc.FormalName) -> tuple[enc.FormalName, enc.BinaryStr]:
+        if enc.Component.get_type(final_name[-1]) == enc.Component.TYPE_IMPLICIT_SHA256:
+            return final_name[:-1], enc.Component.get_value(final_name[-1])
         else:
-            deadline += DEFAULT_LIFETIME
-        node.append_interest(future, deadline, interest_param, validator, implicit_sha256)
-        self.face.send(raw_interest)
-        return self._wait_for_data(future, deadline, node_name, node)
-
-    async def _wait_for_data(self, future: aio.Future, deadline: int, node_name: enc.FormalName,
-                             node: InterestTreeNode):
-        lifetime = deadline - utils.timestamp()
-        if lifetime <= 0:
-            # This happens if the application sends an Interest, does some calculation, and then fetches the result.
-            # The Interest should be satisfied now. Thus, it should not be considered as an error.
-            lifetime = 100
+            return final_name, b''
+
+    def _add_pending_interest(self, final_name: enc.FormalName, interest_param: enc.InterestParam,
+                              validator: Validator, lifetime: typing.Optional[int] = None,
+                              with_pit_token: bool = False) -> PendingIntEntry:
+        future = aio.get_running_loop().create_future()
+        node_name, implicit_sha256 = self._split_implicit_sha256(final_name)
+        node = self._pit.setdefault(node_name, bool(interest_param.can_be_prefix))
+        if lifetime is None:
+            if interest_param.lifetime is not None:
+                lifetime = interest_param.lifetime
+            else:
+                lifetime = DEFAULT_LIFETIME
+        deadline = utils.timestamp() + lifetime
+        entry = node.append_interest(future, deadline, interest_param, validator, implicit_sha256)
+        if with_pit_token:
+            self._next_pit_token = (self._next_pit_token + 1) & 0xFFFFFFFF
+            entry.pit_token = self._next_pit_token.to_bytes(4, 'big')
+            self._pit_tokens[entry.pit_token] = node
+        # All Interests share one timer. The entry is expired even if the returned coroutine is never awaited.
+        self._int_timeouts.add(aio.get_running_loop().time() + lifetime / 1000.0, (node, entry))
+        return entry
+
+    def _aggregate_lifetime(self, final_name: enc.FormalName, interest_param: enc.InterestParam) -> int:
+        # Return the remaining lifetime of a compatible pending Interest, or 0 if there is none
+        node_name, implicit_sha256 = self._split_implicit_sha256(final_name)
+        node = self._pit.get(node_name, bool(interest_param.can_be_prefix))
+        if node is None:
+            return 0
+        must_be_fresh = bool(interest_param.must_be_fresh)
+        deadline = 0
+        for entry in node.pending.values():
+            if (bool(entry.must_be_fresh) == must_be_fresh and entry.implicit_sha256 == implicit_sha256
+                    and entry.forwarding_hint == interest_param.forwarding_hint and not entry.future.done()):
+                deadline = max(deadline, entry.deadline)
+        return max(deadline - utils.timestamp(), 0)
+
+    def _on_interest_timeout(self, item: tuple[InterestTreeNode, PendingIntEntry]):
+        node, entry = item
+        if entry.pit_token is not None:
+            self._pit_tokens.pop(entry.pit_token, None)
+        if node.timeout(entry.future):
+            self._pit.remove(node)
+        if not entry.future.done():
+            entry.future.set_exception(types.InterestTimeout())
+        if entry.task is not None:
+            # The validator is still running
+            entry.task.cancel()
+
+    @staticmethod
+    async def _wait_for_data(future: aio.Future):
         try:
-            data_name, content, pkt_context = await aio.wait_for(future, timeout=lifetime/1000.0)
-        except aio.TimeoutError:
-            if node.timeout(future):
-                del self._pit[node_name]
-            raise types.InterestTimeout()
+            data_name, content, pkt_context = await future
         except aio.CancelledError:
             raise types.InterestCanceled()
         # ValidationError, InterestNack are passed to the parent caller
         return data_name, content, pkt_context
 
-    async def _on_data(self, name: enc.FormalName, meta_info: enc.MetaInfo,
-                       content: typing.Optional[enc.BinaryStr], sig: enc.SignaturePtrs,
-                       raw_packet: enc.BinaryStr):
-        clean_list = []
-        for prefix, node in self._pit.prefixes(name):
-            if node.satisfy((name, meta_info, content, sig, raw_packet), prefix != name):
-                clean_list.append(prefix)
-        for prefix in clean_list:
-            del self._pit[prefix]
-
-    def _on_nack(self, name: enc.FormalName, nack_reason: int):
+    def _match_pit_token(self, pit_token: typing.Optional[enc.BinaryStr]) -> typing.Optional[InterestTreeNode]:
+        if pit_token is None or not self._pit_tokens:
+            return None
+        node = self._pit_tokens.get(bytes(pit_token))
+        if node is None or not node.pending:
+            # Already satisfied or expired
+            return None
+        return node
+
+    def _on_data(self, view: enc.DataView, raw_packet: enc.BinaryStr,
+                 pit_token: typing.Optional[enc.BinaryStr] = None, congestion_mark: typing.Optional[int] = None):
+        # MetaInfo and SignatureInfo are only decoded if some pending Interest matches the Data
+        name = view.name
+        node = self._match_pit_token(pit_token)
+        if node is not None and enc.Name.is_prefix(node.name, name):
+            # The forwarder has matched the Data to this Interest.
+            # Other Interests in the same node are satisfied as well, since the forwarder may have aggregated them.
+            # A token carried by a Data that cannot match is ignored.
+            matches = [(node, len(node.name) != len(name))]
+        else:
+            matches = self._pit.match(name)
+        if not matches:
+            return
         try:
-            node = self._pit[name]
-        except KeyError:
-            node = None
-        if node:
+            data_tuple = (name, view.meta_info, view.content, view.sig_ptrs, raw_packet)
+        except (enc.DecodeError, TypeError, ValueError, IndexError, struct.error):
+            self.logger.warning('Unable to decode received packet')
+            return
+        # The digest is computed at most once, however many Interests and validators need it
+        data_sha256 = _lazy_sha256(raw_packet)
+        for node, is_prefix in matches:
+            if node.satisfy(data_tuple, is_prefix, self._dispatch, self.verification_cache, data_sha256,
+                            congestion_mark):
+                self._pit.remove(node)
+
+    def _on_nack(self, name: enc.FormalName, nack_reason: int, pit_token: typing.Optional[enc.BinaryStr] = None):
+        node = self._match_pit_token(pit_token)
+        nodes = [node] if node is not None else self._pit.find(name)
+        for node in nodes:
             if node.nack_interest(nack_reason):
-                del self._pit[name]
+                self._pit.remove(node)
 
     def express(self, name: enc.NonStrictName, validator: Validator,
                 app_param: typing.Optional[enc.BinaryStr] = None,
@@ -604,6 +1149,7 @@ class NDNApp:
         The Interest packet is sent immediately and a coroutine used to get the result is returned.
         Awaiting on the returned coroutine will block until the Data is received.
         It then returns the Data name, Data Content value, and :any:`PktContext`.
+        ``context['congestion_mark']`` is the CongestionMark of the LpPacket carrying the Data, or ``None``.
         An exception is raised if NDNApp is unable to retrieve the Data.
 
         :param name: Interest name.
@@ -617,13 +1163,15 @@ class NDNApp:
         :param signer: Signer for Interest signing. This is required if `app_param` is specified.
         :type signer: Optional[:any:`Signer`]
         :param kwargs: arguments for :any:`InterestParam`.
+            Besides, ``retx`` takes a :any:`RetxPolicy` to retransmit the Interest within its lifetime.
         :return: A tuple of (Name, Content, PacketContext) after ``await``.
         :rtype: Coroutine[Any, None, Tuple[:any:`FormalName`, Optional[:any:`BinaryStr`], :any:`PktContext`]]
 
         The following exceptions may be raised by ``express``:
 
         :raises NetworkError: the face to NFD is down before sending this Interest.
-        :raises ValueError: when the signer is missing but app_param presents.
+        :raises ValueError: when the signer is missing but app_param presents,
+            or ``retx`` is given with ``no_response``.
 
         The following exceptions may be raised by the returned coroutine:
 
@@ -636,17 +1184,147 @@ class NDNApp:
             raise types.NetworkError('cannot send packet before connected')
         if app_param is not None and signer is None:
             raise ValueError('An Interest with AppParam is required to be signed.')
+        retx = kwargs.pop('retx', None)
+        if retx is not None:
+            return self._express_with_retx(name, validator, app_param, signer, retx, kwargs)
+        return self._express_once(name, validator, app_param, signer, kwargs, self.aggregate)
+
+    def _express_once(self, name: enc.NonStrictName, validator: Validator,
+                      app_param: typing.Optional[enc.BinaryStr], signer: typing.Optional[enc.Signer],
+                      kwargs: dict, aggregate: bool) -> typing.Coroutine:
         if 'interest_param' in kwargs:
             interest_param = kwargs['interest_param']
         else:
             if 'nonce' not in kwargs:
                 kwargs['nonce'] = utils.gen_nonce()
             interest_param = enc.InterestParam.from_dict(kwargs)
-        interest, final_name = enc.make_interest(name, interest_param, app_param, signer=signer, need_final_name=True)
         no_response = kwargs.get('no_response', False)
+        if aggregate and app_param is None and signer is None and not no_response:
+            final_name = enc.Name.normalize(name)
+            remaining = self._aggregate_lifetime(final_name, interest_param)
+            if remaining > 0:
+                if validator is None:
+                    raise ValueError('Data Validator must not be None when expressing an Interest.')
+                # The caller cannot wait longer than the pending Interest lives
+                lifetime = interest_param.lifetime if interest_param.lifetime is not None else DEFAULT_LIFETIME
+                return self._wait_for_data(self._add_pending_interest(
+                    final_name, interest_param, validator, min(lifetime, remaining)).future)
+        interest, final_name = enc.make_interest(name, interest_param, app_param, signer=signer, need_final_name=True)
         return self.express_raw_interest(final_name, interest_param, interest, validator, no_response)
 
-    def route(self, name: enc.NonStrictName, validator: typing.Optional[Validator] = None):
+    def rtt_estimator(self, prefix: enc.NonStrictName) -> utils.RttEstimator:
+        """
+        Get the RTT estimator of a name prefix, which is created on first use.
+        Only the estimators of the ``MAX_RTT_ESTIMATORS`` most recently used prefixes are kept.
+
+        :param prefix: the name prefix.
+        :return: the RTT estimator.
+        """
+        key = b''.join(enc.Name.normalize(prefix))
+        estimator = self._rtt_estimators.get(key)
+        if estimator is None:
+            estimator = utils.RttEstimator()
+            self._rtt_estimators[key] = estimator
+            if len(self._rtt_estimators) > self.MAX_RTT_ESTIMATORS:
+                self._rtt_estimators.popitem(last=False)
+        else:
+            self._rtt_estimators.move_to_end(key)
+        return estimator
+
+    def _express_with_retx(self, name: enc.NonStrictName, validator: Validator,
+                           app_param: typing.Optional[enc.BinaryStr], signer: typing.Optional[enc.Signer],
+                           retx: RetxPolicy, kwargs: dict) -> typing.Coroutine:
+        if kwargs.get('no_response', False):
+            raise ValueError('An Interest without response cannot be retransmitted.')
+        if 'interest_param' in kwargs:
+            lifetime = kwargs['interest_param'].lifetime
+        else:
+            lifetime = kwargs.get('lifetime')
+        if lifetime is None:
+            lifetime = DEFAULT_LIFETIME
+        name = enc.Name.normalize(name)
+        estimator = self.rtt_estimator(retx.rtt_prefix if retx.rtt_prefix is not None else name[:-1])
+        loop = aio.get_running_loop()
+        deadline = loop.time() + lifetime / 1000.0
+
+        def send(aggregate: bool = False) -> aio.Future:
+            # Every transmission has a fresh nonce and lives until the original deadline.
+            # Retransmissions are never aggregated, otherwise they would join the pending first transmission.
+            if not self.face.running:
+                raise types.NetworkError('cannot send packet before connected')
+            remaining = max(int((deadline - loop.time()) * 1000), 1)
+            if 'interest_param' in kwargs:
+                param = replace(kwargs['interest_param'], nonce=utils.gen_nonce(), lifetime=remaining)
+                send_kwargs = {'interest_param': param}
+            else:
+                send_kwargs = kwargs | {'nonce': utils.gen_nonce(), 'lifetime': remaining}
+            return aio.ensure_future(self._express_once(name, validator, app_param, signer, send_kwargs, aggregate))
+
+        # The first Interest is sent immediately, as the other ways of expressing
+        return self._wait_with_retx(send(self.aggregate), send, retx, estimator, deadline)
+
+    @staticmethod
+    async def _wait_with_retx(first: aio.Future, send: typing.Callable[[], aio.Future], retx: RetxPolicy,
+                              estimator: utils.RttEstimator, deadline: float):
+        loop = aio.get_running_loop()
+        sent_time = loop.time()
+        pending = {first}
+        retries = 0
+        last_error = None
+        try:
+            while pending:
+                can_retx = retries < retx.max_retries and loop.time() < deadline
+                done, pending = await aio.wait(pending, timeout=estimator.rto if can_retx else None,
+                                               return_when=aio.FIRST_COMPLETED)
+                resend = not done
+                for future in done:
+                    error = future.exception()
+                    if error is None:
+                        # Karn's algorithm: the RTT is ambiguous once the Interest is retransmitted
+                        if retries == 0:
+                            estimator.add_measurement(loop.time() - sent_time)
+                        return future.result()
+                    if not isinstance(error, (types.InterestNack, types.InterestTimeout)):
+                        raise error
+                    last_error = error
+                    resend = resend or isinstance(error, types.InterestNack)
+                if not done:
+                    estimator.backoff(retx.backoff)
+                if resend and retries < retx.max_retries and loop.time() < deadline:
+                    retries += 1
+                    pending.add(send())
+            raise last_error
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def wait_writable(self):
+        r"""
+        Wait until the face is able to accept more packets without growing its sending buffer
+        over the high watermark.
+        The time spent is counted in ``face.blocked_time``.
+        """
+        await self.face.wait_writable()
+
+    async def express_when_writable(self, name: enc.NonStrictName, validator: Validator,
+                                    app_param: typing.Optional[enc.BinaryStr] = None,
+                                    signer: typing.Optional[enc.Signer] = None,
+                                    **kwargs) -> tuple[enc.FormalName, typing.Optional[enc.BinaryStr], PktContext]:
+        r"""
+        Wait until the face is writable, then express an Interest and wait for the Data.
+        Consumers sending many Interests should use this instead of :meth:`express`,
+        so that they are slowed down when the forwarder does not keep up.
+
+        The parameters, return value and exceptions are the same as :meth:`express`.
+        """
+        await self.face.wait_writable()
+        coro = self.express(name, validator, app_param, signer, **kwargs)
+        if coro is None:
+            return None
+        return await coro
+
+    def route(self, name: enc.NonStrictName, validator: typing.Optional[Validator] = None,
+              queue: typing.Optional[InterestQueue] = None):
         r"""
         A decorator used to register a permanent route for a specific prefix.
         The decorated function should be an :any:`IntHandler`.
@@ -661,6 +1339,8 @@ class NDNApp:
         :type name: :any:`NonStrictName`
         :param validator: validator for signed Interests. See :any:`attach_handler` for details.
         :type validator: Optional[:any:`Validator`]
+        :param queue: admission control for Interests under this prefix. See :any:`attach_handler` for details.
+        :type queue: Optional[:any:`InterestQueue`]
 
         :examples:
             .. code-block:: python3
@@ -676,14 +1356,17 @@ class NDNApp:
 
         def decorator(func: IntHandler):
             self._autoreg_routes.append(name)
-            self.attach_handler(name, func, validator)
+            self.attach_handler(name, func, validator, queue)
             if self.face.running:
                 aio.create_task(self.register(name))
             return func
         return decorator
 
     def _clean_up(self):
-        for node in self._pit.itervalues():
+        self._int_timeouts.clear()
+        self._handler_deadlines.clear()
+        self._pit_tokens.clear()
+        for node in self._pit.nodes():
             node.cancel()
         # FIB is not cleared now
         self._pit.clear()
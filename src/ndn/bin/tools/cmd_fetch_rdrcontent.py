@@ -19,7 +19,9 @@ import os
 import sys
 import argparse
 from ...encoding import Name, Component
-from ...appv2 import NDNApp, pass_all
+from ...appv2 import NDNApp, RetxPolicy, pass_all
+from ...app_support.segment_pipeline import SegmentPipeline, FixedWindow, AimdWindow, CubicWindow
+from ...app_support.manifest import ManifestReader
 # from ...security import KeychainDigest
 from ...types import InterestTimeout, InterestNack, InterestCanceled, ValidationFailure
 
@@ -38,7 +40,16 @@ def add_parser(subparsers):
     parser.add_argument('-r', '--retries', metavar='RETRIES', default=15, type=int,
                         help="maximum number of retries in case of Nack or timeout (-1 = no limit)")
     parser.add_argument('-p', '--pipeline-type', metavar='PIPELINE', default='fixed',
-                        help="reserved")
+                        choices=['fixed', 'aimd', 'cubic'],
+                        help="window control of the pipeline: 'fixed', 'aimd' or 'cubic'")
+    parser.add_argument('-w', '--window', metavar='SIZE', default=8, type=int,
+                        help="window size of the fixed pipeline, or the initial window size of others")
+    parser.add_argument('-s', '--stream', action='store_true',
+                        help="write segments to the output in order as they arrive, keeping at most a window of "
+                             "segments in memory. Without an output, the content is discarded")
+    parser.add_argument('--manifest', action='store_true',
+                        help="verify segments by the digests listed in the manifest of the content, "
+                             "e.g. served by 'putchunks --manifest'")
     parser.add_argument('name', metavar='NAME',
                         help='name prefix of the desired RDR content. A specific version number can be provided.')
     parser.set_defaults(executor=execute)
@@ -54,62 +65,74 @@ def execute(args: argparse.Namespace):
     retries = args.retries
     if retries <= 0:
         retries = sys.maxsize
-
-    if Component.get_type(name[-1]) == Component.TYPE_VERSION and len(name) >= 2:
-        if name[-2] == METADATA_COMPONENT:
-            # Given metadata version
-            meta_name = name
-            data_name = None
-            name = name[:-2]
-        else:
-            # Given data version
-            data_name = name
-            name = name[:-1]
-            meta_name = name
-    else:
-        meta_name = name
-        data_name = None
+    name, meta_name, data_name = split_name(name)
     name_len = len(name)
 
     app = NDNApp()
     # keychain = KeychainDigest()
+    # Keep stdout clean for the streamed content
+    info = sys.stderr if args.stream and args.output == '-' else sys.stdout
 
     async def after_start():
         nonlocal data_name
         try:
             if data_name is None:
-                data_name = await fetch_metadata(app, retries, meta_name, name_len, args.fresh, lifetime)
-            content, cnt = await fetch_content(app, retries, data_name, args.fresh, lifetime)
-            print(f'Segment Count: {cnt}  Content size: {len(content)}')
-            if args.output:
-                if args.output == '-':
-                    print(content.decode())
-                else:
-                    with open(os.path.expandvars(args.output), 'wb') as f:
-                        f.write(content)
+                data_name = await fetch_metadata(app, retries, meta_name, name_len, args.fresh, lifetime, info)
+            if args.manifest:
+                # Only the manifest is validated by signature. Segments are checked by their digests
+                reader = ManifestReader(app, data_name, pass_all, lifetime=lifetime, must_be_fresh=args.fresh,
+                                        max_retries=retries)
+                validator = reader.validate
+            else:
+                validator = pass_all
+            pipeline = SegmentPipeline(app, data_name, validator, make_window_control(args.pipeline_type, args.window),
+                                       lifetime=lifetime, must_be_fresh=args.fresh, max_retries=retries,
+                                       bounded_reorder=args.stream)
+            if args.stream:
+                await stream_to_output(pipeline, args.output)
+                print(f'Segment Count: {pipeline.received}  Content size: {pipeline.content_bytes}', file=info)
+            else:
+                content, cnt = await fetch_content(pipeline)
+                print(f'Segment Count: {cnt}  Content size: {len(content)}')
+                write_output(content, args.output)
+            print_stats(pipeline, info)
         except InterestNack as e:
-            print(f'Nacked with reason={e.reason}')
+            print(f'Nacked with reason={e.reason}', file=info)
         except InterestTimeout:
-            print('Timeout')
+            print('Timeout', file=info)
         except InterestCanceled:
-            print('Local forwarder disconnected')
+            print('Local forwarder disconnected', file=info)
         except ValidationFailure:
-            print('Data failed to validate')
+            print('Data failed to validate', file=info)
         except (ValueError, IndexError):
-            print('Decoding error')
+            print('Decoding error', file=info)
         except OSError as e:
-            print(f'OSError: {e}')
+            print(f'OSError: {e}', file=info)
         finally:
             app.shutdown()
 
     app.run_forever(after_start())
 
 
+def split_name(name):
+    # Return the name prefix, the metadata name, and the data name if a version is given
+    if Component.get_type(name[-1]) == Component.TYPE_VERSION and len(name) >= 2:
+        if name[-2] == METADATA_COMPONENT:
+            # Given metadata version
+            return name[:-2], name, None
+        else:
+            # Given data version
+            return name[:-1], name[:-1], name
+    else:
+        return name, name, None
+
+
 async def retry(app: NDNApp, retry_times, name, can_be_prefix, must_be_fresh, timeout):
     trial_times = 0
     while True:
+        # Retransmit after the RTO within each lifetime, instead of waiting for the whole lifetime
         future = app.express(name, validator=pass_all, can_be_prefix=can_be_prefix,
-                             must_be_fresh=must_be_fresh, lifetime=timeout)
+                             must_be_fresh=must_be_fresh, lifetime=timeout, retx=RetxPolicy())
         try:
             return await future
         except (InterestTimeout, InterestNack):
@@ -118,26 +141,65 @@ async def retry(app: NDNApp, retry_times, name, can_be_prefix, must_be_fresh, ti
                 raise
 
 
-async def fetch_metadata(app: NDNApp, retry_times, meta_name, _name_len, fresh, timeout):
+async def fetch_metadata(app: NDNApp, retry_times, meta_name, _name_len, fresh, timeout, info=sys.stdout):
     _, encoded_data_name, _ = await retry(app, retry_times, meta_name, True, fresh, timeout)
     try:
         data_name = Name.from_bytes(encoded_data_name)
     except (ValueError, IndexError):
-        print(f'Unable to decode data name from metadata packet: {bytes(encoded_data_name).hex()}')
+        print(f'Unable to decode data name from metadata packet: {bytes(encoded_data_name).hex()}', file=info)
         raise
     return data_name
 
 
-async def fetch_content(app: NDNApp, retry_times, data_name, fresh, timeout):
-    i = 0
-    ret = []
-    while True:
-        seg_component = Component.from_segment(i)
-        _, cur, context = await retry(app, retry_times, data_name + [seg_component], False, fresh, timeout)
-        ret.append(cur)
-        meta = context['meta_info']
-        final = meta.final_block_id
-        if final is None or final == seg_component:
-            break
-        i += 1
-    return b''.join(ret), i + 1
+def make_window_control(pipeline_type, window):
+    if pipeline_type == 'aimd':
+        return AimdWindow(initial_window=window)
+    elif pipeline_type == 'cubic':
+        return CubicWindow(initial_window=window)
+    else:
+        return FixedWindow(window)
+
+
+async def fetch_content(pipeline: SegmentPipeline):
+    ret = [cur async for cur in pipeline]
+    return b''.join(c for c in ret if c), len(ret)
+
+
+async def stream_content(pipeline: SegmentPipeline, output):
+    # The pipeline does not request more segments while a write blocks
+    async for cur in pipeline:
+        if output is not None and cur:
+            output.write(cur)
+
+
+async def stream_to_output(pipeline: SegmentPipeline, output):
+    if not output:
+        await stream_content(pipeline, None)
+    elif output == '-':
+        await stream_content(pipeline, sys.stdout.buffer)
+        sys.stdout.flush()
+    else:
+        with open(os.path.expandvars(output), 'wb') as f:
+            await stream_content(pipeline, f)
+
+
+def write_output(content: bytes, output):
+    if not output:
+        return
+    if output == '-':
+        print(content.decode())
+    else:
+        with open(os.path.expandvars(output), 'wb') as f:
+            f.write(content)
+
+
+def print_stats(pipeline: SegmentPipeline, file):
+    elapsed = pipeline.elapsed
+    goodput = pipeline.content_bytes * 8 / elapsed / 1e6 if elapsed > 0 else 0.0
+    throughput = pipeline.bytes_received * 8 / elapsed / 1e6 if elapsed > 0 else 0.0
+    print(f'Time elapsed: {elapsed:.3f} s', file=file)
+    print(f'Goodput: {goodput:.3f} Mbit/s  Throughput: {throughput:.3f} Mbit/s', file=file)
+    print(f'Interests: {pipeline.interests_sent}  Retransmissions: {pipeline.retransmissions}  '
+          f'Timeouts: {pipeline.timeouts}  Nacks: {pipeline.nacks}  '
+          f'Congestion marks: {pipeline.congestion_marks}  Window decreases: {pipeline.window_decreases}',
+          file=file)
@@ -17,22 +17,100 @@
 # -----------------------------------------------------------------------------
 import os
 import sys
+import mmap
 import argparse
-from ...encoding import Name, Component
+import asyncio as aio
+from collections import OrderedDict
+from hashlib import sha256
+from ...encoding import Name, Component, MetaInfo, DataTemplate, BinaryStr
 from ...appv2 import NDNApp
-from ...security import KeychainDigest
+from ...app_support.manifest import MANIFEST_COMPONENT, make_manifests
+from ...security import KeychainDigest, DigestSha256Signer
 from ...utils import timestamp
 
 
 METADATA_COMPONENT = Component.from_str('32=metadata')
 
 
+class LazySegments:
+    """
+    Segments of a buffer, e.g. a memory-mapped file, which are made and signed when first requested.
+    Signed segments are kept in an LRU cache of ``cache_size`` segments.
+    After a segment is requested, the ``presign`` segments following it are signed in the default executor.
+    """
+
+    def __init__(self, buf: BinaryStr, size: int, template: DataTemplate, cache_size: int = 1024,
+                 presign: int = 0):
+        self.buf = buf
+        self.size = size
+        self.template = template
+        self.cache_size = max(cache_size, 1)
+        self.presign = presign
+        self.seg_cnt = (len(buf) + size - 1) // size
+        self._cache = OrderedDict()
+        self._signing = set()
+
+    def __len__(self):
+        return self.seg_cnt
+
+    def _make(self, seg_no: int) -> bytes:
+        return bytes(self.template.make_data(Component.from_segment(seg_no),
+                                             self.buf[seg_no * self.size:(seg_no + 1) * self.size]))
+
+    def _put(self, seg_no: int, wire: bytes):
+        self._cache[seg_no] = wire
+        self._cache.move_to_end(seg_no)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def get(self, seg_no: int) -> bytes:
+        wire = self._cache.get(seg_no)
+        if wire is not None:
+            self._cache.move_to_end(seg_no)
+        else:
+            wire = self._make(seg_no)
+            self._put(seg_no, wire)
+        if self.presign > 0:
+            self._presign(seg_no + 1)
+        return wire
+
+    def _presign(self, start: int):
+        loop = aio.get_running_loop()
+        for seg_no in range(start, min(start + self.presign, self.seg_cnt)):
+            if seg_no in self._cache or seg_no in self._signing:
+                continue
+            self._signing.add(seg_no)
+            future = loop.run_in_executor(None, self._make, seg_no)
+            future.add_done_callback(lambda f, i=seg_no: self._on_presigned(i, f))
+
+    def digests(self) -> list[bytes]:
+        # Only works if the signer is deterministic, e.g. DigestSha256, so that a segment made again is the same
+        return [sha256(self._make(i)).digest() for i in range(self.seg_cnt)]
+
+    def _on_presigned(self, seg_no: int, future: aio.Future):
+        self._signing.discard(seg_no)
+        if not future.cancelled() and future.exception() is None and seg_no not in self._cache:
+            self._put(seg_no, future.result())
+
+
 def add_parser(subparsers):
     parser = subparsers.add_parser('Serve-RdrContent', aliases=['putchunks', 'src', 'serve-rdrcontent'])
     parser.add_argument('-f', '--freshness', metavar='FRESHNESS', default=60000, type=int,
                         help='the freshness period of the Data packet')
     parser.add_argument('-s', '--size', metavar='SIZE', default=8000, type=int,
                         help='maximum chunk size, in bytes')
+    parser.add_argument('--lazy', action='store_true',
+                        help='map the file into memory and sign segments when they are requested, '
+                             'instead of reading and signing the whole file before serving. Not for stdin. '
+                             'With --manifest, every segment is still made and hashed once before serving, '
+                             'since the manifest lists their digests')
+    parser.add_argument('--cache-size', metavar='SEGMENTS', default=1024, type=int,
+                        help='maximum number of signed segments kept in memory with --lazy')
+    parser.add_argument('--presign', metavar='SEGMENTS', default=0, type=int,
+                        help='with --lazy, sign this number of segments following a requested one in background')
+    parser.add_argument('--manifest', action='store_true',
+                        help='sign only a manifest listing the digests of segments, and sign segments with '
+                             'DigestSha256')
     # More to be added
     parser.add_argument('name', metavar='NAME',
                         help='the name of the Data packet')
@@ -54,9 +132,15 @@ def execute(args: argparse.Namespace):
     meta_name = name + [METADATA_COMPONENT, version, Component.from_segment(0)]
     data_name = name + [version]
 
-    # This does not work for large file
+    # Without --lazy, this does not work for large file
     try:
-        if args.file == '-':
+        if args.lazy:
+            if args.file == '-':
+                print('--lazy cannot be used with stdin')
+                return -2
+            with open(os.path.expandvars(args.file), 'rb') as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        elif args.file == '-':
             data = sys.stdin.read().encode()
         else:
             with open(os.path.expandvars(args.file), 'rb') as f:
@@ -68,13 +152,32 @@ def execute(args: argparse.Namespace):
     app = NDNApp()
     keychain = KeychainDigest()
     seg_cnt = (len(data) + size - 1) // size
-    packets = [app.make_data(data_name + [Component.from_segment(i)],
-                             data[i * size:(i + 1) * size],
-                             signer=keychain.get_signer({}),
-                             freshness_period=fresh,
-                             final_block_id=Component.from_segment(seg_cnt - 1))
-               for i in range(seg_cnt)]
-    print(f'Created {seg_cnt} chunks under name prefix {Name.to_str(data_name)}')
+    # With a manifest, the signature of the manifest covers segments by their digests
+    template = DataTemplate(data_name,
+                            MetaInfo(freshness_period=fresh, final_block_id=Component.from_segment(seg_cnt - 1)),
+                            signer=DigestSha256Signer() if args.manifest else keychain.get_signer({}))
+    if args.lazy:
+        segments = LazySegments(data, size, template, args.cache_size, args.presign)
+        get_segment = segments.get
+        if args.manifest:
+            print(f'Hashing {seg_cnt} chunks for the manifest ...')
+            digests = segments.digests()
+        else:
+            digests = []
+        print(f'Serving {seg_cnt} chunks under name prefix {Name.to_str(data_name)}, signed on demand')
+    else:
+        packets = [template.make_data(Component.from_segment(i), data[i * size:(i + 1) * size])
+                   for i in range(seg_cnt)]
+        get_segment = packets.__getitem__
+        digests = [sha256(p).digest() for p in packets] if args.manifest else []
+        print(f'Created {seg_cnt} chunks under name prefix {Name.to_str(data_name)}')
+
+    if args.manifest:
+        manifests = make_manifests(data_name, digests, keychain.get_signer({}), freshness_period=fresh)
+        print(f'Created {len(manifests)} manifest packets under name prefix '
+              f'{Name.to_str(data_name + [MANIFEST_COMPONENT])}')
+    else:
+        manifests = []
 
     meta_packet = app.make_data(meta_name, Name.to_bytes(data_name),
                                 signer=keychain.get_signer({}),
@@ -83,15 +186,26 @@ def execute(args: argparse.Namespace):
 
     @app.route(name)
     def on_interest(int_name, _app_param, reply, _context):
+        # Interests for manifest packets carry their implicit digests
+        if Component.get_type(int_name[-1]) == Component.TYPE_IMPLICIT_SHA256:
+            int_name = int_name[:-1]
         if len(int_name) == name_len or int_name[name_len] == METADATA_COMPONENT:
             reply(meta_packet)
         elif int_name[name_len] == version:
+            if manifests and len(int_name) > name_len + 1 and int_name[name_len + 1] == MANIFEST_COMPONENT:
+                get_packet, packet_cnt = manifests.__getitem__, len(manifests)
+            else:
+                get_packet, packet_cnt = get_segment, seg_cnt
             if Component.get_type(int_name[-1]) == Component.TYPE_SEGMENT:
                 seg_no = Component.to_number(int_name[-1])
             else:
                 seg_no = 0
-            if seg_no < seg_cnt:
-                reply(packets[seg_no])
+            if seg_no < packet_cnt:
+                reply(get_packet(seg_no))
 
     print(f'Start serving {Name.to_str(name)} ...')
-    app.run_forever()
+    try:
+        app.run_forever()
+    finally:
+        if args.lazy:
+            data.close()
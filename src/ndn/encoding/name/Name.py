@@ -18,6 +18,8 @@
 """
 Name module is a collection of functions processing NDN Names.
 """
+from array import array
+from collections.abc import Sequence
 from functools import reduce
 from typing import List, Optional, Iterable
 from . import Component
@@ -128,6 +130,8 @@ def to_bytes(name: NonStrictName) -> bytes:
     :type name: :any:`NonStrictName`
     :return: Encoded Name.
     """
+    if isinstance(name, FrozenName):
+        return name.to_bytes()
     if not is_binary_str(name):
         name = encode(normalize(name))
     return bytes(name)
@@ -228,6 +232,8 @@ def normalize(name: NonStrictName) -> FormalName:
         return decode(name)[0]
     elif isinstance(name, str):
         return from_str(name)
+    elif isinstance(name, FrozenName):
+        return list(name)
     elif not isinstance(name, Iterable):
         raise TypeError('invalid type for name')
     ret = list(name)
@@ -237,3 +243,146 @@ def normalize(name: NonStrictName) -> FormalName:
         elif not is_binary_str(comp):
             raise TypeError('invalid type for name component')
     return ret
+
+
+class FrozenName(Sequence):
+    r"""
+    An immutable and hashable Name.
+
+    The TLV encoded Name is stored in one :class:`bytes` object, with the offsets of Components
+    kept in a compact array.
+    Indexing returns a read-only :class:`memoryview` of the Component, and slicing returns another
+    :class:`FrozenName` sharing the same buffer, so neither of them copies the Name.
+    A FrozenName is a sequence of Components, so it is accepted wherever a :any:`NonStrictName` is.
+
+    The hash value equals to the hash of the TLV encoded Name, which is computed at most once.
+    A FrozenName compares equal to another FrozenName or a TLV encoded Name with the same wire,
+    and to a list of Components with the same values.
+    Therefore, a dict whose keys are encoded Names can be looked up with a FrozenName directly.
+
+    :param name: the Name.
+    :type name: :any:`NonStrictName`
+
+    :examples:
+        >>> from ndn.encoding.name import Name
+        >>> name = Name.FrozenName('/a/b/c')
+        >>> name[1:]
+        FrozenName('/b/c')
+        >>> bytes(name[-1])
+        b'\x08\x01c'
+        >>> {Name.to_bytes('/a/b'): 1}[name[:2]]
+        1
+    """
+    _buf: bytes
+    _offsets: array
+    _begin: int
+    _end: int
+    _wire: Optional[bytes]
+    _hash: Optional[int]
+
+    def __init__(self, name: NonStrictName):
+        if isinstance(name, FrozenName):
+            buf, offsets, begin, end = name._buf, name._offsets, name._begin, name._end
+        else:
+            if is_binary_str(name):
+                buf = bytes(name)
+                comps, size = decode(buf)
+                if size != len(buf):
+                    raise ValueError(f'{name} contains trailing bytes after the Name')
+            else:
+                # Components are encoded as they are, so there is no need to decode the wire again
+                comps = normalize(name)
+                buf = bytes(encode(comps))
+                size = len(buf)
+            offset = size - sum(len(comp) for comp in comps)
+            offsets = array('L', [offset])
+            for comp in comps:
+                offset += len(comp)
+                offsets.append(offset)
+            begin, end = 0, len(comps)
+        self._buf = buf
+        self._offsets = offsets
+        self._begin = begin
+        self._end = end
+        self._wire = buf if begin == 0 and end == len(offsets) - 1 else None
+        self._hash = None
+
+    def __len__(self) -> int:
+        return self._end - self._begin
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            begin, end, step = item.indices(len(self))
+            if step != 1:
+                raise ValueError('FrozenName does not support slicing with steps')
+            ret = FrozenName.__new__(FrozenName)
+            ret._buf = self._buf
+            ret._offsets = self._offsets
+            ret._begin = self._begin + begin
+            ret._end = self._begin + max(begin, end)
+            ret._wire = self._wire if ret._begin == self._begin and ret._end == self._end else None
+            ret._hash = None
+            return ret
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError('FrozenName index out of range')
+        item += self._begin
+        return memoryview(self._buf)[self._offsets[item]:self._offsets[item + 1]]
+
+    def __iter__(self):
+        buf = memoryview(self._buf)
+        offsets = self._offsets
+        for i in range(self._begin, self._end):
+            yield buf[offsets[i]:offsets[i + 1]]
+
+    def value(self) -> memoryview:
+        r"""
+        The Value part of the encoded Name, i.e., the concatenation of all Components.
+
+        :return: a read-only view of the buffer.
+        """
+        return memoryview(self._buf)[self._offsets[self._begin]:self._offsets[self._end]]
+
+    def to_bytes(self) -> bytes:
+        r"""
+        The TLV encoded Name. It is only generated once for a slice, and never copied for a decoded Name.
+
+        :return: the encoded Name.
+        """
+        if self._wire is None:
+            value = self.value()
+            length = len(value)
+            wire = bytearray(1 + get_tl_num_size(length) + length)
+            offset = write_tl_num(TYPE_NAME, wire)
+            offset += write_tl_num(length, wire, offset)
+            wire[offset:] = value
+            self._wire = bytes(wire)
+        return self._wire
+
+    def __bytes__(self) -> bytes:
+        return self.to_bytes()
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self.to_bytes())
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FrozenName):
+            return self.value() == other.value()
+        elif is_binary_str(other):
+            return self.to_bytes() == other
+        elif isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(lhs == rhs for lhs, rhs in zip(self, other))
+        return NotImplemented
+
+    def __add__(self, other):
+        # Concatenation returns a FormalName, which can be modified
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __repr__(self) -> str:
+        return f"FrozenName('{to_str(self)}')"
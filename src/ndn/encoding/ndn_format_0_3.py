@@ -15,21 +15,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # -----------------------------------------------------------------------------
+import struct
 import dataclasses as dc
+from functools import cached_property
 from hashlib import sha256
 from typing import Optional, List, Tuple
 from .name import Name, Component
 from .signer import Signer
 from .tlv_type import VarBinaryStr, BinaryStr, NonStrictName, FormalName
-from .tlv_var import parse_and_check_tl, shrink_length
+from .tlv_var import parse_and_check_tl, shrink_length, parse_tl_num, write_tl_num, get_tl_num_size
 from .tlv_model import TlvModel, InterestNameField, BoolField, UintField, \
     SignatureValueField, OffsetMarker, BytesField, ModelField, NameField, \
-    ProcedureArgument, RepeatedField
+    ProcedureArgument, RepeatedField, DecodeError
 
 
 __all__ = ['TypeNumber', 'ContentType', 'SignatureType', 'KeyLocator', 'SignatureInfo',
            'Links', 'MetaInfo', 'InterestParam', 'SignaturePtrs', 'make_interest', 'make_data',
-           'parse_interest', 'parse_data', 'Interest', 'Data']
+           'parse_interest', 'parse_data', 'Interest', 'Data', 'InterestView', 'DataView', 'DataTemplate']
 
 
 class TypeNumber:
@@ -447,6 +449,99 @@ def make_data(name: NonStrictName,
     return ret
 
 
+def _encode_tlv(typ: int, value: BinaryStr) -> bytes:
+    ret = bytearray(get_tl_num_size(typ) + get_tl_num_size(len(value)) + len(value))
+    offset = write_tl_num(typ, ret)
+    offset += write_tl_num(len(value), ret, offset)
+    ret[offset:] = value
+    return bytes(ret)
+
+
+class DataTemplate:
+    r"""
+    A reusable template of Data packets sharing the same name prefix, MetaInfo and signer,
+    e.g. the segments of a file or the sequence numbers of a stream.
+
+    The name prefix, MetaInfo and SignatureInfo are encoded once on construction.
+    :meth:`make_data` only writes the name suffix, Content and SignatureValue into a preallocated buffer.
+    The result is the same as calling :any:`make_data` with the full name.
+
+    :param prefix: the name prefix shared by all Data packets.
+    :type prefix: :any:`NonStrictName`
+    :param meta_info: the MetaInfo field.
+    :param signer: a Signer to sign the Data packets. ``None`` if they are unsigned.
+        The Signer should write the same SignatureInfo every time.
+    """
+    def __init__(self, prefix: NonStrictName, meta_info: Optional[MetaInfo] = None,
+                 signer: Optional[Signer] = None):
+        self.prefix = Name.normalize(prefix)
+        self.meta_info = meta_info
+        self.signer = signer
+        self._prefix_value = b''.join(self.prefix)
+        self._meta_info_tlv = _encode_tlv(TypeNumber.META_INFO, meta_info.encode()) if meta_info is not None else b''
+        if signer is not None:
+            sig_info = SignatureInfo()
+            signer.write_signature_info(sig_info)
+            self._sig_info_tlv = _encode_tlv(TypeNumber.SIGNATURE_INFO, sig_info.encode())
+            self._sig_value_len = signer.get_signature_value_size()
+            if self._sig_value_len >= 253:
+                raise ValueError(f'Long signatrue with flexible length is not supported: {self._sig_value_len} >= 253')
+        else:
+            self._sig_info_tlv = b''
+            self._sig_value_len = 0
+
+    def make_data(self, suffix: BinaryStr = b'', content: Optional[BinaryStr] = None) -> VarBinaryStr:
+        r"""
+        Make a Data packet whose name is the prefix followed by ``suffix``.
+
+        :param suffix: TLV encoded name components appended to the prefix,
+            e.g. ``Component.from_segment(seg_no)``.
+        :type suffix: :any:`BinaryStr`
+        :param content: the Content.
+        :type content: :class:`Optional` [ :any:`BinaryStr` ]
+        :return: TLV encoded Data packet.
+        """
+        name_len = len(self._prefix_value) + len(suffix)
+        value_len = 1 + get_tl_num_size(name_len) + name_len + len(self._meta_info_tlv)
+        if content is not None:
+            value_len += 1 + get_tl_num_size(len(content)) + len(content)
+        if self.signer is not None:
+            value_len += len(self._sig_info_tlv) + 2 + self._sig_value_len
+
+        wire = bytearray(1 + get_tl_num_size(value_len) + value_len)
+        wire_view = memoryview(wire)
+        offset = write_tl_num(TypeNumber.DATA, wire)
+        offset += write_tl_num(value_len, wire, offset)
+        sig_cover_start = offset
+        offset += write_tl_num(TypeNumber.NAME, wire, offset)
+        offset += write_tl_num(name_len, wire, offset)
+        wire[offset:offset + len(self._prefix_value)] = self._prefix_value
+        offset += len(self._prefix_value)
+        wire[offset:offset + len(suffix)] = suffix
+        offset += len(suffix)
+        wire[offset:offset + len(self._meta_info_tlv)] = self._meta_info_tlv
+        offset += len(self._meta_info_tlv)
+        if content is not None:
+            offset += write_tl_num(TypeNumber.CONTENT, wire, offset)
+            offset += write_tl_num(len(content), wire, offset)
+            wire[offset:offset + len(content)] = content
+            offset += len(content)
+        if self.signer is None:
+            return wire
+
+        wire[offset:offset + len(self._sig_info_tlv)] = self._sig_info_tlv
+        offset += len(self._sig_info_tlv)
+        sig_cover_end = offset
+        wire[offset] = TypeNumber.SIGNATURE_VALUE
+        wire[offset + 1] = self._sig_value_len
+        offset += 2
+        real_len = self.signer.write_signature_value(wire_view[offset:], [wire_view[sig_cover_start:sig_cover_end]])
+        if real_len != self._sig_value_len:
+            wire[sig_cover_end + 1] = real_len
+            return shrink_length(wire, self._sig_value_len - real_len)
+        return wire
+
+
 def parse_interest(wire: BinaryStr, with_tl: bool = True) -> Interest:
     r"""
     Parse a TLV encoded Interest.
@@ -509,3 +604,247 @@ def parse_data(wire: BinaryStr, with_tl: bool = True) -> Data:
         signature_value_buf=ret.signature_value,
     )
     return ret.name, params, ret.content, sig_ptrs
+
+
+def _scan_elements(wire: memoryview, types: Tuple[int, ...]) -> list:
+    # Record (offset_btl, offset, length) of every expected element, following the same ordering rules as TlvModel
+    ret = [None] * len(types)
+    wire_len = len(wire)
+    field_pos = 0
+    offset = 0
+    while offset < wire_len:
+        offset_btl = offset
+        typ, size_typ = parse_tl_num(wire, offset)
+        offset += size_typ
+        length, size_len = parse_tl_num(wire, offset)
+        offset += size_len
+        if offset + length > wire_len:
+            raise DecodeError(f'the Length of a field of type {typ} exceeds the buffer')
+        try:
+            i = types.index(typ, field_pos)
+        except ValueError:
+            if (typ & 1) == 1:
+                raise DecodeError(f'a critical field of type {typ} is unrecognized, redundant or out-of-order')
+        else:
+            ret[i] = (offset_btl, offset, length)
+            field_pos = i + 1
+        offset += length
+    return ret
+
+
+def _parse_uint(wire: memoryview, element) -> Optional[int]:
+    if element is None:
+        return None
+    _, offset, length = element
+    if length == 1:
+        return wire[offset]
+    elif length == 2:
+        return struct.unpack_from('!H', wire, offset)[0]
+    elif length == 4:
+        return struct.unpack_from('!I', wire, offset)[0]
+    elif length == 8:
+        return struct.unpack_from('!Q', wire, offset)[0]
+    else:
+        raise ValueError("Uint's length should be 1, 2, 4 or 8")
+
+
+class InterestView:
+    r"""
+    A lazily decoded view of a TLV encoded Interest, used as a cheaper alternative to :any:`parse_interest`.
+
+    The constructor scans the top-level elements once and records their offsets in the original buffer.
+    The Name is decoded into a list of :class:`memoryview` on first access,
+    and ForwardingHint and InterestSignatureInfo are only decoded when accessed.
+    No part of the packet is copied.
+
+    :param wire: the buffer.
+    :type wire: :any:`BinaryStr`
+    :param with_tl: ``True`` if the packet has Type and Length.
+        ``False`` if ``wire`` only has the Value part.
+
+    :raises DecodeError: a critical field is unrecognized, redundant or out-of-order.
+    """
+    _TYPES = (TypeNumber.NAME, TypeNumber.CAN_BE_PREFIX, TypeNumber.MUST_BE_FRESH, TypeNumber.FORWARDING_HINT,
+              TypeNumber.NONCE, TypeNumber.INTEREST_LIFETIME, TypeNumber.HOP_LIMIT,
+              TypeNumber.APPLICATION_PARAMETERS, TypeNumber.INTEREST_SIGNATURE_INFO,
+              TypeNumber.INTEREST_SIGNATURE_VALUE)
+    _APP_PARAM_POS = 7
+
+    def __init__(self, wire: BinaryStr, with_tl: bool = True):
+        self.wire = memoryview(parse_and_check_tl(wire, TypeNumber.INTEREST) if with_tl else wire)
+        self._elements = _scan_elements(self.wire, self._TYPES)
+        # The signature and the ParametersSha256DigestComponent cover from the first element after HopLimit
+        self._sig_cover_start = next((ele[0] for ele in self._elements[self._APP_PARAM_POS:] if ele is not None),
+                                     None)
+
+    def _value(self, pos: int) -> Optional[memoryview]:
+        element = self._elements[pos]
+        if element is None:
+            return None
+        _, offset, length = element
+        return self.wire[offset:offset + length]
+
+    @cached_property
+    def name(self) -> FormalName:
+        r"""The Name of the Interest."""
+        element = self._elements[0]
+        if element is None:
+            return []
+        return Name.decode(self.wire, element[0])[0]
+
+    @property
+    def can_be_prefix(self) -> bool:
+        return self._elements[1] is not None
+
+    @property
+    def must_be_fresh(self) -> bool:
+        return self._elements[2] is not None
+
+    @property
+    def nonce(self) -> Optional[int]:
+        return _parse_uint(self.wire, self._elements[4])
+
+    @property
+    def lifetime(self) -> Optional[int]:
+        return _parse_uint(self.wire, self._elements[5])
+
+    @property
+    def hop_limit(self) -> Optional[int]:
+        return _parse_uint(self.wire, self._elements[6])
+
+    @cached_property
+    def forwarding_hint(self) -> List[FormalName]:
+        r"""The ForwardingHint, decoded on first access."""
+        value = self._value(3)
+        if value is None:
+            return []
+        return list(Links.parse(value).names)
+
+    @property
+    def app_param(self) -> Optional[memoryview]:
+        r"""The ApplicationParameters value, or ``None`` if absent."""
+        return self._value(7)
+
+    @property
+    def has_signature_info(self) -> bool:
+        return self._elements[8] is not None
+
+    @cached_property
+    def signature_info(self) -> Optional[SignatureInfo]:
+        r"""The InterestSignatureInfo, decoded on first access."""
+        value = self._value(8)
+        if value is None:
+            return None
+        return SignatureInfo.parse(value)
+
+    @property
+    def signature_value(self) -> Optional[memoryview]:
+        return self._value(9)
+
+    @cached_property
+    def int_param(self) -> InterestParam:
+        r"""The :any:`InterestParam` of the Interest. Triggers decoding the ForwardingHint if present."""
+        return InterestParam(can_be_prefix=self.can_be_prefix, must_be_fresh=self.must_be_fresh,
+                             nonce=self.nonce, lifetime=self.lifetime, hop_limit=self.hop_limit,
+                             forwarding_hint=self.forwarding_hint)
+
+    @cached_property
+    def sig_ptrs(self) -> SignaturePtrs:
+        r"""The :any:`SignaturePtrs`, the same as what :any:`parse_interest` returns."""
+        sig_cover_part = []
+        digest_value_buf = None
+        for comp in self.name:
+            if Component.get_type(comp) == Component.TYPE_PARAMETERS_SHA256:
+                digest_value_buf = Component.get_value(comp)
+            else:
+                sig_cover_part.append(comp)
+        sig_value = self._elements[9]
+        if sig_value is not None and self._sig_cover_start is not None:
+            sig_cover_part.append(self.wire[self._sig_cover_start:sig_value[0]])
+        return SignaturePtrs(
+            signature_info=self.signature_info,
+            signature_covered_part=sig_cover_part,
+            signature_value_buf=self.signature_value,
+            digest_covered_part=[self.wire[self._sig_cover_start:]],
+            digest_value_buf=digest_value_buf,
+        )
+
+
+class DataView:
+    r"""
+    A lazily decoded view of a TLV encoded Data, used as a cheaper alternative to :any:`parse_data`.
+
+    The constructor scans the top-level elements once and records their offsets in the original buffer.
+    The Name is decoded into a list of :class:`memoryview` on first access,
+    and MetaInfo and SignatureInfo are only decoded when accessed.
+    No part of the packet is copied.
+
+    :param wire: the buffer.
+    :type wire: :any:`BinaryStr`
+    :param with_tl: ``True`` if the packet has Type and Length.
+        ``False`` if ``wire`` only has the Value part.
+
+    :raises DecodeError: a critical field is unrecognized, redundant or out-of-order.
+    """
+    _TYPES = (TypeNumber.NAME, TypeNumber.META_INFO, TypeNumber.CONTENT,
+              TypeNumber.SIGNATURE_INFO, TypeNumber.SIGNATURE_VALUE)
+
+    def __init__(self, wire: BinaryStr, with_tl: bool = True):
+        self.wire = memoryview(parse_and_check_tl(wire, TypeNumber.DATA) if with_tl else wire)
+        self._elements = _scan_elements(self.wire, self._TYPES)
+
+    def _value(self, pos: int) -> Optional[memoryview]:
+        element = self._elements[pos]
+        if element is None:
+            return None
+        _, offset, length = element
+        return self.wire[offset:offset + length]
+
+    @cached_property
+    def name(self) -> FormalName:
+        r"""The Name of the Data."""
+        element = self._elements[0]
+        if element is None:
+            return []
+        return Name.decode(self.wire, element[0])[0]
+
+    @cached_property
+    def meta_info(self) -> MetaInfo:
+        r"""The MetaInfo, decoded on first access. A default :any:`MetaInfo` is returned if absent."""
+        value = self._value(1)
+        if value is None:
+            return MetaInfo()
+        return MetaInfo.parse(value)
+
+    @property
+    def content(self) -> Optional[memoryview]:
+        r"""The Content value, or ``None`` if absent."""
+        return self._value(2)
+
+    @cached_property
+    def signature_info(self) -> Optional[SignatureInfo]:
+        r"""The SignatureInfo, decoded on first access."""
+        value = self._value(3)
+        if value is None:
+            return None
+        # v0.2 Data packets has critical SignatureType-specific TLVs
+        return SignatureInfo.parse(value, ignore_critical=True)
+
+    @property
+    def signature_value(self) -> Optional[memoryview]:
+        return self._value(4)
+
+    @cached_property
+    def sig_ptrs(self) -> SignaturePtrs:
+        r"""The :any:`SignaturePtrs`, the same as what :any:`parse_data` returns."""
+        sig_value = self._elements[4]
+        if sig_value is not None:
+            sig_cover_start = next(ele[0] for ele in self._elements if ele is not None)
+            sig_cover_part = [self.wire[sig_cover_start:sig_value[0]]]
+        else:
+            sig_cover_part = []
+        return SignaturePtrs(
+            signature_info=self.signature_info,
+            signature_covered_part=sig_cover_part,
+            signature_value_buf=self.signature_value,
+        )
@@ -15,13 +15,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # -----------------------------------------------------------------------------
-from typing import Optional
+from typing import Optional, List
 from .tlv_type import BinaryStr, VarBinaryStr
-from .tlv_var import parse_and_check_tl
-from .tlv_model import TlvModel, UintField, BytesField, ModelField, BoolField, DecodeError
+from .tlv_var import parse_and_check_tl, parse_tl_num
+from .tlv_model import TlvModel, UintField, BytesField, ModelField, BoolField, RepeatedField, DecodeError
 
 __all__ = ['LpTypeNumber', 'NackReason', 'parse_network_nack', 'make_network_nack', 'parse_lp_packet',
-           'parse_lp_packet_v2']
+           'parse_lp_packet_v2', 'make_lp_fragments']
 
 
 class LpTypeNumber:
@@ -61,6 +61,7 @@ class CachePolicy(TlvModel):
 
 
 class LpPacketValue(TlvModel):
+    sequence = UintField(LpTypeNumber.SEQUENCE, fixed_len=8)
     frag_index = UintField(LpTypeNumber.FRAG_INDEX)
     frag_count = UintField(LpTypeNumber.FRAG_COUNT)
     pit_token = BytesField(LpTypeNumber.PIT_TOKEN)
@@ -69,8 +70,8 @@ class LpPacketValue(TlvModel):
     next_hop_face_id = UintField(LpTypeNumber.NEXT_HOP_FACE_ID)
     cache_policy = ModelField(LpTypeNumber.CACHE_POLICY, CachePolicy)
     congestion_mark = UintField(LpTypeNumber.CONGESTION_MARK)
-    tx_sequence = BytesField(LpTypeNumber.TX_SEQUENCE)
-    ack = BytesField(LpTypeNumber.ACK)
+    ack = RepeatedField(UintField(LpTypeNumber.ACK, fixed_len=8))
+    tx_sequence = UintField(LpTypeNumber.TX_SEQUENCE, fixed_len=8)
     non_discovery = BoolField(LpTypeNumber.NON_DISCOVERY)
     prefix_announcement = BytesField(LpTypeNumber.PREFIX_ANNOUNCEMENT)
 
@@ -109,8 +110,8 @@ def parse_lp_packet_v2(wire: BinaryStr, with_tl: bool = True) -> LpPacketValue:
     markers = {}
     ret = LpPacketValue.parse(wire, markers, ignore_critical=True)
 
-    if ret.frag_index is not None or ret.frag_count is not None:
-        raise DecodeError('NDNLP fragmentation is not implemented yet.')
+    if (ret.frag_index or 0) > 0 or (ret.frag_count or 1) > 1:
+        raise DecodeError('NDNLP fragments should be reassembled by the face before parsing.')
 
     return ret
 
@@ -134,3 +135,50 @@ def make_network_nack(encoded_interest: BinaryStr, nack_reason: int) -> VarBinar
     lp_packet.lp_packet.nack.nack_reason = nack_reason
     lp_packet.lp_packet.fragment = encoded_interest
     return lp_packet.encode()
+
+
+# LpPacket TL (up to 3-byte Length) + Sequence + FragIndex + FragCount (up to 4-byte values) + Fragment TL
+_FRAGMENT_OVERHEAD = 4 + 10 + 6 + 6 + 4
+
+
+def make_lp_fragments(wire: BinaryStr, mtu: int, sequence: int) -> List[VarBinaryStr]:
+    """
+    Split a network layer packet into LpPackets no longer than ``mtu``.
+    If ``wire`` is an LpPacket, its header fields are carried in the first fragment.
+    The i-th fragment has Sequence ``sequence + i``.
+
+    :param wire: a network layer packet or an LpPacket, with TL fields.
+    :param mtu: the maximum size of an encoded fragment.
+    :param sequence: the Sequence of the first fragment.
+    :return: a list of encoded LpPackets.
+
+    :raises ValueError: ``mtu`` is too small to carry the header fields.
+    """
+    typ, _ = parse_tl_num(wire)
+    if typ == LpTypeNumber.LP_PACKET:
+        header = LpPacketValue.parse(parse_and_check_tl(wire, LpTypeNumber.LP_PACKET), ignore_critical=True)
+        payload = memoryview(header.fragment)
+        header.fragment = None
+    else:
+        header = LpPacketValue()
+        payload = memoryview(wire)
+    first_size = mtu - _FRAGMENT_OVERHEAD - header.encoded_length()
+    frag_size = mtu - _FRAGMENT_OVERHEAD
+    if first_size <= 0:
+        raise ValueError(f'MTU {mtu} is too small to carry an LpPacket fragment')
+    frag_count = 1 + max(0, (len(payload) - first_size + frag_size - 1) // frag_size)
+
+    ret = []
+    offset = 0
+    for i in range(frag_count):
+        value = header if i == 0 else LpPacketValue()
+        size = first_size if i == 0 else frag_size
+        value.sequence = (sequence + i) & 0xFFFFFFFFFFFFFFFF
+        value.frag_index = i
+        value.frag_count = frag_count
+        value.fragment = payload[offset:offset + size]
+        offset += size
+        lp_packet = LpPacket()
+        lp_packet.lp_packet = value
+        ret.append(lp_packet.encode())
+    return ret
@@ -84,6 +84,8 @@ class TlvModelMeta(abc.ABCMeta):
                         else:
                             cls._encoded_fields[index_dict[field.name]] = field
 
+        # Build the specialized encoder and parser for this class
+        cls._codec = _SpecializedCodec(cls._encoded_fields)
         return cls
 
 
@@ -105,6 +107,8 @@ class Field(metaclass=abc.ABCMeta):
         - If this field is not explicitly assigned to None before encoding,
           ``default`` is used.
     """
+    _marker_suffixes = ()
+
     def __init__(self, type_num: int, default=None):
         """
         Initialize a TLV field.
@@ -116,6 +120,17 @@ class Field(metaclass=abc.ABCMeta):
         self.type_num = type_num
         self.default = default
 
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        # Precompute marker keys, which are looked up on every encoding
+        self._name = value
+        for suffix in self._marker_suffixes:
+            self.__dict__[f'_{suffix}_key'] = f'{value}##{suffix}'
+
     def __get__(self, instance, owner):
         """
         Get the value of this field in a specific instance.
@@ -136,7 +151,7 @@ class Field(metaclass=abc.ABCMeta):
         :param instance: the instance whose field is being set.
         :param value: the new value.
         """
-        instance.__dict__[self.name] = value
+        instance.__dict__[self._name] = value
 
     def get_value(self, instance):
         """
@@ -146,7 +161,7 @@ class Field(metaclass=abc.ABCMeta):
         :param instance: the instance that this field is being accessed through.
         :return: the value of this field.
         """
-        return instance.__dict__.get(self.name, self.default)
+        return instance.__dict__.get(self._name, self.default)
 
     @abc.abstractmethod
     def encoded_length(self, val, markers: dict) -> int:
@@ -222,6 +237,8 @@ class ProcedureArgument(Field):
     It does not have a value.
     Instead, it provides a way to access a specific variable in ``markers``.
     """
+    _marker_suffixes = ('args',)
+
     def __init__(self, default=None):
         super().__init__(-1, default)
 
@@ -253,7 +270,7 @@ class ProcedureArgument(Field):
         :param markers: the markers dict.
         :return: its value.
         """
-        return markers.get(f'{self.name}##args', self.default)
+        return markers.get(self._args_key, self.default)
 
     def set_arg(self, markers: dict, val):
         """
@@ -262,7 +279,7 @@ class ProcedureArgument(Field):
         :param markers: the markers dict.
         :param val: the new value.
         """
-        markers[f'{self.name}##args'] = val
+        markers[self._args_key] = val
 
 
 class OffsetMarker(ProcedureArgument):
@@ -291,6 +308,8 @@ class UintField(Field):
     :ivar val_base_type: the base type of the value of the field.
         Can be int (default), an Enum or a Flag type.
     """
+    _marker_suffixes = ('encoded_length',)
+
     def __init__(self, type_num: int, default=None, fixed_len: int = None,
                  val_base_type=int):
         super().__init__(type_num, default)
@@ -314,7 +333,7 @@ class UintField(Field):
                 value = value.value
             else:
                 raise TypeError(f"Cannot convert {value} into a uint field.")
-        instance.__dict__[self.name] = value
+        instance.__dict__[self._name] = value
 
     def __get__(self, instance, owner):
         """
@@ -352,14 +371,14 @@ class UintField(Field):
                 ret = 8
         if val >= 0x100 ** ret:
             raise ValueError(f'{val} cannot be encoded into {ret} bytes')
-        markers[f'{self.name}##encoded_length'] = ret
+        markers[self._encoded_length_key] = ret
         return ret + tl_size
 
     def encode_into(self, val, markers: dict, wire: VarBinaryStr, offset: int) -> int:
         if val is None:
             return 0
         tl_size = get_tl_num_size(self.type_num) + 1
-        length = markers[f'{self.name}##encoded_length']
+        length = markers[self._encoded_length_key]
         offset += write_tl_num(self.type_num, wire, offset)
         if length == 1:
             struct.pack_into('!BB', wire, offset, 1, val)
@@ -415,6 +434,8 @@ class BoolField(Field):
 
 
 class SignatureValueField(Field):
+    _marker_suffixes = ('encoded_length', 'wire_length')
+
     def __init__(self,
                  type_num: int,
                  signer: ProcedureArgument,
@@ -436,7 +457,7 @@ class SignatureValueField(Field):
         else:
             sig_value_len = signer.get_signature_value_size()
             length = 1 + get_tl_num_size(sig_value_len) + sig_value_len
-            markers[f'{self.name}##encoded_length'] = sig_value_len
+            markers[self._encoded_length_key] = sig_value_len
             return length
 
     def encode_into(self, val, markers: dict, wire: VarBinaryStr, offset: int) -> int:
@@ -450,9 +471,9 @@ class SignatureValueField(Field):
                 sig_cover_part.append(wire[sig_cover_start:offset])
 
             origin_offset = offset
-            sig_value_len = markers[f'{self.name}##encoded_length']
+            sig_value_len = markers[self._encoded_length_key]
             offset += write_tl_num(self.type_num, wire, offset)
-            markers[f'{self.name}##wire_length'] = wire[offset:offset+1]
+            markers[self._wire_length_key] = wire[offset:offset+1]
             offset += write_tl_num(sig_value_len, wire, offset)
             self.value_buffer.set_arg(markers, wire[offset:offset + sig_value_len])
             offset += sig_value_len
@@ -461,14 +482,14 @@ class SignatureValueField(Field):
     def calculate_signature(self, markers: dict):
         signer = self.signer.get_arg(markers)
         if signer is not None:
-            sig_value_len = markers[f'{self.name}##encoded_length']
+            sig_value_len = markers[self._encoded_length_key]
             real_len = signer.write_signature_value(self.value_buffer.get_arg(markers),
                                                     self.covered_part.get_arg(markers))
             self.shrink_len.set_arg(markers, sig_value_len - real_len)
             if real_len != sig_value_len:
                 if sig_value_len >= 253:
                     raise ValueError(f'Long signatrue with flexible length is not supported: {sig_value_len} >= 253')
-                markers[f'{self.name}##wire_length'][0] = real_len
+                markers[self._wire_length_key][0] = real_len
 
     def parse_from(self, instance, markers: dict, wire: BinaryStr, offset: int, length: int, offset_btl: int):
         sig_buffer = memoryview(wire)[offset:offset+length]
@@ -483,6 +504,8 @@ class SignatureValueField(Field):
 
 
 class InterestNameField(Field):
+    _marker_suffixes = ('digest_pos', 'preprocessed_name', 'encoded_length')
+
     def __init__(self,
                  need_digest: ProcedureArgument,
                  signature_covered_part: ProcedureArgument,
@@ -528,20 +551,20 @@ class InterestNameField(Field):
                         raise ValueError('unnecessary ParametersSha256DigestComponent in name')
             else:
                 raise TypeError('invalid type for name component')
-        markers[f'{self.name}##digest_pos'] = digest_pos
-        markers[f'{self.name}##preprocessed_name'] = name
+        markers[self._digest_pos_key] = digest_pos
+        markers[self._preprocessed_name_key] = name
 
         length = reduce(lambda x, y: x + len(y), name, 0)
         if need_digest and digest_pos is None:
             length += 34
-        markers[f'{self.name}##encoded_length'] = length
+        markers[self._encoded_length_key] = length
         return 1 + get_tl_num_size(length) + length
 
     def encode_into(self, val, markers: dict, wire: VarBinaryStr, offset: int) -> int:
         origin_offset = offset
-        name_len = markers[f'{self.name}##encoded_length']
-        name = markers[f'{self.name}##preprocessed_name']
-        digest_pos = markers[f'{self.name}##digest_pos']
+        name_len = markers[self._encoded_length_key]
+        name = markers[self._preprocessed_name_key]
+        digest_pos = markers[self._digest_pos_key]
         need_digest = self.need_digest.get_arg(markers)
         sig_cover_part = self.sig_covered_part.get_arg(markers)
         digest_buf = None
@@ -561,7 +584,7 @@ class InterestNameField(Field):
         if offset > cover_start:
             sig_cover_part.append(wire[cover_start:offset])
         if need_digest and digest_pos is None:
-            markers[f'{self.name}##preprocessed_name'].append(wire[offset:offset+34])
+            name.append(wire[offset:offset+34])
             # If digest component does not exist, append one
             offset += write_tl_num(Component.TYPE_PARAMETERS_SHA256, wire, offset)
             offset += write_tl_num(32, wire, offset)
@@ -573,7 +596,7 @@ class InterestNameField(Field):
         return offset - origin_offset
 
     def get_final_name(self, markers):
-        return markers[f'{self.name}##preprocessed_name']
+        return markers[self._preprocessed_name_key]
 
     def parse_from(self, instance, markers: dict, wire: BinaryStr, offset: int, length: int, offset_btl: int):
         name = Name.decode(wire, offset_btl)[0]
@@ -593,6 +616,8 @@ class NameField(Field):
 
     Type: :any:`NonStrictName`
     """
+    _marker_suffixes = ('preprocessed_name', 'encoded_length_with_tl')
+
     def __init__(self, default=None, type_number=Name.TYPE_NAME):
         super().__init__(type_number, default)
 
@@ -602,6 +627,8 @@ class NameField(Field):
         name = val
         if isinstance(name, str):
             name = Name.from_str(name)
+        elif isinstance(name, Name.FrozenName):
+            name = name.to_bytes()
         elif not is_binary_str(name):
             if isinstance(name, Iterable):
                 name = list(name)
@@ -617,15 +644,15 @@ class NameField(Field):
             ret = Name.encoded_length(name)
         else:
             ret = len(name)
-        markers[f'{self.name}##preprocessed_name'] = name
-        markers[f'{self.name}##encoded_length_with_tl'] = ret
+        markers[self._preprocessed_name_key] = name
+        markers[self._encoded_length_with_tl_key] = ret
         return ret
 
     def encode_into(self, val, markers: dict, wire: VarBinaryStr, offset: int) -> int:
         if val is None:
             return 0
-        name = markers[f'{self.name}##preprocessed_name']
-        name_len_with_tl = markers[f'{self.name}##encoded_length_with_tl']
+        name = markers[self._preprocessed_name_key]
+        name_len_with_tl = markers[self._encoded_length_with_tl_key]
         if isinstance(name, list):
             Name.encode(name, wire, offset)
         else:
@@ -652,13 +679,12 @@ class BytesField(Field):
         self.is_string = is_string
 
     def __set__(self, instance, value):
-        instance.__dict__[self.name] = value
+        instance.__dict__[self._name] = value
 
     def __get__(self, instance, owner):
         if instance is None:
             return self
-        value = self.get_value(instance)
-        return value
+        return instance.__dict__.get(self._name, self.default)
 
     def encoded_length(self, val, markers: dict) -> int:
         if val is None:
@@ -687,14 +713,138 @@ class BytesField(Field):
             return ret
 
 
+_KIND_SINGLE = 0
+_KIND_REPEATED = 1
+_KIND_MAP = 2
+
+
+class _SpecializedCodec:
+    r"""
+    The encoder and parser specialized for the fields of one :any:`TlvModel` class.
+    It is built by :any:`TlvModelMeta` when the class is created, so that per-packet work only does lookups in
+    precomputed tables: a Type number to field dispatch table for parsing, and encoding plans that skip
+    fields which never produce any output.
+    The wire format is the same as the generic path in :any:`TlvModel`.
+    """
+    def __init__(self, fields: List['Field']):
+        self.fields = tuple(fields)
+        dispatch = {}
+        for i, field in enumerate(fields):
+            if field.type_num >= 0:
+                dispatch.setdefault(field.type_num, []).append(i)
+        self.dispatch = {typ: tuple(lst) for typ, lst in dispatch.items()}
+        self.kinds = tuple(_KIND_REPEATED if isinstance(field, RepeatedField)
+                           else _KIND_MAP if isinstance(field, MapField)
+                           else _KIND_SINGLE
+                           for field in fields)
+        self.skipping = tuple(i for i, field in enumerate(fields)
+                              if type(field).skipping_process is not Field.skipping_process)
+        # (name, default, getter, method). getter is None if the value can be read from __dict__ directly
+        self.length_plan = tuple(self._plan_item(field, field.encoded_length) for field in fields
+                                 if type(field).encoded_length is not ProcedureArgument.encoded_length)
+        self.encode_plan = tuple(self._plan_item(field, field.encode_into) for field in fields
+                                 if type(field).encode_into is not ProcedureArgument.encode_into)
+
+    @staticmethod
+    def _plan_item(field, method):
+        getter = None if type(field).get_value is Field.get_value else field.get_value
+        return field.name, field.default, getter, method
+
+    def encoded_length(self, model, markers: dict) -> int:
+        dct = model.__dict__
+        ret = 0
+        for name, default, getter, encoded_length in self.length_plan:
+            ret += encoded_length(dct.get(name, default) if getter is None else getter(model), markers)
+        markers['##encoded_length'] = ret
+        return ret
+
+    def encode_into(self, model, markers: dict, wire: VarBinaryStr, offset: int):
+        dct = model.__dict__
+        for name, default, getter, encode_into in self.encode_plan:
+            offset += encode_into(dct.get(name, default) if getter is None else getter(model), markers, wire, offset)
+
+    def parse(self, cls, wire: BinaryStr, markers: dict, ignore_critical: bool):
+        fields = self.fields
+        dispatch = self.dispatch
+        kinds = self.kinds
+        skipping = self.skipping
+        ret = cls.__new__(cls)
+        offset = 0
+        field_pos = 0
+        wire_len = len(wire)
+        while offset < wire_len:
+            # Read TL. Most Types and Lengths are 1 byte
+            offset_btl = offset
+            typ = wire[offset]
+            if typ <= 0xFC:
+                offset += 1
+            else:
+                typ, size_typ = parse_tl_num(wire, offset)
+                offset += size_typ
+            length = wire[offset]
+            if length <= 0xFC:
+                offset += 1
+            else:
+                length, size_len = parse_tl_num(wire, offset)
+                offset += size_len
+            # Search for field
+            i = -1
+            candidates = dispatch.get(typ)
+            if candidates is not None:
+                for j in candidates:
+                    if j >= field_pos:
+                        i = j
+                        break
+            if i >= 0:
+                # First process skipped fields
+                for j in skipping:
+                    if j >= i:
+                        break
+                    if j >= field_pos:
+                        fields[j].skipping_process(markers, wire, offset_btl)
+                # Parse that field
+                cur_field = fields[i]
+                cur_field.__set__(ret, cur_field.parse_from(ret, markers, wire, offset, length, offset_btl))
+                # Set next field
+                kind = kinds[i]
+                if kind == _KIND_SINGLE:
+                    field_pos = i + 1
+                elif kind == _KIND_REPEATED:
+                    field_pos = i
+                else:
+                    # Parse the value part for a map
+                    field_pos = i
+                    offset += length
+
+                    offset_btl = offset
+                    typ, size_typ = parse_tl_num(wire, offset)
+                    offset += size_typ
+                    length, size_len = parse_tl_num(wire, offset)
+                    offset += size_len
+
+                    cur_field.__set__(ret, cur_field.parse_value(ret, markers, wire, offset, length, offset_btl))
+            elif (typ & 1) == 1 and not ignore_critical:
+                raise DecodeError(f'a critical field of type {typ} is unrecognized, redundant or out-of-order')
+            offset += length
+        return ret
+
+
 class TlvModel(metaclass=TlvModelMeta):
     r"""
     Used to describe a TLV format.
 
     :ivar _encoded_fields: a list of :any:`Field` in order.
     :vartype _encoded_fields: List[Field]
+
+    :cvar use_specialized_codec: whether to encode and parse with the codec specialized for this class
+        when the class is created. ``True`` by default.
+        Setting it to ``False`` on :any:`TlvModel` or a subclass switches to the generic path,
+        which scans all fields for every TLV element. Both paths produce the same wire.
+    :vartype use_specialized_codec: bool
     """
     _encoded_fields: List[Field]
+    _codec: _SpecializedCodec
+    use_specialized_codec: bool = True
 
     def __repr__(self):
         values = ', '.join(f'{field.name}={field.__get__(self, None).__repr__()}' for field in self._encoded_fields)
@@ -747,6 +897,8 @@ class TlvModel(metaclass=TlvModelMeta):
         """
         if markers is None:
             markers = {}
+        if self.use_specialized_codec:
+            return self._codec.encoded_length(self, markers)
         ret = 0
         for field in self._encoded_fields:
             ret += field.encoded_length(field.get_value(self), markers)
@@ -780,6 +932,9 @@ class TlvModel(metaclass=TlvModelMeta):
         if wire is None:
             wire = bytearray(length)
         wire_view = memoryview(wire)
+        if self.use_specialized_codec:
+            self._codec.encode_into(self, markers, wire_view, offset)
+            return wire
         for field in self._encoded_fields:
             offset += field.encode_into(field.get_value(self), markers, wire_view, offset)
         return wire
@@ -799,6 +954,8 @@ class TlvModel(metaclass=TlvModelMeta):
         """
         if markers is None:
             markers = {}
+        if cls.use_specialized_codec:
+            return cls._codec.parse(cls, wire, markers, ignore_critical)
         offset = 0
         field_pos = 0
         ret = cls()
@@ -863,6 +1020,8 @@ class ModelField(Field):
     :ivar ignore_critical: whether to ignore critical fields (whose Types are odd).
     :vartype ignore_critical: :class:`bool`
     """
+    _marker_suffixes = ('encoded_length', 'inner_markers')
+
     def __init__(self,
                  type_num: int,
                  model_type: Type[TlvModel],
@@ -881,21 +1040,24 @@ class ModelField(Field):
             return 0
         if not isinstance(val, self.model_type):
             raise TypeError(f'{self.name}=f{val} is of type {self.model_type}')
-        copy_fields = {f.name for f in self.copy_in_fields}
-        inner_markers = {k: v
-                         for k, v in markers.items()
-                         if k.split('##')[0] in copy_fields}
+        if self.copy_in_fields:
+            copy_fields = {f.name for f in self.copy_in_fields}
+            inner_markers = {k: v
+                             for k, v in markers.items()
+                             if k.split('##')[0] in copy_fields}
+        else:
+            inner_markers = {}
         length = val.encoded_length(inner_markers)
-        markers[f'{self.name}##inner_markers'] = inner_markers
-        markers[f'{self.name}##encoded_length'] = length
+        markers[self._inner_markers_key] = inner_markers
+        markers[self._encoded_length_key] = length
         return get_tl_num_size(self.type_num) + get_tl_num_size(length) + length
 
     def encode_into(self, val, markers: dict, wire: VarBinaryStr, offset: int) -> int:
         if val is None:
             return 0
         else:
-            inner_markers = markers[f'{self.name}##inner_markers']
-            length = markers[f'{self.name}##encoded_length']
+            inner_markers = markers[self._inner_markers_key]
+            length = markers[self._encoded_length_key]
 
             origin_offset = offset
             offset += write_tl_num(self.type_num, wire, offset)
@@ -907,10 +1069,11 @@ class ModelField(Field):
     def parse_from(self, instance, markers: dict, wire: BinaryStr, offset: int, length: int, offset_btl: int):
         inner_markers = {}
         val = self.model_type.parse(memoryview(wire)[offset:offset+length], inner_markers, self.ignore_critical)
-        copy_fields = {f.name for f in self.copy_out_fields}
-        for k, v in inner_markers.items():
-            if k.split('##')[0] in copy_fields:
-                markers[k] = v
+        if self.copy_out_fields:
+            copy_fields = {f.name for f in self.copy_out_fields}
+            for k, v in inner_markers.items():
+                if k.split('##')[0] in copy_fields:
+                    markers[k] = v
         return val
 
 
@@ -936,9 +1099,9 @@ class RepeatedField(Field):
         self.element_type = element_type
 
     def get_value(self, instance):
-        if self.name not in instance.__dict__:
-            instance.__dict__[self.name] = []
-        return instance.__dict__[self.name]
+        if self._name not in instance.__dict__:
+            instance.__dict__[self._name] = []
+        return instance.__dict__[self._name]
 
     def encoded_length(self, val, markers: dict) -> int:
         if not val:
@@ -1011,9 +1174,9 @@ class MapField(Field):
         self.value_type = value_type
 
     def get_value(self, instance):
-        if self.name not in instance.__dict__:
-            instance.__dict__[self.name] = {}
-        return instance.__dict__[self.name]
+        if self._name not in instance.__dict__:
+            instance.__dict__[self._name] = {}
+        return instance.__dict__[self._name]
 
     def encoded_length(self, val, markers: dict) -> int:
         if not val:
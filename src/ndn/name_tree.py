@@ -18,7 +18,7 @@
 import asyncio as aio
 import dataclasses as dc
 from hashlib import sha256
-from typing import Optional
+from typing import Any, Iterator, NamedTuple, Optional
 from pygtrie import Trie
 from .encoding import InterestParam, FormalName, BinaryStr
 from .types import InterestNack, Validator, Route, DataTuple
@@ -34,6 +34,117 @@ class NameTrie(Trie):
         return path
 
 
+_MISSING = object()
+
+
+class FibMatch(NamedTuple):
+    key: FormalName
+    value: Any
+
+
+class NameFib:
+    """
+    A mapping from name prefixes to values, optimized for longest prefix match.
+
+    Prefixes are stored in one hash table per number of components, keyed by the encoded components.
+    A lookup encodes the name once and probes the tables from the longest prefix length in use down to the shortest,
+    so its cost depends on the number of distinct prefix lengths rather than the number of prefixes.
+    """
+    _tables: dict[int, dict[bytes, Any]]
+    _lengths: list[int]
+
+    def __init__(self):
+        self._tables = {}
+        self._lengths = []
+
+    @staticmethod
+    def _key(name: FormalName) -> bytes:
+        return b''.join(name)
+
+    def __getitem__(self, name: FormalName):
+        try:
+            return self._tables[len(name)][self._key(name)]
+        except KeyError:
+            raise KeyError(name) from None
+
+    def get(self, name: FormalName, default=None):
+        table = self._tables.get(len(name))
+        if table is None:
+            return default
+        return table.get(self._key(name), default)
+
+    def __setitem__(self, name: FormalName, value):
+        length = len(name)
+        table = self._tables.get(length)
+        if table is None:
+            table = {}
+            self._tables[length] = table
+            self._lengths = sorted(self._tables, reverse=True)
+        table[self._key(name)] = value
+
+    def setdefault(self, name: FormalName, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            self[name] = default
+            return default
+
+    def __delitem__(self, name: FormalName):
+        length = len(name)
+        table = self._tables.get(length)
+        if table is None:
+            raise KeyError(name)
+        try:
+            del table[self._key(name)]
+        except KeyError:
+            raise KeyError(name) from None
+        if not table:
+            del self._tables[length]
+            self._lengths = sorted(self._tables, reverse=True)
+
+    def __contains__(self, name: FormalName) -> bool:
+        table = self._tables.get(len(name))
+        return table is not None and self._key(name) in table
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self._tables.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._tables)
+
+    def itervalues(self) -> Iterator:
+        for table in self._tables.values():
+            yield from table.values()
+
+    def clear(self):
+        self._tables.clear()
+        self._lengths = []
+
+    def longest_prefix(self, name: FormalName) -> Optional[FibMatch]:
+        """
+        Find the longest prefix of a name in the FIB.
+
+        :param name: the name.
+        :return: the prefix and its value, or ``None`` if no prefix matches.
+        """
+        if not self._lengths:
+            return None
+        key = self._key(name)
+        # Walk back from the end of the encoded name, component by component
+        cur = len(name)
+        pos = len(key)
+        for length in self._lengths:
+            if length > cur:
+                continue
+            while cur > length:
+                cur -= 1
+                pos -= len(name[cur])
+            value = self._tables[length].get(key[:pos] if pos < len(key) else key, _MISSING)
+            if value is not _MISSING:
+                return FibMatch(name[:length], value)
+        return None
+
+
 @dc.dataclass
 class PendingIntEntry:
     future: aio.Future
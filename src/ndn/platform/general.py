@@ -68,3 +68,7 @@ class Platform(abc.ABC):
     @abc.abstractmethod
     async def open_unix_connection(self, path=None):
         pass
+
+    @abc.abstractmethod
+    async def create_unix_connection(self, protocol_factory, path=None):
+        pass
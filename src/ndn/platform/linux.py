@@ -47,3 +47,6 @@ class Linux(Platform):
 
     async def open_unix_connection(self, path=None):
         return await aio.open_unix_connection(path)
+
+    async def create_unix_connection(self, protocol_factory, path=None):
+        return await aio.get_running_loop().create_unix_connection(protocol_factory, path)
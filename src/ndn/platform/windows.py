@@ -167,6 +167,13 @@ class Win32(Platform):
         writer = aio.StreamWriter(transport, protocol, reader, loop)
         return reader, writer
 
+    async def create_unix_connection(self, protocol_factory, path=None):
+        """
+        Similar to `loop.create_unix_connection` but works on Windows.
+        """
+        loop = aio.events.get_running_loop()
+        return await Win32._create_unix_connection(loop, protocol_factory, path)
+
 
 class ReleaseGuard:
     def __init__(self):
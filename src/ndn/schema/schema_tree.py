@@ -19,8 +19,9 @@ import asyncio as aio
 from typing import Dict, Any, Type, Optional
 from dataclasses import dataclass
 from ..encoding import is_binary_str, FormalName, NonStrictName, Name, Component, \
-    SignaturePtrs, InterestParam, BinaryStr, MetaInfo, parse_data, TypeNumber
+    SignaturePtrs, InterestParam, BinaryStr, MetaInfo, parse_data, TypeNumber, Signer, DataTemplate
 from ..app import NDNApp
+from ..types import Validator
 from ..security import sha256_digest_checker, DigestSha256Signer
 from ..utils import gen_nonce
 from .util import norm_pattern
@@ -467,7 +468,8 @@ class MatchedNode:
         # Process Data
         return await self.node.process_data(self, meta_info, content, raw_packet)
 
-    async def express(self, app_param: Optional[BinaryStr] = None, **kwargs):
+    async def express(self, app_param: Optional[BinaryStr] = None, validator: Optional[Validator] = None,
+                      **kwargs):
         """
         Try to fetch the data, called by the node's need function.
         It will search the local cache, and examines the local resource.
@@ -479,6 +481,8 @@ class MatchedNode:
             This function only sends out an Interest packet when the Data is not cached locally.
 
         :param app_param: the ApplicationParameter of the Interest.
+        :param validator: the validator used instead of the :any:`DataValidator` policy.
+            For example, a Data fetched by its implicit digest needs no further verification.
         :param kwargs: other parameters of the Interest.
         :return: whatever ``process_data`` returns.
             Generally this function is only called at the default node,
@@ -506,11 +510,12 @@ class MatchedNode:
             if ac_policy and isinstance(ac_policy, policy.InterestEncryption):
                 app_param = await ac_policy.encrypt(self, app_param)
         # Get validator TODO: How can we pass information out?
-        validate_policy = self.policies.get(policy.DataValidator, None)
-        if validate_policy and isinstance(validate_policy, policy.DataValidator):
-            validator = validate_policy.get_validator(self)
-        else:
-            validator = sha256_digest_checker  # Change this if possible
+        if validator is None:
+            validate_policy = self.policies.get(policy.DataValidator, None)
+            if validate_policy and isinstance(validate_policy, policy.DataValidator):
+                validator = validate_policy.get_validator(self)
+            else:
+                validator = sha256_digest_checker  # Change this if possible
         # Get signer
         signer_policy = self.policies.get(policy.InterestSigning, None)
         if signer_policy and isinstance(signer_policy, policy.InterestSigning):
@@ -553,7 +558,22 @@ class MatchedNode:
         """
         return self.node.provide(self, content, **kwargs)
 
-    async def put_data(self, content: Optional[BinaryStr] = None, send_packet: bool = False, **kwargs):
+    def get_signer(self, **kwargs) -> Signer:
+        """
+        Get the signer used to sign Data packets produced under this node.
+
+        :param kwargs: other arguments from user input, used to select a key from the keychain
+            if there is no :any:`DataSigning` policy.
+        :return: the signer.
+        """
+        signer_policy = self.policies.get(policy.DataSigning, None)
+        if signer_policy and isinstance(signer_policy, policy.DataSigning):
+            return signer_policy.get_signer(self)
+        else:
+            return self.root.app.keychain.get_signer(kwargs)
+
+    async def put_data(self, content: Optional[BinaryStr] = None, send_packet: bool = False,
+                       template: Optional[DataTemplate] = None, **kwargs):
         """
         Generate the Data packet out of content.
         This function encrypts the content, encodes and signs the packet, saves it into the cache,
@@ -562,23 +582,24 @@ class MatchedNode:
 
         :param content: the Data content.
         :param send_packet: whether sends the Data packet to the face.
+        :param template: a :any:`DataTemplate` whose prefix is a prefix of this node's name.
+            If given, the MetaInfo and signer of the template are used instead of those from ``kwargs``.
         :param kwargs: other arguments generating the Data packet.
+        :return: the encoded Data packet.
         """
-        meta_info = MetaInfo.from_dict(kwargs)
         data_name = self.name
         # Encrypt content
         if content is not None:
             ac_policy = self.policies.get(policy.DataEncryption, None)
             if ac_policy and isinstance(ac_policy, policy.DataEncryption):
                 content = await ac_policy.encrypt(self, content)
-        # Get signer
-        signer_policy = self.policies.get(policy.DataSigning, None)
-        if signer_policy and isinstance(signer_policy, policy.DataSigning):
-            signer = signer_policy.get_signer(self)
-        else:
-            signer = self.root.app.keychain.get_signer(kwargs)
         # Prepare Data packet
-        raw_packet = self.root.app.prepare_data(data_name, content, meta_info=meta_info, signer=signer)
+        if template is not None:
+            raw_packet = template.make_data(b''.join(data_name[len(template.prefix):]), content)
+        else:
+            meta_info = MetaInfo.from_dict(kwargs)
+            signer = self.get_signer(**kwargs)
+            raw_packet = self.root.app.prepare_data(data_name, content, meta_info=meta_info, signer=signer)
         # Cache save
         cache_policy = self.policies.get(policy.Cache, None)
         if cache_policy and isinstance(cache_policy, policy.Cache):
@@ -587,6 +608,7 @@ class MatchedNode:
         # face.put
         if send_packet:
             self.root.app.put_raw_packet(raw_packet)
+        return raw_packet
 
     def app(self) -> NDNApp:
         """
@@ -16,7 +16,8 @@
 # limitations under the License.
 # -----------------------------------------------------------------------------
 import logging
-from ..encoding import FormalName, Name, BinaryStr, InterestParam
+from hashlib import sha256
+from ..encoding import FormalName, Name, Component, BinaryStr, InterestParam
 from ..name_tree import NameTrie
 from .schema_tree import MatchedNode
 from . import policy
@@ -33,10 +34,17 @@ class MemoryCache:
         """
         Search for the data packet that satisfying an Interest packet with name specified.
 
-        :param name: the Interest name.
+        :param name: the Interest name. If it ends with an implicit digest,
+            only the Data packet with that digest is returned.
         :param param: the parameters of the Interest. Not used in current implementation.
         :return: a raw Data packet or None.
         """
+        if name and Component.get_type(name[-1]) == Component.TYPE_IMPLICIT_SHA256:
+            packet = self.data.get(name[:-1], None)
+            if packet is not None and sha256(packet).digest() == Component.get_value(name[-1]):
+                return packet
+            logging.getLogger(__name__).debug(f'Cache miss: {Name.to_str(name)}')
+            return None
         try:
             return next(self.data.itervalues(prefix=name, shallow=True))
         except KeyError:
@@ -16,10 +16,14 @@
 # limitations under the License.
 # -----------------------------------------------------------------------------
 # TODO: Change these names
+from hashlib import sha256
 from .schema_tree import Node
 from .util import norm_pattern
-from ..encoding import Name, Component, TlvModel, NameField, ContentType
+from ..encoding import Name, Component, TlvModel, NameField, ContentType, MetaInfo, DataTemplate
+from ..security import DigestSha256Signer, sha256_digest_checker
 from ..types import InterestTimeout
+from ..app_support.manifest import MANIFEST_COMPONENT, DIGESTS_PER_MANIFEST, ManifestValue, split_digests, \
+    encode_manifest
 from ..utils import timestamp
 
 
@@ -52,6 +56,10 @@ class SegmentedNode(Node):
     whose name have a suffix "/seg=seg_no" attached to the object's name.
     The ``provide`` function handles segmentation, and the ``need`` function handles reassembly.
 
+    With ``manifest``, only a manifest ``/32=manifest/seg=seg_no`` listing the implicit digests of segments
+    is signed by the signer of the node. Segments are signed with DigestSha256 and fetched by their digests,
+    so one signature is verified for the whole object. See :any:`ManifestValue`.
+
     .. note::
 
         Currently, the fetching pipeline is a simple one-by-one pipeline.
@@ -60,18 +68,24 @@ class SegmentedNode(Node):
     SEGMENT_PATTERN = norm_pattern('<seg:seg_no>')[0]
     SEGMENT_SIZE = 4400
 
-    def __init__(self, parent=None, timeout=4000, retry_times=3, segment_size=SEGMENT_SIZE):
+    def __init__(self, parent=None, timeout=4000, retry_times=3, segment_size=SEGMENT_SIZE, manifest=False,
+                 digests_per_manifest=DIGESTS_PER_MANIFEST):
         super().__init__(parent)
         self._set(self.SEGMENT_PATTERN, Node())
         self.timeout = timeout
         self.retry_times = retry_times
         self.segment_size = segment_size
+        self.manifest = manifest
+        self.digests_per_manifest = digests_per_manifest
+        if manifest:
+            self['/32=manifest/<seg:seg_no>'] = Node()
 
-    async def retry(self, submatch, must_be_fresh):
+    async def retry(self, submatch, must_be_fresh, **kwargs):
         trial_times = 0
         while True:
             try:
-                return await submatch.need(must_be_fresh=must_be_fresh, lifetime=self.timeout, can_be_prefix=False)
+                return await submatch.need(must_be_fresh=must_be_fresh, lifetime=self.timeout, can_be_prefix=False,
+                                           **kwargs)
             except InterestTimeout:
                 trial_times += 1
                 if trial_times >= self.retry_times:
@@ -83,11 +97,25 @@ class SegmentedNode(Node):
         subname = match.name + [None]
         must_be_fresh = kwargs.get('must_be_fresh', True)
         contents = []
+        digests = []
+        manifest_index = 0
+        next_manifest = None
         cur = 0
         while True:
             subname[-1] = Component.from_segment(cur)
-            submatch = match.finer_match(subname)
-            segment, meta_data = await self.retry(submatch, must_be_fresh)
+            if self.manifest:
+                while cur >= len(digests):
+                    if manifest_index > 0 and next_manifest is None:
+                        raise ValueError(f'{Name.to_str(subname)} is not in the manifest')
+                    next_manifest = await self.need_manifest(match, manifest_index, next_manifest,
+                                                             must_be_fresh, digests)
+                    manifest_index += 1
+                digest = Component.from_bytes(digests[cur], Component.TYPE_IMPLICIT_SHA256)
+                submatch = match.finer_match(subname + [digest])
+                segment, meta_data = await self.retry(submatch, False, validator=sha256_digest_checker)
+            else:
+                submatch = match.finer_match(subname)
+                segment, meta_data = await self.retry(submatch, must_be_fresh)
             contents.append(segment)
             if meta_data['final_block_id'] == subname[-1]:
                 break
@@ -101,15 +129,76 @@ class SegmentedNode(Node):
         }
         return ret, meta_data_ret
 
+    async def need_manifest(self, match, index, digest, must_be_fresh, digests):
+        """
+        Fetch a manifest segment and append the segment digests it lists to ``digests``.
+        The first one is validated by the validator of the node. The others are fetched by their digests.
+
+        :param match: the matched node object of this node.
+        :param index: the segment number of the manifest.
+        :param digest: the implicit digest of the manifest segment, or ``None`` for the first one.
+        :param must_be_fresh: the MustBeFresh of the Interest for the first one.
+        :param digests: the segment digests known so far.
+        :return: the implicit digest of the next manifest segment, or ``None`` if it is the last one.
+        """
+        name = match.name + [MANIFEST_COMPONENT, Component.from_segment(index)]
+        if digest is None:
+            content, _ = await self.retry(match.finer_match(name), must_be_fresh)
+        else:
+            name.append(Component.from_bytes(digest, Component.TYPE_IMPLICIT_SHA256))
+            content, _ = await self.retry(match.finer_match(name), False, validator=sha256_digest_checker)
+        manifest = ManifestValue.parse(content, ignore_critical=True)
+        if not manifest.segment_digests:
+            raise ValueError(f'{Name.to_str(name)} lists no segment')
+        digests.extend(bytes(d) for d in manifest.segment_digests)
+        return bytes(manifest.next_manifest) if manifest.next_manifest else None
+
     async def provide(self, match, content, **kwargs):
         seg_cnt = (len(content) + self.segment_size - 1) // self.segment_size
         subname = match.name + [None]
         final_block_id = Component.from_segment(seg_cnt - 1)
+        manifest_kwargs = kwargs.copy()
+        kwargs['final_block_id'] = final_block_id
+        # All segments share the same MetaInfo and signer, so the Data packets are stamped out of one template
+        if self.manifest:
+            signer = DigestSha256Signer()
+        else:
+            subname[-1] = Component.from_segment(0)
+            signer = match.finer_match(subname).get_signer(**kwargs)
+        kwargs['template'] = DataTemplate(match.name, MetaInfo.from_dict(kwargs), signer)
+        digests = []
         for i in range(seg_cnt):
             subname[-1] = Component.from_segment(i)
             submatch = match.finer_match(subname)
-            kwargs['final_block_id'] = final_block_id
-            await submatch.provide(content[i*self.segment_size:(i+1)*self.segment_size], **kwargs)
+            wire = await submatch.provide(content[i*self.segment_size:(i+1)*self.segment_size], **kwargs)
+            if self.manifest:
+                digests.append(sha256(wire).digest())
+        if self.manifest:
+            await self.provide_manifest(match, digests, **manifest_kwargs)
+
+    async def provide_manifest(self, match, digests, **kwargs):
+        """
+        Produce the manifest segments listing the implicit digests of all segments.
+        The chain is built from the end, since every manifest segment contains the digest of the next one.
+        Only the first one is signed by the signer of the node.
+
+        :param match: the matched node object of this node.
+        :param digests: the implicit digests of all segments, in order.
+        :param kwargs: other arguments from user input.
+        """
+        chunks = split_digests(digests, self.digests_per_manifest)
+        prefix = match.name + [MANIFEST_COMPONENT]
+        kwargs['final_block_id'] = Component.from_segment(len(chunks) - 1)
+        template = DataTemplate(prefix, MetaInfo.from_dict(kwargs), DigestSha256Signer())
+        next_manifest = None
+        for i in reversed(range(len(chunks))):
+            submatch = match.finer_match(prefix + [Component.from_segment(i)])
+            manifest = encode_manifest(chunks[i], next_manifest)
+            if i > 0:
+                wire = await submatch.put_data(manifest, template=template)
+            else:
+                wire = await submatch.put_data(manifest, **kwargs)
+            next_manifest = sha256(wire).digest()
 
     async def process_int(self, match, param, app_param, raw_packet):
         if match.pos == len(match.name):
@@ -121,6 +210,8 @@ class RDRNode(Node):
     """
     RDRNode represents a versioned and segmented object whose encoding follows the RDR protocol.
     Its ``provide`` function generates the metadata packet, and ``need`` function handles version discovery.
+    Other keyword arguments are passed to the :any:`SegmentedNode` of versions,
+    e.g. ``manifest=True`` to sign one manifest per version instead of every segment.
     """
     class MetaDataValue(TlvModel):
         name = NameField()
@@ -20,7 +20,7 @@ import logging
 import os
 import sqlite3
 from typing import Iterator, Any
-from ...encoding import FormalName, BinaryStr, NonStrictName, Name
+from ...encoding import FormalName, BinaryStr, NonStrictName, Name, Signer
 from ...app_support.security_v2 import self_sign
 from ..signer.sha256_digest_signer import DigestSha256Signer
 from ..tpm.tpm import Tpm
@@ -445,7 +445,7 @@ class KeychainSqlite3(Keychain):
     tpm: Tpm
     path: str
     tpm_locator: str
-    _signer_cache: dict
+    _signer_cache: dict[Name.FrozenName, Signer]
 
     @staticmethod
     def initialize(path: str, tpm_scheme: str, tpm_path: str = '') -> bool:
@@ -633,11 +633,12 @@ class KeychainSqlite3(Keychain):
         key_locator_name = sign_args.get('key_locator', None)
         if not key_locator_name:
             key_locator_name = cert_name
-        key_locator_bytes = Name.to_bytes(key_locator_name)
-        signer = self._signer_cache.get(key_locator_bytes, None)
+        key_locator_name = Name.FrozenName(key_locator_name)
+        signer = self._signer_cache.get(key_locator_name, None)
         if not signer:
+            # The signer encodes the KeyLocator of every packet, which reuses the wire of a FrozenName
             signer = self.tpm.get_signer(key_name, key_locator_name)
-            self._signer_cache[key_locator_bytes] = signer
+            self._signer_cache[key_locator_name] = signer
         return signer
 
     def del_key(self, name: NonStrictName):
@@ -1,9 +1,11 @@
 from .digest_validator import sha256_digest_checker, params_sha256_checker, union_checker
 from .known_key_validator import verify_rsa, verify_ecdsa, verify_hmac, \
     EccChecker, RsaChecker, HmacChecker, verify_ed25519, Ed25519Checker
+from .verification_pool import verify_signature, VerificationPool
 
 
 __all__ = ['sha256_digest_checker', 'params_sha256_checker', 'union_checker',
            'verify_ecdsa', 'verify_rsa', 'verify_hmac',
            'EccChecker', 'RsaChecker', 'HmacChecker',
-           'verify_ed25519', 'Ed25519Checker']
+           'verify_ed25519', 'Ed25519Checker',
+           'verify_signature', 'VerificationPool']
@@ -22,6 +22,7 @@ from Cryptodome.PublicKey import ECC, RSA
 from ...encoding import FormalName, BinaryStr, SignatureType, Name, parse_data, SignaturePtrs
 from ...app import NDNApp, Validator, ValidationFailure, InterestTimeout, InterestNack
 from .known_key_validator import verify_rsa, verify_hmac, verify_ecdsa
+from .verification_pool import VerificationPool
 
 
 class PublicKeyStorage(abc.ABC):
@@ -43,7 +44,8 @@ class EmptyKeyStorage(PublicKeyStorage):
 
 
 class MemoryKeyStorage(PublicKeyStorage):
-    _cache: dict[bytes, bytes]
+    # A FrozenName key equals to the encoded Name, so it can be looked up without building a FrozenName
+    _cache: dict[Name.FrozenName, bytes]
 
     def __init__(self):
         self._cache = {}
@@ -52,7 +54,7 @@ class MemoryKeyStorage(PublicKeyStorage):
         return self._cache.get(Name.to_bytes(name), None)
 
     def save(self, name: FormalName, key_bits: bytes):
-        self._cache[Name.to_bytes(name)] = key_bits
+        self._cache[Name.FrozenName(name)] = key_bits
 
 
 class CascadeChecker:
@@ -61,11 +63,12 @@ class CascadeChecker:
     storage: Optional[PublicKeyStorage]
     anchor_key: bytes
     anchor_name: FormalName
+    pool: Optional[VerificationPool]
 
     @staticmethod
     def _verify_sig(pub_key_bits, sig_ptrs) -> bool:
         if sig_ptrs.signature_info.signature_type == SignatureType.HMAC_WITH_SHA256:
-            verify_hmac(pub_key_bits, sig_ptrs)
+            return verify_hmac(pub_key_bits, sig_ptrs)
         elif sig_ptrs.signature_info.signature_type == SignatureType.SHA256_WITH_RSA:
             pub_key = RSA.import_key(bytes(pub_key_bits))
             return verify_rsa(pub_key, sig_ptrs)
@@ -75,10 +78,13 @@ class CascadeChecker:
         else:
             return False
 
-    def __init__(self, app: NDNApp, trust_anchor: BinaryStr, storage: PublicKeyStorage = MemoryKeyStorage()):
+    def __init__(self, app: NDNApp, trust_anchor: BinaryStr, storage: PublicKeyStorage = MemoryKeyStorage(),
+                 pool: Optional[VerificationPool] = None):
         self.app = app
         self.next_level = self
         self.storage = storage
+        # Signatures other than the trust anchor's are verified in the pool, which defaults to the app's one
+        self.pool = pool if pool is not None else app.verification_pool
         cert_name, _, key_bits, sig_ptrs = parse_data(trust_anchor)
         self.anchor_name = [bytes(c) for c in cert_name]  # Copy the name in case
         self.anchor_key = bytes(key_bits)
@@ -115,6 +121,8 @@ class CascadeChecker:
         # Validate signature
         if not key_bits:
             return False
+        if self.pool is not None:
+            return await self.pool.verify(sig_ptrs.signature_info.signature_type, key_bits, sig_ptrs)
         return self._verify_sig(key_bits, sig_ptrs)
 
     def __call__(self, name: FormalName, sig_ptrs: SignaturePtrs) -> Coroutine[Any, None, bool]:
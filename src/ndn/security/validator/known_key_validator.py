@@ -16,12 +16,15 @@
 # limitations under the License.
 # -----------------------------------------------------------------------------
 import abc
+from typing import Optional, TYPE_CHECKING
 from Cryptodome.Hash import SHA256, HMAC
 from Cryptodome.PublicKey import ECC, RSA
 from Cryptodome.Signature import DSS, pkcs1_15, eddsa
 from ...encoding import FormalName, BinaryStr, NonStrictName, SignaturePtrs, Name, SignatureType
 from ...types import Validator
 from ...app_support.security_v2 import parse_certificate
+if TYPE_CHECKING:
+    from .verification_pool import VerificationPool
 
 
 def verify_ecdsa(pub_key: ECC.EccKey, sig_ptrs: SignaturePtrs) -> bool:
@@ -60,13 +63,24 @@ def verify_hmac(key: BinaryStr, sig_ptrs: SignaturePtrs) -> bool:
 
 
 class KnownChecker(abc.ABC):
+    sig_type: int = None
+
     @classmethod
     @abc.abstractmethod
     def _verify(cls, pub_key_bits, sig_ptrs) -> bool:
         pass
 
     @classmethod
-    def from_key(cls, key_name: NonStrictName, pub_key_bits: BinaryStr) -> Validator:
+    def from_key(cls, key_name: NonStrictName, pub_key_bits: BinaryStr,
+                 pool: Optional['VerificationPool'] = None) -> Validator:
+        """
+        Create a validator accepting packets signed by a known key.
+
+        :param key_name: the name of the key. Packets whose KeyLocator is not under it are rejected.
+        :param pub_key_bits: the public key in DER, or the HMAC key.
+        :param pool: if given, signatures are verified in it instead of on the event loop.
+        :return: the validator.
+        """
         key_name = Name.normalize(key_name)
 
         async def validator(_name: FormalName, sig_ptrs: SignaturePtrs) -> bool:
@@ -76,19 +90,25 @@ class KnownChecker(abc.ABC):
                 return False
             if not Name.is_prefix(key_name, sig_ptrs.signature_info.key_locator.name):
                 return False
+            if pool is not None:
+                if sig_ptrs.signature_info.signature_type != cls.sig_type:
+                    return False
+                return await pool.verify(cls.sig_type, pub_key_bits, sig_ptrs)
             return cls._verify(pub_key_bits, sig_ptrs)
 
         return validator
 
     @classmethod
-    def from_cert(cls, certificate: BinaryStr) -> Validator:
+    def from_cert(cls, certificate: BinaryStr, pool: Optional['VerificationPool'] = None) -> Validator:
         cert = parse_certificate(certificate)
         key_name = cert.name[:-2]
         key_bits = cert.content
-        return cls.from_key(key_name, key_bits)
+        return cls.from_key(key_name, key_bits, pool)
 
 
 class EccChecker(KnownChecker):
+    sig_type = SignatureType.SHA256_WITH_ECDSA
+
     @classmethod
     def _verify(cls, pub_key_bits, sig_ptrs) -> bool:
         if sig_ptrs.signature_info.signature_type != SignatureType.SHA256_WITH_ECDSA:
@@ -98,6 +118,8 @@ class EccChecker(KnownChecker):
 
 
 class RsaChecker(KnownChecker):
+    sig_type = SignatureType.SHA256_WITH_RSA
+
     @classmethod
     def _verify(cls, pub_key_bits, sig_ptrs) -> bool:
         if sig_ptrs.signature_info.signature_type != SignatureType.SHA256_WITH_RSA:
@@ -107,6 +129,8 @@ class RsaChecker(KnownChecker):
 
 
 class HmacChecker(KnownChecker):
+    sig_type = SignatureType.HMAC_WITH_SHA256
+
     @classmethod
     def _verify(cls, pub_key_bits, sig_ptrs) -> bool:
         if sig_ptrs.signature_info.signature_type != SignatureType.HMAC_WITH_SHA256:
@@ -124,6 +148,8 @@ def verify_ed25519(pub_key: ECC.EccKey, sig_ptrs: SignaturePtrs) -> bool:
 
 
 class Ed25519Checker(KnownChecker):
+    sig_type = SignatureType.ED25519
+
     @classmethod
     def _verify(cls, pub_key_bits, sig_ptrs) -> bool:
         if sig_ptrs.signature_info.signature_type != SignatureType.ED25519:
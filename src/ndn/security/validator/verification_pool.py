@@ -0,0 +1,143 @@
+# -----------------------------------------------------------------------------
+# Copyright (C) 2019-2022 The python-ndn authors
+#
+# This file is part of python-ndn.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+import asyncio as aio
+import logging
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Optional
+from Cryptodome.PublicKey import ECC, RSA
+from ...encoding import BinaryStr, SignaturePtrs, SignatureType
+from .known_key_validator import verify_ecdsa, verify_rsa, verify_hmac, verify_ed25519
+
+
+# A verification job: (signature type, key bits, signed portions, signature value), all in bytes
+_Job = tuple[int, bytes, list[bytes], bytes]
+
+
+def verify_signature(sig_type: int, key_bits: BinaryStr, sig_ptrs: SignaturePtrs) -> bool:
+    """
+    Verify a signature with a known key, importing the key first.
+
+    :param sig_type: the signature type.
+    :param key_bits: the public key in DER, or the HMAC key.
+    :param sig_ptrs: the signature pointers of the packet.
+    :return: ``True`` if the signature is valid. ``False`` if it is invalid,
+        the key cannot be imported or the type is unsupported.
+    """
+    try:
+        if sig_type == SignatureType.SHA256_WITH_ECDSA:
+            return verify_ecdsa(ECC.import_key(bytes(key_bits)), sig_ptrs)
+        elif sig_type == SignatureType.SHA256_WITH_RSA:
+            return verify_rsa(RSA.import_key(bytes(key_bits)), sig_ptrs)
+        elif sig_type == SignatureType.ED25519:
+            pub_key = ECC.import_key(bytes(key_bits))
+            if not isinstance(pub_key, ECC.EccKey):
+                return False
+            return verify_ed25519(pub_key, sig_ptrs)
+        elif sig_type == SignatureType.HMAC_WITH_SHA256:
+            return verify_hmac(key_bits, sig_ptrs)
+        else:
+            return False
+    except (ValueError, TypeError, IndexError):
+        return False
+
+
+def _verify_batch(jobs: list[_Job]) -> list[bool]:
+    # Run in the executor. Jobs only contain bytes so that they can be sent to other processes
+    return [verify_signature(sig_type, key_bits,
+                             SignaturePtrs(signature_covered_part=covered, signature_value_buf=value))
+            for sig_type, key_bits, covered, value in jobs]
+
+
+class VerificationPool:
+    """
+    Verify signatures in an executor instead of on the event loop.
+
+    Verifications requested in the same iteration of the event loop are spread over the workers of the executor,
+    in batches of at most ``max_batch``, to reduce the overhead per signature.
+    A batch is verified by a single worker, so small bursts are split into one batch per worker.
+    The default executor is a thread pool. PyCryptodome releases the GIL during public key operations,
+    so verifications scale across cores.
+    A :class:`concurrent.futures.ProcessPoolExecutor` also works, since jobs are sent as bytes.
+
+    :ivar executor: the executor running verifications.
+    :vartype executor: :class:`concurrent.futures.Executor`
+    :ivar max_batch: the maximum number of signatures verified in one call to the executor.
+    :vartype max_batch: int
+    :ivar max_workers: the number of workers of the executor, over which batches are spread.
+    :vartype max_workers: int
+    """
+    executor: Executor
+    max_batch: int
+    max_workers: int
+    _pending: list[tuple[_Job, aio.Future]]
+
+    def __init__(self, executor: Optional[Executor] = None, max_batch: int = 32):
+        if executor is None:
+            executor = ThreadPoolExecutor(thread_name_prefix='ndn-verify')
+        self.executor = executor
+        self.max_batch = max_batch
+        # Both ThreadPoolExecutor and ProcessPoolExecutor have it; assume one worker per core otherwise
+        self.max_workers = getattr(executor, '_max_workers', None) or os.cpu_count() or 1
+        self._pending = []
+        self.logger = logging.getLogger(__name__)
+
+    async def verify(self, sig_type: int, key_bits: BinaryStr, sig_ptrs: SignaturePtrs) -> bool:
+        """
+        Verify a signature in the executor. The parameters are the same as :any:`verify_signature`.
+
+        :return: ``True`` if the signature is valid.
+        """
+        job = (sig_type, bytes(key_bits), [bytes(part) for part in sig_ptrs.signature_covered_part],
+               bytes(sig_ptrs.signature_value_buf))
+        loop = aio.get_running_loop()
+        future = loop.create_future()
+        if not self._pending:
+            loop.call_soon(self._flush)
+        self._pending.append((job, future))
+        return await future
+
+    def _flush(self):
+        pending = self._pending
+        self._pending = []
+        size = min(self.max_batch, -(-len(pending) // self.max_workers))
+        for i in range(0, len(pending), size):
+            batch = pending[i:i + size]
+            aio.ensure_future(self._run_batch(batch))
+
+    async def _run_batch(self, batch: list[tuple[_Job, aio.Future]]):
+        try:
+            results = await aio.get_running_loop().run_in_executor(
+                self.executor, _verify_batch, [job for job, _ in batch])
+        except Exception as e:
+            self.logger.exception('Unable to verify signatures in the executor')
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def shutdown(self, wait: bool = True):
+        """
+        Shut down the executor.
+
+        :param wait: wait for running verifications to finish.
+        """
+        self.executor.shutdown(wait=wait)
@@ -72,4 +72,6 @@ class DummyFace(Face):
         siz, siz_len = parse_tl_num(packet, typ_len)
         offset = typ_len + siz_len
         assert len(packet) == offset + siz
-        await self.callback(typ, packet)
+        ret = self.callback(typ, packet)
+        if ret is not None:
+            await ret
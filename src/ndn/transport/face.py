@@ -16,15 +16,116 @@
 # limitations under the License.
 # -----------------------------------------------------------------------------
 import abc
-from typing import Any, Callable, Coroutine
+import asyncio as aio
+import logging
+import time
+from typing import Any, Callable, Coroutine, Iterable, Optional, Sequence
+
+
+PacketCallback = Callable[[int, bytes], Optional[Coroutine[Any, None, None]]]
+
+
+def dispatch_packet(callback: PacketCallback, typ: int, data: bytes):
+    """
+    Deliver a received packet to the callback of a face.
+    A synchronous callback is called inline.
+    If the callback is a coroutine function, the coroutine is run in a new Task.
+
+    :param callback: the callback.
+    :param typ: the Type of the packet.
+    :param data: the packet with TL.
+    """
+    try:
+        ret = callback(typ, data)
+    except Exception:
+        # Do not let an exception break the receiving loop of the face
+        logging.getLogger(__name__).exception('Unhandled exception when processing a received packet')
+        return
+    if ret is not None:
+        aio.ensure_future(ret)
 
 
 class Face(metaclass=abc.ABCMeta):
+    """
+    The base class of faces.
+
+    A face applies flow control to its sending buffer:
+    when more than ``high_watermark`` bytes are buffered, it becomes unwritable until the buffer
+    is drained below ``low_watermark``. ``send`` never blocks; await :meth:`wait_writable` before sending
+    to slow down instead of growing the buffer without limit.
+
+    :ivar high_watermark: the high watermark of the sending buffer in bytes. ``None`` means the asyncio default.
+    :vartype high_watermark: Optional[int]
+    :ivar low_watermark: the low watermark of the sending buffer in bytes. ``None`` means the asyncio default.
+    :vartype low_watermark: Optional[int]
+    :ivar blocked_time: the total time in seconds spent in :meth:`wait_writable`.
+    :vartype blocked_time: float
+    :ivar blocked_count: the number of times :meth:`wait_writable` had to wait.
+    :vartype blocked_count: int
+    """
     running: bool = False
-    callback: Callable[[int, bytes], Coroutine[Any, None, None]] = None
+    callback: PacketCallback = None
+    high_watermark: Optional[int] = None
+    low_watermark: Optional[int] = None
+    blocked_time: float = 0.0
+    blocked_count: int = 0
+    _writable: Optional[aio.Event] = None
 
     def __init__(self):
         self.running = False
+        self.blocked_time = 0.0
+        self.blocked_count = 0
+        self._writable = None
+
+    def set_write_buffer_limits(self, high: Optional[int] = None, low: Optional[int] = None):
+        """
+        Set the watermarks of the sending buffer. Takes effect on the next connection.
+
+        :param high: the high watermark in bytes.
+        :param low: the low watermark in bytes.
+        """
+        self.high_watermark = high
+        self.low_watermark = low
+
+    def _apply_write_buffer_limits(self, transport: aio.BaseTransport):
+        if self.high_watermark is not None or self.low_watermark is not None:
+            transport.set_write_buffer_limits(self.high_watermark, self.low_watermark)
+
+    def pause_writing(self):
+        """
+        Called by the transport when the sending buffer goes over the high watermark.
+        """
+        if self._writable is None:
+            self._writable = aio.Event()
+        self._writable.clear()
+
+    def resume_writing(self):
+        """
+        Called by the transport when the sending buffer is drained below the low watermark,
+        or the connection is lost.
+        """
+        if self._writable is not None:
+            self._writable.set()
+
+    @property
+    def writable(self) -> bool:
+        """
+        ``False`` if the sending buffer is over the high watermark.
+        """
+        return self._writable is None or self._writable.is_set()
+
+    async def wait_writable(self):
+        """
+        Wait until the sending buffer is below the low watermark. Returns immediately if it is writable.
+        """
+        if self.writable:
+            return
+        start = time.monotonic()
+        try:
+            await self._writable.wait()
+        finally:
+            self.blocked_time += time.monotonic() - start
+            self.blocked_count += 1
 
     @abc.abstractmethod
     async def open(self):
@@ -39,6 +140,24 @@ class Face(metaclass=abc.ABCMeta):
     def send(self, data: bytes):
         pass
 
+    def sendv(self, parts: Sequence[bytes]):
+        """
+        Send one packet given as a sequence of buffers, which are concatenated on the wire.
+        This avoids copying a large Data into a new buffer only to prepend a link layer header.
+
+        :param parts: the buffers.
+        """
+        self.send(b''.join(parts))
+
+    def send_many(self, packets: Iterable[bytes]):
+        """
+        Send multiple packets at once.
+
+        :param packets: the packets.
+        """
+        for packet in packets:
+            self.send(packet)
+
     @abc.abstractmethod
     async def run(self):
         pass
@@ -0,0 +1,193 @@
+# -----------------------------------------------------------------------------
+# Copyright (C) 2019-2020 The python-ndn authors
+#
+# This file is part of python-ndn.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+import dataclasses as dc
+import logging
+import struct
+import time
+from typing import Optional, List
+
+from ..encoding import BinaryStr, DecodeError
+from ..encoding.tlv_var import parse_tl_num
+from ..encoding.ndnlp_v2 import LpTypeNumber, LpPacket, LpPacketValue, make_lp_fragments
+from ..utils import gen_nonce_64
+
+
+_SEQUENCE_MASK = 0xFFFFFFFFFFFFFFFF
+
+
+class LpFragmenter:
+    """
+    Fragment outgoing packets longer than the MTU of a datagram face, following NDNLPv2.
+
+    :ivar mtu: the MTU of the face. ``None`` means no fragmentation.
+    :vartype mtu: Optional[int]
+    :ivar sequence: the Sequence of the next fragment.
+    :vartype sequence: int
+    """
+    mtu: Optional[int]
+    sequence: int
+
+    def __init__(self, mtu: Optional[int] = None):
+        self.mtu = mtu
+        self.sequence = gen_nonce_64()
+
+    def fragment(self, wire: BinaryStr) -> List[BinaryStr]:
+        """
+        Fragment a packet if it is longer than the MTU.
+
+        :param wire: a network layer packet or an LpPacket.
+        :return: a list of packets to send, which is ``[wire]`` if no fragmentation is needed.
+        """
+        if self.mtu is None or len(wire) <= self.mtu:
+            return [wire]
+        ret = make_lp_fragments(wire, self.mtu, self.sequence)
+        self.sequence = (self.sequence + len(ret)) & _SEQUENCE_MASK
+        return ret
+
+
+@dc.dataclass
+class _PartialPacket:
+    frag_count: int
+    deadline: float
+    fragments: list
+    received: int = 0
+    size: int = 0
+    header: Optional[LpPacketValue] = None
+
+
+class LpReassembler:
+    """
+    Reassemble NDNLPv2 fragments received from a datagram face.
+
+    Fragments of one packet are identified by Sequence minus FragIndex.
+    A partially received packet is dropped if it is not completed within ``timeout``,
+    or if the total size of buffered fragments exceeds ``max_buffer_size``, in which case the oldest ones go first.
+
+    :ivar timeout: the time in seconds to wait for the remaining fragments.
+    :vartype timeout: float
+    :ivar max_fragments: the maximum FragCount accepted.
+    :vartype max_fragments: int
+    :ivar max_buffer_size: the maximum total size in bytes of buffered fragments.
+    :vartype max_buffer_size: int
+    """
+    timeout: float
+    max_fragments: int
+    max_buffer_size: int
+    buffer_size: int
+    _partial: dict[int, _PartialPacket]
+
+    def __init__(self, timeout: float = 0.5, max_fragments: int = 400, max_buffer_size: int = 4 * 1024 * 1024):
+        self.timeout = timeout
+        self.max_fragments = max_fragments
+        self.max_buffer_size = max_buffer_size
+        self.buffer_size = 0
+        self._partial = {}
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def _is_fragment(wire: BinaryStr) -> bool:
+        # Sequence, FragIndex and FragCount are the first header fields if present
+        typ, offset = parse_tl_num(wire)
+        if typ != LpTypeNumber.LP_PACKET:
+            return False
+        _, size_len = parse_tl_num(wire, offset)
+        offset += size_len
+        if offset >= len(wire):
+            return False
+        typ, _ = parse_tl_num(wire, offset)
+        return typ in (LpTypeNumber.SEQUENCE, LpTypeNumber.FRAG_INDEX, LpTypeNumber.FRAG_COUNT)
+
+    def _drop(self, key: int):
+        entry = self._partial.pop(key)
+        self.buffer_size -= entry.size
+
+    def _cleanup(self, now: float):
+        # Entries are kept in the order of creation, so the expired ones are at the front
+        while self._partial:
+            key, entry = next(iter(self._partial.items()))
+            if entry.deadline > now and self.buffer_size <= self.max_buffer_size:
+                break
+            self._drop(key)
+
+    def receive(self, wire: BinaryStr) -> Optional[BinaryStr]:
+        """
+        Process a received packet.
+
+        :param wire: the received packet.
+        :return: ``wire`` itself if it is not a fragment, the reassembled packet if all fragments are received,
+            or ``None`` otherwise.
+            The reassembled packet is an LpPacket if the first fragment carries other header fields,
+            and a network layer packet otherwise.
+        """
+        try:
+            if not self._is_fragment(wire):
+                return wire
+            _, offset = parse_tl_num(wire)
+            _, size_len = parse_tl_num(wire, offset)
+            value = LpPacketValue.parse(memoryview(wire)[offset + size_len:], ignore_critical=True)
+        except (DecodeError, TypeError, ValueError, IndexError, struct.error):
+            self.logger.warning('Unable to decode received LpPacket')
+            return None
+        frag_index = value.frag_index or 0
+        frag_count = value.frag_count or 1
+        if frag_count == 1 and frag_index == 0:
+            return wire
+        if value.sequence is None or frag_index >= frag_count or frag_count > self.max_fragments:
+            self.logger.warning('Drop malformed LpPacket fragment')
+            return None
+
+        now = time.monotonic()
+        self._cleanup(now)
+        key = (value.sequence - frag_index) & _SEQUENCE_MASK
+        entry = self._partial.get(key)
+        if entry is None:
+            entry = _PartialPacket(frag_count, now + self.timeout, [None] * frag_count)
+            self._partial[key] = entry
+        elif entry.frag_count != frag_count:
+            self.logger.warning('Drop LpPacket fragments with inconsistent FragCount')
+            self._drop(key)
+            return None
+        if entry.fragments[frag_index] is not None:
+            return None
+        fragment = value.fragment if value.fragment is not None else b''
+        entry.fragments[frag_index] = fragment
+        entry.received += 1
+        entry.size += len(fragment)
+        self.buffer_size += len(fragment)
+        if frag_index == 0:
+            entry.header = value
+        if entry.received < frag_count:
+            if self.buffer_size > self.max_buffer_size:
+                self._cleanup(now)
+            return None
+
+        self._drop(key)
+        payload = b''.join(entry.fragments)
+        header = entry.header
+        header.sequence = None
+        header.frag_index = None
+        header.frag_count = None
+        header.fragment = None
+        header.tx_sequence = None
+        header.ack = []
+        if header.encoded_length() == 0:
+            return payload
+        header.fragment = payload
+        lp_packet = LpPacket()
+        lp_packet.lp_packet = header
+        return lp_packet.encode()
@@ -0,0 +1,217 @@
+# -----------------------------------------------------------------------------
+# Copyright (C) 2019-2020 The python-ndn authors
+#
+# This file is part of python-ndn.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+import asyncio as aio
+import dataclasses as dc
+import logging
+import struct
+import time
+from typing import Optional, Callable
+
+from ..encoding import BinaryStr, DecodeError
+from ..encoding.tlv_var import parse_tl_num, parse_and_check_tl
+from ..encoding.ndnlp_v2 import LpTypeNumber, LpPacket, LpPacketValue
+from ..utils import RttEstimator, gen_nonce
+
+
+@dc.dataclass
+class _UnackedFrame:
+    value: LpPacketValue
+    sent_time: float
+    retx_count: int
+    timer: aio.TimerHandle
+    greater_acks: int = 0
+
+
+class LpReliability:
+    """
+    NDNLPv2 link reliability for datagram faces.
+
+    Every outgoing LpPacket is assigned a TxSequence. Received TxSequences are acknowledged with Ack fields
+    piggybacked on outgoing LpPackets, or sent in an LpPacket without fragment if there is no traffic
+    within ``idle_ack_interval``.
+    An unacknowledged LpPacket is retransmitted with a new TxSequence when its RTO expires,
+    or when ``loss_detect_acks`` LpPackets sent after it are acknowledged.
+
+    :ivar send_func: the function sending a packet to the link.
+    :ivar mtu: the MTU of the face, used to limit the number of piggybacked Acks. ``None`` means no limit.
+    :vartype mtu: Optional[int]
+    :ivar max_retx: the maximum number of retransmissions of an LpPacket.
+    :vartype max_retx: int
+    :ivar idle_ack_interval: the time in seconds to hold Acks for piggybacking.
+    :vartype idle_ack_interval: float
+    :ivar rtt_estimator: the estimator giving the RTO.
+    :vartype rtt_estimator: :any:`RttEstimator`
+    """
+    # TxSequence field: 3-byte Type, 1-byte Length and 8-byte Value
+    HEADER_SIZE = 12
+    # TxSequence, plus the LpPacket and Fragment TLs (up to 4 bytes each) wrapped around an unfragmented packet
+    MAX_OVERHEAD = HEADER_SIZE + 8
+    ACK_SIZE = 12
+    MAX_ACKS_PER_PACKET = 64
+
+    send_func: Callable[[BinaryStr], None]
+    mtu: Optional[int]
+    max_retx: int
+    loss_detect_acks: int
+    idle_ack_interval: float
+    rtt_estimator: RttEstimator
+    _tx_sequence: int
+    _unacked: dict[int, _UnackedFrame]
+    _pending_acks: list[int]
+    _idle_ack_timer: Optional[aio.TimerHandle]
+
+    def __init__(self, send_func: Callable[[BinaryStr], None], mtu: Optional[int] = None, max_retx: int = 3,
+                 loss_detect_acks: int = 3, idle_ack_interval: float = 0.005,
+                 rtt_estimator: Optional[RttEstimator] = None):
+        self.send_func = send_func
+        self.mtu = mtu
+        self.max_retx = max_retx
+        self.loss_detect_acks = loss_detect_acks
+        self.idle_ack_interval = idle_ack_interval
+        if rtt_estimator is None:
+            rtt_estimator = RttEstimator(initial_rto=0.2, min_rto=0.01, max_rto=4.0)
+        self.rtt_estimator = rtt_estimator
+        # Start from a random 32-bit value so that it never wraps around
+        self._tx_sequence = gen_nonce()
+        self._unacked = {}
+        self._pending_acks = []
+        self._idle_ack_timer = None
+        self.logger = logging.getLogger(__name__)
+
+    def _take_acks(self, room: int) -> list[int]:
+        count = min(room, self.MAX_ACKS_PER_PACKET, len(self._pending_acks))
+        ret = self._pending_acks[:count]
+        del self._pending_acks[:count]
+        return ret
+
+    def _transmit(self, value: LpPacketValue, retx_count: int):
+        tx_sequence = self._tx_sequence
+        self._tx_sequence += 1
+        value.tx_sequence = tx_sequence
+        value.ack = []
+        if self._pending_acks:
+            if self.mtu is None:
+                room = self.MAX_ACKS_PER_PACKET
+            else:
+                room = max((self.mtu - value.encoded_length() - 4) // self.ACK_SIZE, 0)
+            value.ack = self._take_acks(room)
+        lp_packet = LpPacket()
+        lp_packet.lp_packet = value
+        wire = lp_packet.encode()
+
+        timer = aio.get_running_loop().call_later(self.rtt_estimator.rto, self._on_timeout, tx_sequence)
+        self._unacked[tx_sequence] = _UnackedFrame(value, time.monotonic(), retx_count, timer)
+        self.send_func(wire)
+
+    def _retransmit(self, frame: _UnackedFrame):
+        if frame.retx_count >= self.max_retx:
+            self.logger.debug('Drop an LpPacket after %d retransmissions' % frame.retx_count)
+            return
+        self._transmit(frame.value, frame.retx_count + 1)
+
+    def _on_timeout(self, tx_sequence: int):
+        frame = self._unacked.pop(tx_sequence, None)
+        if frame is None:
+            return
+        self.rtt_estimator.backoff()
+        self._retransmit(frame)
+
+    def _on_ack(self, tx_sequence: int, now: float):
+        frame = self._unacked.pop(tx_sequence, None)
+        if frame is None:
+            return
+        frame.timer.cancel()
+        # Karn's algorithm: no RTT sample from retransmitted frames
+        if frame.retx_count == 0:
+            self.rtt_estimator.add_measurement(now - frame.sent_time)
+        lost = []
+        # Unacked frames are ordered by TxSequence
+        for seq, other in self._unacked.items():
+            if seq > tx_sequence:
+                break
+            other.greater_acks += 1
+            if other.greater_acks >= self.loss_detect_acks:
+                lost.append(seq)
+        for seq in lost:
+            other = self._unacked.pop(seq)
+            other.timer.cancel()
+            self._retransmit(other)
+
+    def _send_idle_acks(self):
+        self._idle_ack_timer = None
+        while self._pending_acks:
+            value = LpPacketValue()
+            value.ack = self._take_acks(self.MAX_ACKS_PER_PACKET if self.mtu is None
+                                        else max((self.mtu - 4) // self.ACK_SIZE, 1))
+            lp_packet = LpPacket()
+            lp_packet.lp_packet = value
+            self.send_func(lp_packet.encode())
+
+    def send(self, wire: BinaryStr):
+        """
+        Send a packet reliably.
+
+        :param wire: a network layer packet or an LpPacket.
+        """
+        typ, _ = parse_tl_num(wire)
+        if typ == LpTypeNumber.LP_PACKET:
+            value = LpPacketValue.parse(parse_and_check_tl(wire, LpTypeNumber.LP_PACKET), ignore_critical=True)
+        else:
+            value = LpPacketValue()
+            value.fragment = wire
+        self._transmit(value, 0)
+
+    def receive(self, wire: BinaryStr) -> Optional[BinaryStr]:
+        """
+        Process the Ack and TxSequence fields of a received packet.
+
+        :param wire: the received packet.
+        :return: ``wire`` itself, or ``None`` if it only carries Acks.
+        """
+        typ, _ = parse_tl_num(wire)
+        if typ != LpTypeNumber.LP_PACKET:
+            return wire
+        try:
+            value = LpPacketValue.parse(parse_and_check_tl(wire, LpTypeNumber.LP_PACKET), ignore_critical=True)
+        except (DecodeError, TypeError, ValueError, IndexError, struct.error):
+            # Leave it to the upper layer
+            return wire
+        if value.ack:
+            now = time.monotonic()
+            for tx_sequence in value.ack:
+                self._on_ack(tx_sequence, now)
+        if value.tx_sequence is not None:
+            self._pending_acks.append(value.tx_sequence)
+            if self._idle_ack_timer is None:
+                self._idle_ack_timer = aio.get_running_loop().call_later(self.idle_ack_interval,
+                                                                         self._send_idle_acks)
+        if value.fragment is None:
+            return None
+        return wire
+
+    def shutdown(self):
+        """
+        Cancel all timers and drop unacknowledged packets.
+        """
+        for frame in self._unacked.values():
+            frame.timer.cancel()
+        self._unacked = {}
+        self._pending_acks = []
+        if self._idle_ack_timer is not None:
+            self._idle_ack_timer.cancel()
+            self._idle_ack_timer = None
@@ -23,6 +23,8 @@ import abc
 import typing
 from .. import encoding as enc
 from .prefix_registerer import PrefixRegisterer
+from .lp_fragment import LpFragmenter, LpReassembler
+from .lp_reliability import LpReliability
 from . import face
 
 
@@ -94,27 +96,48 @@ class NdnDpdkUdpFace(NdnDpdkFace):
     class PacketHandler(aio.DatagramProtocol):
         def __init__(self,
                      callback: typing.Callable[[int, bytes], typing.Coroutine[any, None, None]],
-                     close: aio.Future) -> None:
+                     close: aio.Future,
+                     reassembler: LpReassembler,
+                     reliability: typing.Optional[LpReliability],
+                     owner: face.Face) -> None:
             super().__init__()
+            self.face = owner
             self.callback = callback
             self.close = close
+            self.reassembler = reassembler
+            self.reliability = reliability
             self.transport = None
 
         def connection_made(self, transport: aio.DatagramTransport):
             self.transport = transport
+            self.face._apply_write_buffer_limits(transport)
 
         def datagram_received(self, data: bytes, _addr: tuple[str, int]):
+            if self.reliability is not None:
+                data = self.reliability.receive(data)
+                if data is None:
+                    return
+            data = self.reassembler.receive(data)
+            if data is None:
+                return
             typ, _ = enc.parse_tl_num(data)
-            aio.create_task(self.callback(typ, data))
+            face.dispatch_packet(self.callback, typ, data)
 
         def send(self, data):
             self.transport.sendto(data)
 
+        def pause_writing(self):
+            self.face.pause_writing()
+
+        def resume_writing(self):
+            self.face.resume_writing()
+
         def error_received(self, exc: Exception):
             self.close.set_result(True)
             logging.getLogger(__name__).warning(exc)
 
         def connection_lost(self, exc):
+            self.face.resume_writing()
             if not self.close.done():
                 self.close.set_result(True)
             if exc:
@@ -127,19 +150,28 @@ class NdnDpdkUdpFace(NdnDpdkFace):
     handler: typing.Optional[PacketHandler]
 
     def __init__(self, gql_url: str, self_addr: str, self_port: int,
-                 dpdk_addr: str, dpdk_port: int):
+                 dpdk_addr: str, dpdk_port: int, mtu: typing.Optional[int] = None, reliable: bool = False):
         super().__init__(gql_url)
         self.self_addr = self_addr
         self.self_port = self_port
         self.dpdk_addr = dpdk_addr
         self.dpdk_port = dpdk_port
         self.handler = None
+        if reliable:
+            self.reliability = LpReliability(self._send_datagram, mtu)
+            if mtu is not None:
+                mtu -= LpReliability.MAX_OVERHEAD
+        else:
+            self.reliability = None
+        self.fragmenter = LpFragmenter(mtu)
+        self.reassembler = LpReassembler()
 
     async def open(self):
         # Start UDP listener
         loop = aio.get_running_loop()
         self.running = True
-        self.handler = NdnDpdkUdpFace.PacketHandler(self.callback, loop.create_future())
+        self.handler = NdnDpdkUdpFace.PacketHandler(self.callback, loop.create_future(), self.reassembler,
+                                                    self.reliability, self)
         await loop.create_datagram_endpoint(
             lambda: self.handler,
             local_addr=(self.self_addr, self.self_port),
@@ -159,12 +191,21 @@ class NdnDpdkUdpFace(NdnDpdkFace):
 
             # Send GraphQL command
             aio.create_task(self.client.delete(self.face_id))
+            if self.reliability is not None:
+                self.reliability.shutdown()
             self.handler.shutdown()
             self.face_id = ""
 
+    def _send_datagram(self, data: bytes):
+        self.handler.send(data)
+
     def send(self, data: bytes):
         if self.handler is not None:
-            self.handler.send(data)
+            for packet in self.fragmenter.fragment(data):
+                if self.reliability is not None:
+                    self.reliability.send(packet)
+                else:
+                    self.handler.send(packet)
         else:
             raise RuntimeError('Unable to send packet before connection')
 
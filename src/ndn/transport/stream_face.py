@@ -17,52 +17,188 @@
 # -----------------------------------------------------------------------------
 import abc
 import asyncio as aio
-import io
-from typing import Optional
+import logging
+from typing import Iterable, Optional, Sequence
 
 from ndn.transport.ip_face import IpFace
 
-from ..encoding.tlv_var import read_tl_num_from_stream
+from ..encoding.tlv_var import parse_tl_num
 from ..platform import Platform
-from .face import Face
+from .face import Face, dispatch_packet
+
+
+MAX_NDN_PACKET_SIZE = 8800
+
+
+def _tl_num_size(first_byte: int) -> int:
+    if first_byte <= 0xFC:
+        return 1
+    elif first_byte == 0xFD:
+        return 3
+    elif first_byte == 0xFE:
+        return 5
+    else:
+        return 9
+
+
+class _StreamProtocol(aio.BufferedProtocol):
+    # The receive buffer is never overwritten once a packet is received into it.
+    # When it is running out of space, a new one is allocated and the incomplete packet is moved there.
+    # Therefore, packets can be passed up as memoryviews without copying.
+    BUFFER_SIZE = 256 * 1024
+    MIN_FREE_SPACE = 16 * 1024
+
+    def __init__(self, face: 'StreamFace'):
+        self.face = face
+        self.buf = bytearray(self.BUFFER_SIZE)
+        self.view = memoryview(self.buf)
+        self.start = 0
+        self.end = 0
+        self.needed = 0
+        self.transport = None
+        self.closed = aio.get_running_loop().create_future()
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        free_space = len(self.buf) - self.end
+        if free_space < self.MIN_FREE_SPACE or self.start + self.needed > len(self.buf):
+            size = max(self.BUFFER_SIZE, self.needed, self.end - self.start + self.MIN_FREE_SPACE)
+            buf = bytearray(size)
+            buf[:self.end - self.start] = self.view[self.start:self.end]
+            self.end -= self.start
+            self.start = 0
+            self.buf = buf
+            self.view = memoryview(buf)
+        return self.view[self.end:]
+
+    def buffer_updated(self, nbytes: int):
+        self.end += nbytes
+        buf = self.view
+        start = self.start
+        end = self.end
+        callback = self.face.callback
+        self.needed = 0
+        while end - start >= 2:
+            typ_size = _tl_num_size(buf[start])
+            if end - start < typ_size + 1:
+                break
+            len_size = _tl_num_size(buf[start + typ_size])
+            if end - start < typ_size + len_size:
+                break
+            typ, _ = parse_tl_num(buf, start)
+            siz, _ = parse_tl_num(buf, start + typ_size)
+            if typ_size + len_size + siz > self.face.max_packet_size:
+                # Do not allocate a buffer for whatever length the peer claims
+                logging.getLogger(__name__).warning(f'Packet of {siz} bytes exceeds the maximum size, closing')
+                self.start = self.end = 0
+                self.transport.close()
+                return
+            pkt_end = start + typ_size + len_size + siz
+            if pkt_end > end:
+                self.needed = pkt_end - start
+                break
+            dispatch_packet(callback, typ, buf[start:pkt_end])
+            start = pkt_end
+        self.start = start
+
+    def connection_made(self, transport: aio.BaseTransport):
+        self.transport = transport
+        self.face._apply_write_buffer_limits(transport)
+
+    def pause_writing(self):
+        self.face.pause_writing()
+
+    def resume_writing(self):
+        self.face.resume_writing()
+
+    def eof_received(self):
+        # Close the transport
+        return False
+
+    def connection_lost(self, exc: Optional[Exception]):
+        self.face.running = False
+        # Release the senders waiting for buffer space
+        self.face.resume_writing()
+        if exc:
+            logging.getLogger(__name__).warning(exc)
+        if not self.closed.done():
+            self.closed.set_result(True)
 
 
 class StreamFace(Face, metaclass=abc.ABCMeta):
-    reader: Optional[aio.StreamReader] = None
-    writer: Optional[aio.StreamWriter] = None
+    """
+    A face over a stream transport.
+
+    :ivar coalesce: if ``True``, packets sent in one iteration of the event loop are written to the transport
+        together at the end of the iteration, which takes fewer system calls when replying to bursts of Interests.
+    :vartype coalesce: bool
+    :ivar max_packet_size: the maximum size of a received packet.
+        The connection is closed if the peer sends a longer one.
+    :vartype max_packet_size: int
+    """
+    transport: Optional[aio.Transport] = None
+    protocol: Optional[_StreamProtocol] = None
+    coalesce: bool = False
+    max_packet_size: int = MAX_NDN_PACKET_SIZE
+    _pending: list
+
+    def __init__(self, coalesce: bool = False, max_packet_size: int = MAX_NDN_PACKET_SIZE):
+        super().__init__()
+        self.coalesce = coalesce
+        self.max_packet_size = max_packet_size
+        self._pending = []
 
     def shutdown(self):
         self.running = False
-        if self.writer:
-            self.writer.close()
-            self.writer = None
+        if self.transport:
+            self._flush()
+            self.transport.close()
+            self.transport = None
 
     async def run(self):
-        while self.running:
-            try:
-                bio = io.BytesIO()
-                typ = await read_tl_num_from_stream(self.reader, bio)
-                siz = await read_tl_num_from_stream(self.reader, bio)
-                bio.write(await self.reader.readexactly(siz))
-                buf = bio.getvalue()
-                aio.create_task(self.callback(typ, buf))
-            except (aio.IncompleteReadError, ConnectionResetError):
-                self.shutdown()
+        if self.protocol is not None:
+            await self.protocol.closed
+        self.shutdown()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        pending = self._pending
+        self._pending = []
+        if self.transport is not None:
+            self.transport.writelines(pending)
+
+    def _write(self, parts: Sequence[bytes]):
+        if not self.coalesce:
+            self.transport.writelines(parts)
+            return
+        if not self._pending:
+            aio.get_running_loop().call_soon(self._flush)
+        self._pending.extend(parts)
 
     def send(self, data: bytes):
-        self.writer.write(data)
+        if self.coalesce:
+            self._write((data,))
+        else:
+            self.transport.write(data)
+
+    def sendv(self, parts: Sequence[bytes]):
+        self._write(parts)
+
+    def send_many(self, packets: Iterable[bytes]):
+        self._write(list(packets))
 
 
 class UnixFace(StreamFace):
     path: str = '/run/nfd.sock'
 
-    def __init__(self, path: str = ''):
-        super().__init__()
+    def __init__(self, path: str = '', coalesce: bool = False, max_packet_size: int = MAX_NDN_PACKET_SIZE):
+        super().__init__(coalesce, max_packet_size)
         if path:
             self.path = path
 
     async def open(self):
-        self.reader, self.writer = await Platform().open_unix_connection(self.path)
+        self.transport, self.protocol = await Platform().create_unix_connection(
+            lambda: _StreamProtocol(self), self.path)
         self.running = True
 
     def isLocalFace(self):
@@ -73,13 +209,15 @@ class TcpFace(StreamFace, IpFace):
     host: str = '127.0.0.1'
     port: int = 6363
 
-    def __init__(self, host: str = '', port: int = 0):
-        super().__init__()
+    def __init__(self, host: str = '', port: int = 0, coalesce: bool = False,
+                 max_packet_size: int = MAX_NDN_PACKET_SIZE):
+        super().__init__(coalesce, max_packet_size)
         if host:
             self.host = host
         if port:
             self.port = port
 
     async def open(self):
-        self.reader, self.writer = await aio.open_connection(self.host, self.port)
+        self.transport, self.protocol = await aio.get_running_loop().create_connection(
+            lambda: _StreamProtocol(self), self.host, self.port)
         self.running = True
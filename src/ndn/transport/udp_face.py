@@ -17,45 +17,74 @@
 # -----------------------------------------------------------------------------
 import asyncio as aio
 import logging
-from typing import Tuple
+from typing import Tuple, Optional
 
 from ..encoding.tlv_var import parse_tl_num
 from .ip_face import IpFace
+from .face import dispatch_packet
+from .lp_fragment import LpFragmenter, LpReassembler
+from .lp_reliability import LpReliability
 
 
 class UdpFace(IpFace):
 
-    def __init__(self, host: str = '127.0.0.1', port: int = 6363):
+    def __init__(self, host: str = '127.0.0.1', port: int = 6363, mtu: Optional[int] = None,
+                 reliable: bool = False):
         super().__init__()
         self.host = host
         self.port = port
+        if reliable:
+            self.reliability = LpReliability(self._send_datagram, mtu)
+            if mtu is not None:
+                mtu -= LpReliability.MAX_OVERHEAD
+        else:
+            self.reliability = None
+        self.fragmenter = LpFragmenter(mtu)
+        self.reassembler = LpReassembler()
 
     async def open(self):
 
         class PacketHandler:
 
-            def __init__(self, callback, close) -> None:
+            def __init__(self, callback, close, reassembler, reliability, face) -> None:
+                self.face = face
                 self.callback = callback
                 self.close = close
+                self.reassembler = reassembler
+                self.reliability = reliability
 
             def connection_made(
                     self, transport: aio.DatagramTransport) -> None:
                 self.transport = transport
+                self.face._apply_write_buffer_limits(transport)
 
             def datagram_received(
                     self, data: bytes, addr: Tuple[str, int]) -> None:
+                if self.reliability is not None:
+                    data = self.reliability.receive(data)
+                    if data is None:
+                        return
+                data = self.reassembler.receive(data)
+                if data is None:
+                    return
                 typ, _ = parse_tl_num(data)
-                aio.create_task(self.callback(typ, data))
-                return
+                dispatch_packet(self.callback, typ, data)
 
             def send(self, data):
                 self.transport.sendto(data)
 
+            def pause_writing(self):
+                self.face.pause_writing()
+
+            def resume_writing(self):
+                self.face.resume_writing()
+
             def error_received(self, exc: Exception) -> None:
                 self.close.set_result(True)
                 logging.getLogger(__name__).warning(exc)
 
             def connection_lost(self, exc):
+                self.face.resume_writing()
                 if not self.close.done():
                     self.close.set_result(True)
                 if exc:
@@ -64,7 +93,7 @@ class UdpFace(IpFace):
         loop = aio.get_running_loop()
         self.running = True
         close = loop.create_future()
-        handler = PacketHandler(self.callback, close)
+        handler = PacketHandler(self.callback, close, self.reassembler, self.reliability, self)
         transport, _ = await loop.create_datagram_endpoint(
             lambda: handler,
             remote_addr=(self.host, self.port))
@@ -75,9 +104,18 @@ class UdpFace(IpFace):
     async def run(self):
         await self.close
 
-    def send(self, data: bytes):
+    def _send_datagram(self, data: bytes):
         self.handler.send(data)
 
+    def send(self, data: bytes):
+        for packet in self.fragmenter.fragment(data):
+            if self.reliability is not None:
+                self.reliability.send(packet)
+            else:
+                self.handler.send(packet)
+
     def shutdown(self):
         self.running = False
+        if self.reliability is not None:
+            self.reliability.shutdown()
         self.transport.close()
@@ -15,8 +15,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # -----------------------------------------------------------------------------
+import asyncio as aio
+import heapq
+import itertools
+import logging
+import sys
 import time
 from random import randint
+from typing import Any, Callable, Coroutine, Optional
+
+
+_EAGER_START = sys.version_info >= (3, 12)
 
 
 def timestamp():
@@ -44,3 +53,145 @@ def gen_nonce_64():
     :return: a random 64-bit unsigned integer.
     """
     return randint(1, 2 ** 64 - 1)
+
+
+def run_eagerly(coro: Coroutine) -> Optional[aio.Task]:
+    """
+    Run a coroutine in a Task which starts eagerly, i.e. runs synchronously until the coroutine finishes
+    or suspends for the first time.
+    This saves scheduling a Task for coroutines that rarely await, like most packet validators.
+    The coroutine always runs in its own Task, so ``asyncio.timeout`` and ``current_task()`` work as usual.
+
+    Eager start requires Python 3.12. On older versions, the Task is started by the event loop as usual.
+
+    :param coro: the coroutine.
+    :return: ``None`` if the coroutine finishes without suspending, otherwise the Task running the rest.
+
+    :raises Exception: any exception raised by the coroutine before it suspends.
+    """
+    if not _EAGER_START:
+        return aio.create_task(coro)
+    task = aio.Task(coro, loop=aio.get_running_loop(), eager_start=True)
+    if not task.done():
+        return task
+    # Raise the exception if there is any
+    task.result()
+    return None
+
+
+class DeadlineQueue:
+    """
+    Call a function on items when their deadlines expire, using one timer of the event loop for all items.
+    Items are expired in batches, at most ``resolution`` seconds later than their deadlines.
+
+    Items cannot be removed. The callback is supposed to ignore items that are no longer relevant.
+
+    :ivar callback: the function called with each expired item.
+    :ivar resolution: the granularity of deadlines in seconds.
+    :vartype resolution: float
+    """
+    callback: Callable[[Any], None]
+    resolution: float
+    _heap: list
+    _timer: Optional[aio.TimerHandle]
+
+    def __init__(self, callback: Callable[[Any], None], resolution: float = 0.001):
+        self.callback = callback
+        self.resolution = resolution
+        self._heap = []
+        self._counter = itertools.count()
+        self._timer = None
+        self._timer_deadline = 0.0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def add(self, deadline: float, item: Any):
+        """
+        Add an item.
+
+        :param deadline: the deadline in the time of the running event loop.
+        :param item: the item.
+        """
+        heapq.heappush(self._heap, (deadline, next(self._counter), item))
+        if self._timer is None or deadline + self.resolution < self._timer_deadline:
+            self._schedule()
+
+    def _schedule(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._heap:
+            self._timer_deadline = self._heap[0][0] + self.resolution
+            self._timer = aio.get_running_loop().call_at(self._timer_deadline, self._on_timer)
+
+    def _on_timer(self):
+        self._timer = None
+        now = aio.get_running_loop().time()
+        expired = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            expired.append(heapq.heappop(heap)[2])
+        for item in expired:
+            try:
+                self.callback(item)
+            except Exception:
+                logging.getLogger(__name__).exception('Unhandled exception when expiring a deadline')
+        self._schedule()
+
+    def clear(self):
+        """
+        Remove all items without calling the callback.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._heap = []
+
+
+class RttEstimator:
+    """
+    Estimate the retransmission timeout (RTO) from RTT samples, following RFC 6298.
+    All time values are in seconds.
+
+    :ivar srtt: the smoothed RTT. ``None`` before the first sample.
+    :vartype srtt: Optional[float]
+    :ivar rttvar: the RTT variation.
+    :vartype rttvar: float
+    :ivar rto: the current RTO.
+    :vartype rto: float
+    """
+    ALPHA = 1 / 8
+    BETA = 1 / 4
+    K = 4
+
+    def __init__(self, initial_rto: float = 1.0, min_rto: float = 0.2, max_rto: float = 60.0):
+        self.initial_rto = initial_rto
+        self.min_rto = min_rto
+        self.max_rto = max_rto
+        self.srtt = None
+        self.rttvar = 0.0
+        self.rto = initial_rto
+
+    def add_measurement(self, rtt: float):
+        """
+        Update the estimation with a new RTT sample.
+        Following Karn's algorithm, samples of retransmitted packets should not be added.
+
+        :param rtt: the measured RTT.
+        """
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - self.BETA) * self.rttvar + self.BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - self.ALPHA) * self.srtt + self.ALPHA * rtt
+        self.rto = min(max(self.srtt + self.K * self.rttvar, self.min_rto), self.max_rto)
+
+    def backoff(self, factor: float = 2.0):
+        """
+        Increase the RTO after a timeout.
+
+        :param factor: the factor multiplied to the RTO.
+        """
+        self.rto = min(self.rto * factor, self.max_rto)
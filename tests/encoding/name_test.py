@@ -316,3 +316,37 @@ class TestName:
     def test_canonical_uri():
         assert Name.to_canonical_uri(Name.from_str('/hello/world')) == '/hello/world'
         assert Name.to_canonical_uri(Name.from_str('/8=hello/seg=1')) == '/hello/50=%01'
+
+
+class TestFrozenName:
+    @staticmethod
+    def test_basic():
+        name = Name.FrozenName('/a/b/c/d')
+        assert len(name) == 4
+        assert name == Name.from_str('/a/b/c/d')
+        assert name == Name.to_bytes('/a/b/c/d')
+        assert name[0] == b'\x08\x01a'
+        assert name[-1] == b'\x08\x01d'
+        assert Name.to_str(name) == '/a/b/c/d'
+        assert Name.normalize(name) == Name.from_str('/a/b/c/d')
+        assert Name.FrozenName(b'\x07\x00') == []
+        with pytest.raises(IndexError):
+            _ = name[4]
+
+    @staticmethod
+    def test_slice():
+        name = Name.FrozenName('/a/b/c/d')
+        assert name[1:3] == Name.FrozenName('/b/c')
+        assert name[1:3].to_bytes() == b'\x07\x06\x08\x01b\x08\x01c'
+        assert name[:-1] == Name.from_str('/a/b/c')
+        assert name[3:1] == []
+        assert name[:2][1:] == Name.from_str('/b')
+        assert Name.is_prefix(name[:2], name)
+
+    @staticmethod
+    def test_hash():
+        name = Name.FrozenName('/a/b/c/d')
+        keys = {Name.to_bytes('/a/b'): 1, name: 2}
+        assert keys[name[:2]] == 1
+        assert keys[Name.FrozenName(Name.to_bytes('/a/b/c/d'))] == 2
+        assert hash(name[1:]) == hash(Name.FrozenName('/b/c/d'))
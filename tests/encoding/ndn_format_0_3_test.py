@@ -20,7 +20,8 @@ import pytest
 from typing import List
 from ndn.security import DigestSha256Signer
 from ndn.encoding import Name, Component, InterestParam, MetaInfo, ContentType, SignatureType, \
-    make_interest, make_data, parse_interest, parse_data, DecodeError, Signer, VarBinaryStr
+    make_interest, make_data, parse_interest, parse_data, DecodeError, Signer, VarBinaryStr, \
+    InterestView, DataView, DataTemplate
 
 
 class TestInterestMake:
@@ -218,6 +219,24 @@ class TestDataMake:
         assert data == b'\x06\x16\x07\x06\x08\x04test\x14\x03\x18\x01\x00\x16\x00\x17\x05\x00\x00\x00\x00\x00'
 
 
+class TestDataTemplate:
+    @staticmethod
+    def test_same_as_make_data():
+        for signer in [None, DigestSha256Signer()]:
+            for meta_info in [None, MetaInfo(freshness_period=1000, final_block_id=Component.from_segment(9))]:
+                for content in [None, b'', b'01020304' * 50]:
+                    template = DataTemplate('/local/ndn/prefix', meta_info, signer)
+                    for i in range(3):
+                        data = template.make_data(Component.from_segment(i), content)
+                        assert data == make_data(f'/local/ndn/prefix/seg={i}', meta_info, content, signer)
+
+    @staticmethod
+    def test_no_suffix():
+        template = DataTemplate('/local/ndn/prefix', MetaInfo(), DigestSha256Signer())
+        data = template.make_data(content=b'01020304')
+        assert data == make_data('/local/ndn/prefix', MetaInfo(), b'01020304', DigestSha256Signer())
+
+
 class TestInterestParse:
     @staticmethod
     def test_default():
@@ -442,3 +461,59 @@ class TestDataParse:
         _, meta_info, _, _ = parse_data(wire)
         assert meta_info is not None
         assert meta_info.content_type == ContentType.BLOB
+
+
+class TestPacketView:
+    @staticmethod
+    def test_interest():
+        name = '/local/ndn/prefix'
+        interest = make_interest(name, InterestParam(can_be_prefix=True, nonce=0x6c211166, hop_limit=1,
+                                                     forwarding_hint=['/name/A', '/ndn/B']),
+                                 b'\x01\x02\x03', signer=DigestSha256Signer())
+        name, param, app_param, sig = parse_interest(interest)
+        view = InterestView(interest)
+        assert view.name == name
+        assert view.int_param == param
+        assert view.app_param == app_param
+        assert view.sig_ptrs.signature_info == sig.signature_info
+        assert view.sig_ptrs.signature_covered_part == sig.signature_covered_part
+        assert view.sig_ptrs.signature_value_buf == sig.signature_value_buf
+        assert view.sig_ptrs.digest_covered_part == sig.digest_covered_part
+        assert view.sig_ptrs.digest_value_buf == sig.digest_value_buf
+
+        interest = b'\x05\x1a\x07\x14\x08\x05local\x08\x03ndn\x08\x06prefix\x0c\x02\x0f\xa0'
+        view = InterestView(interest)
+        assert view.name == Name.from_str('/local/ndn/prefix')
+        assert view.lifetime == 4000
+        assert not view.can_be_prefix
+        assert view.nonce is None
+        assert view.app_param is None
+        assert view.signature_info is None
+
+    @staticmethod
+    def test_data():
+        data = make_data('/local/ndn/prefix', MetaInfo(freshness_period=1000), b'01020304',
+                         signer=DigestSha256Signer())
+        name, meta_info, content, sig = parse_data(data)
+        view = DataView(data)
+        assert view.name == name
+        assert view.meta_info == meta_info
+        assert view.content == content
+        assert view.sig_ptrs.signature_info == sig.signature_info
+        assert view.sig_ptrs.signature_covered_part == sig.signature_covered_part
+        assert view.sig_ptrs.signature_value_buf == sig.signature_value_buf
+
+        wire = b'\x06\x0f\x07\x06\x08\x01\x41\x08\x01\x31\x16\x03\x1b\x01\xc8\x17\x00'
+        view = DataView(wire)
+        assert view.meta_info.content_type == ContentType.BLOB
+        assert view.content is None
+        assert view.signature_info.signature_type == SignatureType.NULL
+
+    @staticmethod
+    def test_throws():
+        with pytest.raises(DecodeError):
+            DataView(b'\x06\x09\x07\x03\x08\x01\x41\x15\x00\x07\x00')
+        with pytest.raises(DecodeError):
+            InterestView(b'\x05\x07\x07\x03\x08\x01\x41\x2b\x00')
+        with pytest.raises(DecodeError):
+            DataView(b'\x06\x07\x07\x03\x08\x01\x41\x15\x05')
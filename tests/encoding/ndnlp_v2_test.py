@@ -15,8 +15,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # -----------------------------------------------------------------------------
+import pytest
 from ndn.encoding import parse_network_nack, parse_interest, make_network_nack, make_interest, \
-    NackReason, Name, InterestParam
+    NackReason, Name, InterestParam, MetaInfo, make_data, make_lp_fragments, parse_lp_packet_v2, \
+    LpTypeNumber, DecodeError, parse_and_check_tl
+from ndn.encoding.ndnlp_v2 import LpPacketValue
+from ndn.security import DigestSha256Signer
 
 
 class TestNetworkNack:
@@ -40,3 +44,36 @@ class TestNetworkNack:
         assert lp_packet == (b"\x64\x36\xfd\x03\x20\x05\xfd\x03\x21\x01\x96"
                              b"\x50\x2b\x05\x29\x07\x1f\x08\tlocalhost\x08\x03nfd\x08\x05faces\x08\x06events"
                              b"\x21\x00\x12\x00\x0c\x02\x0f\xa0")
+
+
+class TestFragmentation:
+    @staticmethod
+    def test_fragments():
+        data = make_data('/local/ndn/prefix', MetaInfo(), b'\x01' * 3000)
+        frags = make_lp_fragments(data, 1000, 10)
+        assert len(frags) == 4
+        assert all(len(frag) <= 1000 for frag in frags)
+        payload = b''
+        for i, frag in enumerate(frags):
+            value = LpPacketValue.parse(parse_and_check_tl(frag, LpTypeNumber.LP_PACKET))
+            assert value.sequence == 10 + i
+            assert value.frag_index == i
+            assert value.frag_count == 4
+            payload += value.fragment
+        assert payload == data
+
+        with pytest.raises(DecodeError):
+            parse_lp_packet_v2(frags[1])
+
+    @staticmethod
+    def test_header_fields():
+        interest = make_interest('/localhost/nfd/faces/events', InterestParam(), b'\x01' * 1000,
+                                 signer=DigestSha256Signer())
+        frags = make_lp_fragments(make_network_nack(interest, NackReason.NO_ROUTE), 500, 0)
+        first = LpPacketValue.parse(parse_and_check_tl(frags[0], LpTypeNumber.LP_PACKET))
+        assert first.nack.nack_reason == NackReason.NO_ROUTE
+        assert first.frag_count == len(frags)
+        assert LpPacketValue.parse(parse_and_check_tl(frags[1], LpTypeNumber.LP_PACKET)).nack is None
+
+        with pytest.raises(ValueError):
+            make_lp_fragments(interest, 30, 0)
@@ -16,8 +16,9 @@
 # limitations under the License.
 # -----------------------------------------------------------------------------
 from enum import Enum, Flag
+import pytest
 from ndn.encoding import TlvModel, NameField, UintField, BytesField, BoolField, Component, \
-    RepeatedField, ModelField, Name, IncludeBase, MapField
+    RepeatedField, ModelField, Name, IncludeBase, MapField, DecodeError
 
 
 class TestEncodeDecode:
@@ -203,3 +204,48 @@ class TestAsDict:
                                 'enum_arr': [EnumVal.E1, EnumVal.E2],
                                 'str_val': 'वरुण',
                                 'str_arr': ['あいう', 'utf-8']}
+
+
+class TestSpecializedCodec:
+    @staticmethod
+    def generic(func):
+        TlvModel.use_specialized_codec = False
+        try:
+            return func()
+        finally:
+            TlvModel.use_specialized_codec = True
+
+    def test_packets(self):
+        from ndn.encoding import make_interest, make_data, parse_interest, parse_data, InterestParam, MetaInfo
+        from ndn.security import DigestSha256Signer
+
+        def encode_all():
+            return [make_interest('/a/b', InterestParam(can_be_prefix=True, nonce=0x1234, lifetime=4000,
+                                                        forwarding_hint=['/fh/1', '/fh/2']),
+                                  b'param', signer=DigestSha256Signer()),
+                    make_data('/a/b/seg=0', MetaInfo(freshness_period=1000, final_block_id=b'\x32\x01\x00'),
+                              b'content', signer=DigestSha256Signer())]
+
+        interest, data = encode_all()
+        assert [bytes(x) for x in self.generic(encode_all)] == [bytes(interest), bytes(data)]
+
+        for wire, parse in ((interest, parse_interest), (data, parse_data)):
+            fast = parse(wire)
+            slow = self.generic(lambda: parse(wire))
+            assert fast[:3] == slow[:3]
+            assert fast[3].signature_info == slow[3].signature_info
+            assert fast[3].signature_covered_part == slow[3].signature_covered_part
+            assert fast[3].digest_covered_part == slow[3].digest_covered_part
+
+    def test_dispatch(self):
+        class Model(TlvModel):
+            m1 = UintField(0x01)
+            m2 = UintField(0x03)
+            m3 = UintField(0x01)
+
+        obj = Model.parse(b'\x01\x01\x01\x03\x01\x03\x01\x01\x02\x02\x01\xff')
+        assert obj.m1 == 1 and obj.m2 == 3 and obj.m3 == 2
+
+        for parse in (Model.parse, lambda wire: self.generic(lambda: Model.parse(wire))):
+            with pytest.raises(DecodeError):
+                parse(b'\x03\x01\x03\x03\x01\x03')
@@ -16,8 +16,15 @@
 # limitations under the License.
 # -----------------------------------------------------------------------------
 import asyncio
+import os
+import sys
+import pytest
 
 from ndn.client_conf import default_face
+from ndn.encoding import make_data, make_interest, make_network_nack, parse_lp_packet_v2, MetaInfo, \
+    InterestParam, NackReason
+from ndn.transport.lp_fragment import LpFragmenter, LpReassembler
+from ndn.transport.lp_reliability import LpReliability
 from ndn.transport.stream_face import TcpFace, UnixFace
 from ndn.transport.udp_face import UdpFace
 
@@ -87,3 +94,225 @@ class TestFace:
         url = 'udp6://[::1]:6465'
         face = default_face(url)
         asyncio.run(face.open())
+
+
+class TestLpFragment:
+    def test_reassemble(self):
+        data = make_data('/local/ndn/prefix', MetaInfo(), b'\x01' * 3000)
+        fragmenter = LpFragmenter(1000)
+        reassembler = LpReassembler()
+        assert fragmenter.fragment(b'\x05\x00') == [b'\x05\x00']
+        assert reassembler.receive(b'\x05\x00') == b'\x05\x00'
+
+        frags = fragmenter.fragment(data)
+        assert len(frags) == 4
+        for frag in reversed(frags[1:]):
+            assert reassembler.receive(frag) is None
+        assert reassembler.receive(frags[2]) is None
+        assert reassembler.receive(frags[0]) == data
+        assert reassembler.buffer_size == 0
+
+        interest = make_interest('/local/ndn/prefix', InterestParam(), b'\x01' * 3000)
+        frags = fragmenter.fragment(make_network_nack(interest, NackReason.NO_ROUTE))
+        for frag in frags[:-1]:
+            assert reassembler.receive(frag) is None
+        lp_packet = parse_lp_packet_v2(reassembler.receive(frags[-1]))
+        assert lp_packet.nack.nack_reason == NackReason.NO_ROUTE
+        assert lp_packet.fragment == interest
+
+    def test_limits(self):
+        data = make_data('/local/ndn/prefix', MetaInfo(), b'\x01' * 3000)
+        fragmenter = LpFragmenter(1000)
+        reassembler = LpReassembler(timeout=0.0)
+        frags = fragmenter.fragment(data)
+        assert reassembler.receive(frags[0]) is None
+        assert reassembler.receive(frags[1]) is None
+        assert reassembler.buffer_size < 1000
+
+        reassembler = LpReassembler(max_buffer_size=2500)
+        frags = fragmenter.fragment(data)
+        for frag in frags[:-1]:
+            assert reassembler.receive(frag) is None
+        assert reassembler.buffer_size <= 2500
+        assert reassembler.receive(frags[-1]) is None
+
+
+class TestLpReliability:
+    def test_retransmit(self):
+        async def test():
+            received = []
+            dropped = []
+            peer = None
+
+            def lossy_send(wire):
+                # Drop the first transmission of the first two packets carrying a fragment
+                if parse_lp_packet_v2(wire).fragment is not None and len(dropped) < 2 and bytes(wire) not in dropped:
+                    dropped.append(bytes(wire))
+                    return
+                packet = peer.receive(wire)
+                if packet is not None:
+                    received.append(parse_lp_packet_v2(packet).fragment)
+
+            def reply_send(wire):
+                assert sender.receive(wire) is None
+
+            sender = LpReliability(lossy_send)
+            peer = LpReliability(reply_send, idle_ack_interval=0.001)
+            interests = [make_interest(f'/local/ndn/{i}', InterestParam()) for i in range(3)]
+            for interest in interests:
+                sender.send(interest)
+            for _ in range(200):
+                if not sender._unacked:
+                    break
+                await asyncio.sleep(0.01)
+            assert len(dropped) == 2
+            assert sorted(bytes(x) for x in received) == sorted(interests)
+            assert not sender._unacked
+            assert sender.rtt_estimator.srtt is not None
+            sender.shutdown()
+            peer.shutdown()
+
+        asyncio.run(test())
+
+    def test_mtu(self):
+        class Recorder:
+            def __init__(self):
+                self.sizes = []
+
+            def send(self, wire):
+                self.sizes.append(len(wire))
+
+        async def test():
+            face = UdpFace(mtu=1000, reliable=True)
+            face.handler = Recorder()
+            # The largest unfragmented packet fills the MTU exactly
+            face.send(b'\x05\xfd\x03\xd0' + b'\x00' * 976)
+            assert face.handler.sizes == [1000]
+            # One byte more needs two fragments
+            face.handler.sizes = []
+            face.send(b'\x05\xfd\x03\xd1' + b'\x00' * 977)
+            assert len(face.handler.sizes) == 2
+            assert max(face.handler.sizes) <= 1000
+            for size in range(900, 3000, 7):
+                face.handler.sizes = []
+                face.send(b'\x05\xfd' + size.to_bytes(2, 'big') + b'\x00' * size)
+                assert max(face.handler.sizes) <= 1000
+            face.reliability.shutdown()
+
+        asyncio.run(test())
+
+    def test_ack_room(self):
+        async def test():
+            sent = []
+            reliability = LpReliability(sent.append, mtu=100)
+            reliability._pending_acks = list(range(5))
+            # No room for any Ack
+            reliability.send(b'\x05\x52' + b'\x00' * 82)
+            assert len(sent[0]) == 100
+            assert not parse_lp_packet_v2(sent[0]).ack
+            assert reliability._pending_acks == list(range(5))
+            # Room for one Ack
+            reliability.send(b'\x05\x44' + b'\x00' * 68)
+            assert len(sent[1]) == 98
+            assert len(reliability._pending_acks) == 4
+            reliability.shutdown()
+
+        asyncio.run(test())
+
+
+class TestStreamFace:
+    @pytest.mark.skipif(sys.platform == 'win32', reason='Unix socket server is not available')
+    def test_framing(self, tmp_path):
+        path = str(tmp_path / 'nfd.sock')
+        packets = [bytes(make_data(f'/local/ndn/{i}', MetaInfo(), os.urandom(size)))
+                   for i, size in enumerate([10, 1000, 8000, 300000, 0, 70000] * 10)]
+        wire = b''.join(packets)
+        received = []
+
+        async def handle(_reader, writer):
+            for i in range(0, len(wire), 7777):
+                writer.write(wire[i:i + 7777])
+                await writer.drain()
+            writer.close()
+
+        async def callback(_typ, data):
+            received.append(bytes(data))
+
+        async def test():
+            server = await asyncio.start_unix_server(handle, path)
+            face = UnixFace(path, max_packet_size=max(len(p) for p in packets))
+            face.callback = callback
+            await face.open()
+            await face.run()
+            await asyncio.sleep(0.01)
+            assert not face.running
+            server.close()
+
+        asyncio.run(test())
+        assert received == packets
+
+    @pytest.mark.skipif(sys.platform == 'win32', reason='Unix socket server is not available')
+    def test_max_packet_size(self, tmp_path):
+        path = str(tmp_path / 'nfd.sock')
+        small = bytes(make_data('/local/ndn/0', MetaInfo(), b'\x00' * 100))
+        # Only the header of the oversized packet is sent. The face must not wait for the rest
+        wire = small + b'\x06\xfe\x00\x10\x00\x00'
+        received = []
+        lost = []
+
+        async def handle(reader, writer):
+            writer.write(wire)
+            await writer.drain()
+            lost.append(await reader.read())
+            writer.close()
+
+        async def callback(_typ, data):
+            received.append(bytes(data))
+
+        async def test():
+            server = await asyncio.start_unix_server(handle, path)
+            face = UnixFace(path)
+            face.callback = callback
+            await face.open()
+            await asyncio.wait_for(face.run(), 1)
+            assert not face.running
+            await asyncio.sleep(0.01)
+            server.close()
+
+        asyncio.run(test())
+        assert received == [small]
+        assert lost == [b'']
+
+    @pytest.mark.skipif(sys.platform == 'win32', reason='Unix socket server is not available')
+    def test_coalesce(self, tmp_path):
+        path = str(tmp_path / 'nfd.sock')
+        packets = [bytes(make_data(f'/local/ndn/{i}', MetaInfo(), b'\x00' * i)) for i in range(10)]
+        wire = b''.join(packets)
+        received = []
+
+        async def handle(reader, writer):
+            received.append(await reader.readexactly(len(wire)))
+            writer.close()
+
+        async def test():
+            server = await asyncio.start_unix_server(handle, path)
+            face = UnixFace(path, coalesce=True)
+            await face.open()
+            writes = []
+            writelines = face.transport.writelines
+
+            def record(parts):
+                writes.append(len(parts))
+                writelines(parts)
+
+            face.transport.writelines = record
+            face.send(packets[0])
+            face.sendv([packets[1][:5], packets[1][5:]])
+            face.send_many(packets[2:])
+            assert writes == []
+            await face.run()
+            assert writes == [11]
+            server.close()
+
+        asyncio.run(test())
+        assert received == [wire]
@@ -17,12 +17,16 @@
 # -----------------------------------------------------------------------------
 import abc
 import asyncio as aio
+import sys
 import pytest
 from ndn import appv2 as app
 from ndn import security as sec
 from ndn import encoding as enc
 from ndn import types
+from ndn import utils
 from ndn.transport.dummy_face import DummyFace
+from ndn.app_support.content_store import ContentStore
+from ndn.app_support.verification_cache import VerificationCache
 
 
 class NDNAppTestSuite:
@@ -142,7 +146,8 @@ class TestInterestCanBePrefix(NDNAppTestSuite):
 class TestRoute(NDNAppTestSuite):
     async def face_proc(self, face: DummyFace):
         await face.ignore_output(0)
-        await face.input_packet(b'\x05\x15\x07\x10\x08\x03not\x08\timportant\x0c\x01\xfa')
+        packet = memoryview(b'\x05\x15\x07\x10\x08\x03not\x08\timportant\x0c\x01\xfa')
+        aio.get_running_loop().call_soon(face.callback, 0x05, packet)
         await face.consume_output(b'\x06\x24\x07\x10\x08\x03not\x08\timportant\x14\x03\x18\x01\x00\x15\x04test'
                                   b'\x16\x03\x1b\x01\xc8\x17\x00')
 
@@ -178,7 +183,8 @@ class TestInvalidInterest(NDNAppTestSuite):
 class TestRoute2(NDNAppTestSuite):
     async def face_proc(self, face: DummyFace):
         await face.ignore_output(0)
-        await face.input_packet(b'\x05\x15\x07\x10\x08\x03not\x08\timportant\x0c\x01\xfa')
+        packet = memoryview(b'\x05\x15\x07\x10\x08\x03not\x08\timportant\x0c\x01\xfa')
+        aio.get_running_loop().call_soon(face.callback, 0x05, packet)
         await face.consume_output(b'\x06\x24\x07\x10\x08\x03not\x08\timportant\x14\x03\x18\x01\x00\x15\x04test'
                                   b'\x16\x03\x1b\x01\xc8\x17\x00')
 
@@ -266,3 +272,527 @@ class TestPitToken(NDNAppTestSuite):
         def on_interest(name, _app_param, reply: app.ReplyFunc, _context):
             data = self.app.make_data(name, b'test', signer=sec.NullSigner())
             assert reply(data)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason='Eager Tasks require Python 3.12')
+class TestInlineDispatch(NDNAppTestSuite):
+    handled = False
+
+    async def face_proc(self, face: DummyFace):
+        await face.ignore_output(0)
+        face.callback(enc.TypeNumber.INTEREST, memoryview(b'\x05\x15\x07\x10\x08\x03not\x08\timportant\x0c\x01\xfa'))
+        # The handler is called without creating a Task
+        assert self.handled
+        await face.consume_output(b'\x06\x24\x07\x10\x08\x03not\x08\timportant\x14\x03\x18\x01\x00\x15\x04test'
+                                  b'\x16\x03\x1b\x01\xc8\x17\x00')
+
+    async def app_main(self):
+        @self.app.route('/not')
+        def on_interest(name, _app_param, reply: app.ReplyFunc, _context):
+            self.handled = True
+            reply(self.app.make_data(name, b'test', signer=sec.NullSigner()))
+
+
+class TestValidatorTimeout(NDNAppTestSuite):
+    @staticmethod
+    async def validator(_name, _sig, _context) -> types.ValidResult:
+        # A timeout needs to be used inside a Task
+        return await aio.wait_for(app.pass_all(_name, _sig, _context), 1)
+
+    async def face_proc(self, face: DummyFace):
+        await face.ignore_output(0)
+        # Deliver the packet from a loop callback like a real transport, i.e. not inside any Task
+        packet = memoryview(b'\x06\x0f\x07\x03\x08\x01a\x14\x03\x18\x01\x00\x15\x03abc')
+        aio.get_running_loop().call_soon(face.callback, 0x06, packet)
+        await aio.sleep(0.05)
+
+    async def app_main(self):
+        _, content, _ = await self.app.express('/a', self.validator, nonce=None)
+        assert content == b'abc'
+
+
+class TestAsyncHandlerTimeout(NDNAppTestSuite):
+    async def face_proc(self, face: DummyFace):
+        await face.ignore_output(0)
+        packet = memoryview(b'\x05\x15\x07\x10\x08\x03not\x08\timportant\x0c\x01\xfa')
+        aio.get_running_loop().call_soon(face.callback, 0x05, packet)
+        await face.consume_output(b'\x06\x24\x07\x10\x08\x03not\x08\timportant\x14\x03\x18\x01\x00\x15\x04test'
+                                  b'\x16\x03\x1b\x01\xc8\x17\x00', timeout=0.1)
+
+    async def app_main(self):
+        @self.app.route('/not')
+        async def on_interest(name, _app_param, reply: app.ReplyFunc, _context):
+            async with aio.timeout(1):
+                assert aio.current_task() is not None
+                reply(self.app.make_data(name, b'test', signer=sec.NullSigner()))
+
+
+class TestKeepOrder(NDNAppTestSuite):
+    keep_order = True
+    order = None
+
+    async def comain(self):
+        face = DummyFace(self.face_proc)
+        self.app = app.NDNApp(face, keep_order=self.keep_order)
+        face.app = self.app
+        self.order = []
+        await self.app.main_loop(self.app_main())
+
+    @staticmethod
+    async def validator(name, _sig, _context) -> types.ValidResult:
+        if name == enc.Name.from_str('/a'):
+            await aio.sleep(0.005)
+        return types.ValidResult.PASS
+
+    async def face_proc(self, face: DummyFace):
+        await face.ignore_output(0)
+        await aio.sleep(0.001)
+        await face.input_packet(self.app.make_data('/a', b'a', signer=sec.NullSigner()))
+        await face.input_packet(self.app.make_data('/b', b'b', signer=sec.NullSigner()))
+        await aio.sleep(0.01)
+
+    async def fetch(self, name):
+        _, content, _ = await self.app.express(name, self.validator, lifetime=1000)
+        self.order.append(bytes(content))
+
+    async def app_main(self):
+        await aio.gather(self.fetch('/a'), self.fetch('/b'))
+        if self.keep_order:
+            assert self.order == [b'a', b'b']
+        else:
+            assert self.order == [b'b', b'a']
+
+
+class TestNoKeepOrder(TestKeepOrder):
+    keep_order = False
+
+
+class TestBackpressure(NDNAppTestSuite):
+    async def face_proc(self, face: DummyFace):
+        face.pause_writing()
+        await aio.sleep(0.005)
+        assert face.output_buf == b''
+        face.resume_writing()
+        await face.consume_output(b'\x05\x15\x07\x0f\x08\rnot important\x0c\x02\x0f\xa0')
+        assert face.blocked_count == 1
+        assert face.blocked_time > 0.004
+        await face.input_packet(b'\x06\x1b\x07\x0f\x08\rnot important\x14\x03\x18\x01\x00\x15\x03abc')
+
+    async def app_main(self):
+        _, content, _ = await self.app.express_when_writable('not important', app.pass_all, nonce=None)
+        assert content == b'abc'
+
+
+class TestPendingInterestTable:
+    @staticmethod
+    def test_match():
+        pit = app.PendingInterestTable()
+        exact = pit.setdefault(enc.Name.from_str('/a/b'), False)
+        prefix = pit.setdefault(enc.Name.from_str('/a'), True)
+        assert pit.setdefault(enc.Name.from_str('/a/b'), False) is exact
+        assert pit.setdefault(enc.Name.from_str('/a/b'), True) is not exact
+        assert len(pit) == 3
+
+        matches = pit.match(enc.Name.from_bytes(b'\x07\x06\x08\x01a\x08\x01b'))
+        assert matches == [(exact, False), (prefix, True), (pit.setdefault(enc.Name.from_str('/a/b'), True), False)]
+        for node, _ in matches:
+            pit.remove(node)
+        assert len(pit) == 0
+
+        node = pit.setdefault(enc.Name.from_str('/a/b'), False)
+        assert pit.match(enc.Name.from_str('/a')) == []
+        assert pit.match(enc.Name.from_str('/a/b/c')) == []
+        assert pit.find(enc.Name.from_str('/a/b')) == [node]
+        # A stale node does not remove the new one
+        pit.remove(node)
+        new_node = pit.setdefault(enc.Name.from_str('/a/b'), False)
+        pit.remove(node)
+        assert pit.find(enc.Name.from_str('/a/b')) == [new_node]
+
+
+class TestTimeoutBatch(NDNAppTestSuite):
+    async def face_proc(self, face: DummyFace):
+        await face.ignore_output(0)
+        await aio.sleep(0.05)
+        # Data arriving after the timeout is dropped
+        await face.input_packet(b'\x06\x0f\x07\x03\x08\x01a\x14\x03\x18\x01\x00\x15\x03abc')
+
+    async def app_main(self):
+        coros = [self.app.express(f'/{c}', app.pass_all, lifetime=10) for c in 'abcde']
+        coros.append(self.app.express('/f', app.pass_all, lifetime=2000))
+        assert len(self.app._pit) == 6
+        for coro in coros[:5]:
+            with pytest.raises(types.InterestTimeout):
+                await coro
+        assert len(self.app._pit) == 1
+        assert len(self.app._int_timeouts) == 1
+        await aio.sleep(0.06)
+        coros[5].close()
+
+
+class TestAggregation(NDNAppTestSuite):
+    async def comain(self):
+        face = DummyFace(self.face_proc)
+        self.app = app.NDNApp(face, aggregate=True)
+        face.app = self.app
+        await self.app.main_loop(self.app_main())
+
+    @staticmethod
+    async def fail_all(_name, _sig, _context):
+        return types.ValidResult.FAIL
+
+    async def face_proc(self, face: DummyFace):
+        # Only two Interests are sent: /a and /a with MustBeFresh
+        await face.consume_output(b'\x05\x09\x07\x03\x08\x01a\x0c\x02\x0f\xa0'
+                                  b'\x05\x0b\x07\x03\x08\x01a\x12\x00\x0c\x02\x0f\xa0')
+        await face.input_packet(b'\x06\x0f\x07\x03\x08\x01a\x14\x03\x18\x01\x00\x15\x03abc')
+
+    async def app_main(self):
+        fut1 = self.app.express('/a', app.pass_all, nonce=None)
+        fut2 = self.app.express('/a', app.pass_all, nonce=None)
+        fut3 = self.app.express('/a', self.fail_all, nonce=None)
+        fut4 = self.app.express('/a', app.pass_all, nonce=None, must_be_fresh=True)
+        for fut in (fut1, fut2, fut4):
+            _, content, _ = await fut
+            assert content == b'abc'
+        with pytest.raises(types.ValidationFailure):
+            await fut3
+
+
+class TestOutgoingPitToken(NDNAppTestSuite):
+    async def comain(self):
+        face = DummyFace(self.face_proc)
+        self.app = app.NDNApp(face, use_pit_token=True)
+        self.app._next_pit_token = 0
+        face.app = self.app
+        await self.app.main_loop(self.app_main())
+
+    async def face_proc(self, face: DummyFace):
+        await face.consume_output(b'\x64\x13\x62\x04\x00\x00\x00\x01\x50\x0b'
+                                  b'\x05\x09\x07\x03\x08\x01a\x0c\x02\x0f\xa0')
+        await face.input_packet(b'\x64\x19\x62\x04\x00\x00\x00\x01\x50\x11'
+                                b'\x06\x0f\x07\x03\x08\x01a\x14\x03\x18\x01\x00\x15\x03abc')
+
+    async def app_main(self):
+        _, content, _ = await self.app.express('/a', app.pass_all, nonce=None)
+        assert content == b'abc'
+        assert len(self.app._pit) == 0
+
+
+class TestOutgoingPitTokenMismatch(NDNAppTestSuite):
+    async def comain(self):
+        face = DummyFace(self.face_proc)
+        self.app = app.NDNApp(face, use_pit_token=True)
+        self.app._next_pit_token = 0
+        face.app = self.app
+        await self.app.main_loop(self.app_main())
+
+    async def face_proc(self, face: DummyFace):
+        await face.consume_output(b'\x64\x13\x62\x04\x00\x00\x00\x01\x50\x0b'
+                                  b'\x05\x09\x07\x03\x08\x01a\x0c\x02\x0f\xa0')
+        # A Data with another name carrying the same PIT token is not accepted
+        await face.input_packet(b'\x64\x19\x62\x04\x00\x00\x00\x01\x50\x11'
+                                b'\x06\x0f\x07\x03\x08\x01b\x14\x03\x18\x01\x00\x15\x03bad')
+        await face.input_packet(b'\x64\x19\x62\x04\x00\x00\x00\x01\x50\x11'
+                                b'\x06\x0f\x07\x03\x08\x01a\x14\x03\x18\x01\x00\x15\x03abc')
+
+    async def app_main(self):
+        _, content, _ = await self.app.express('/a', app.pass_all, nonce=None)
+        assert content == b'abc'
+        assert len(self.app._pit) == 0
+
+
+class TestContentStore(NDNAppTestSuite):
+    calls = 0
+
+    async def comain(self):
+        face = DummyFace(self.face_proc)
+        self.app = app.NDNApp(face, content_store=ContentStore())
+        face.app = self.app
+        await self.app.main_loop(self.app_main())
+
+    async def face_proc(self, face: DummyFace):
+        await face.ignore_output(0)
+        data = (b'\x06\x24\x07\x10\x08\x03not\x08\timportant\x14\x03\x18\x01\x00\x15\x04test'
+                b'\x16\x03\x1b\x01\xc8\x17\x00')
+        await face.input_packet(b'\x05\x15\x07\x10\x08\x03not\x08\timportant\x0c\x01\xfa')
+        await face.consume_output(data)
+        await face.input_packet(b'\x05\x12\x07\x05\x08\x03not\x21\x00\x0a\x04\x01\x02\x03\x04\x0c\x01\xfa')
+        await face.consume_output(data)
+        assert self.calls == 1
+        assert self.app.content_store.hits == 1
+
+    async def app_main(self):
+        @self.app.route('/not')
+        def on_interest(name, _app_param, reply: app.ReplyFunc, _context):
+            self.calls += 1
+            reply(self.app.make_data(name, b'test', signer=sec.NullSigner()))
+
+
+class TestContentStoreLateReply(NDNAppTestSuite):
+    reply = None
+
+    async def comain(self):
+        face = DummyFace(self.face_proc)
+        self.app = app.NDNApp(face, content_store=ContentStore())
+        face.app = self.app
+        await self.app.main_loop(self.app_main())
+
+    async def face_proc(self, face: DummyFace):
+        await face.ignore_output(0)
+        # InterestLifetime = 10ms
+        await face.input_packet(b'\x05\x15\x07\x10\x08\x03not\x08\timportant\x0c\x01\x0a')
+        await aio.sleep(0.02)
+        # A Data not sent is not stored either
+        assert not self.reply(self.app.make_data('/not/important', b'test', signer=sec.NullSigner()))
+        assert face.output_buf == b''
+        assert len(self.app.content_store) == 0
+
+    async def app_main(self):
+        @self.app.route('/not')
+        def on_interest(_name, _app_param, reply: app.ReplyFunc, _context):
+            self.reply = reply
+
+
+class TestInterestQueue(NDNAppTestSuite):
+    handled = 0
+    overloaded = 0
+    interest = (b'\x05`\x072\x08\x03not\x08\timportant'
+                b'\x02 E\x8a\xeaxI}[\xb1\xcd\xf0\x01\xbe'
+                b'\xdb\xe9\x03\x085\xb1g+K\xa8jK,\xd0\xad'
+                b')\x07\x83\x96\xbb\x0c\x01\xfa$\x00,\x03'
+                b'\x1b\x01\x00. !\x93!zG[%\xcfs\xe89\\\x8f'
+                b'^\xd3\xa4\xb9\x13\xaa\x7f\xa6?\xd7\x13aVyS\xdc\x1dW\xea')
+
+    @staticmethod
+    async def validator(_name, _sig, _context) -> types.ValidResult:
+        await aio.sleep(0.003)
+        return types.ValidResult.PASS
+
+    def on_overload(self, _name, _param, _reply, _context):
+        self.overloaded += 1
+
+    async def face_proc(self, face: DummyFace):
+        await face.ignore_output(0)
+        for _ in range(3):
+            await face.input_packet(self.interest)
+        assert self.queue.active == 1
+        assert len(self.queue) == 1
+        for _ in range(500):
+            if self.handled == 2 and self.queue.active == 0:
+                break
+            await aio.sleep(0.002)
+        assert self.handled == 2
+        assert self.overloaded == 1
+        assert (self.queue.admitted, self.queue.shed, self.queue.expired) == (2, 1, 0)
+
+    async def app_main(self):
+        self.queue = app.InterestQueue(max_concurrency=1, max_queue_size=1, on_overload=self.on_overload)
+
+        @self.app.route('/not', validator=self.validator, queue=self.queue)
+        def on_interest(_name, _app_param, _reply: app.ReplyFunc, _context):
+            self.handled += 1
+
+
+class TestInterestQueuePriority:
+    @staticmethod
+    def test_priority():
+        async def test():
+            order = []
+            blocker = aio.get_running_loop().create_future()
+            queue = app.InterestQueue(max_concurrency=1, prioritize=True)
+            now = utils.timestamp()
+            queue.submit(now + 1000, lambda: aio.ensure_future(blocker))
+            for i, lifetime in enumerate([300, 100, 200]):
+                queue.submit(now + lifetime, lambda i=i: order.append(i))
+            queue.submit(now - 1, lambda: order.append('expired'))
+            assert len(queue) == 3
+            blocker.set_result(None)
+            await aio.sleep(0)
+            assert order == [1, 2, 0]
+            assert (queue.admitted, queue.expired, queue.active) == (4, 1, 0)
+
+        aio.run(test())
+
+
+class TestAsyncHandler(NDNAppTestSuite):
+    async def face_proc(self, face: DummyFace):
+        await face.ignore_output(0)
+        packet = memoryview(b'\x05\x15\x07\x10\x08\x03not\x08\timportant\x0c\x01\xfa')
+        aio.get_running_loop().call_soon(face.callback, 0x05, packet)
+        await face.consume_output(b'\x06\x24\x07\x10\x08\x03not\x08\timportant\x14\x03\x18\x01\x00\x15\x04test'
+                                  b'\x16\x03\x1b\x01\xc8\x17\x00', timeout=0.1)
+
+    async def app_main(self):
+        @self.app.route('/not')
+        async def on_interest(name, _app_param, reply: app.ReplyFunc, _context):
+            await aio.sleep(0.005)
+            reply(self.app.make_data(name, b'test', signer=sec.NullSigner()))
+
+
+class TestAsyncHandlerDeadline(NDNAppTestSuite):
+    cancelled = False
+
+    async def face_proc(self, face: DummyFace):
+        await face.ignore_output(0)
+        await face.input_packet(enc.make_interest('/not/important', enc.InterestParam(lifetime=20)))
+        await aio.sleep(0.05)
+        assert self.cancelled
+        assert len(self.app._handler_deadlines) == 0
+
+    async def app_main(self):
+        @self.app.route('/not')
+        async def on_interest(_name, _app_param, _reply: app.ReplyFunc, _context):
+            try:
+                await aio.sleep(1)
+            except aio.CancelledError:
+                self.cancelled = True
+                raise
+
+
+class TestAsyncHandlerQueuedDeadline(NDNAppTestSuite):
+    cancelled = None
+
+    async def face_proc(self, face: DummyFace):
+        await face.ignore_output(0)
+        self.cancelled = {}
+        self.start = aio.get_running_loop().time()
+        await face.input_packet(enc.make_interest('/not/a', enc.InterestParam(lifetime=50)))
+        await face.input_packet(enc.make_interest('/not/b', enc.InterestParam(lifetime=100)))
+        assert len(self.queue) == 1
+        await aio.sleep(0.2)
+        # /not/b waited for 50ms in the queue, which is counted in its lifetime
+        assert 0.04 < self.cancelled['a'] < 0.09
+        assert 0.09 < self.cancelled['b'] < 0.14
+
+    async def app_main(self):
+        self.queue = app.InterestQueue(max_concurrency=1)
+
+        @self.app.route('/not', queue=self.queue)
+        async def on_interest(name, _app_param, _reply: app.ReplyFunc, _context):
+            try:
+                await aio.sleep(1)
+            except aio.CancelledError:
+                self.cancelled[bytes(enc.Component.get_value(name[-1])).decode()] = \
+                    aio.get_running_loop().time() - self.start
+                raise
+
+
+class TestAsyncHandlerConcurrency(NDNAppTestSuite):
+    running = 0
+    max_running = 0
+
+    async def face_proc(self, face: DummyFace):
+        await face.ignore_output(0)
+        for _ in range(3):
+            await face.input_packet(b'\x05\x15\x07\x10\x08\x03not\x08\timportant\x0c\x01\xfa')
+        assert self.queue.active == 2
+        assert len(self.queue) == 1
+        await aio.sleep(0.05)
+        assert self.max_running == 2
+        assert self.queue.admitted == 3
+        assert self.queue.max_wait > 0.0
+        assert 0.0 < self.queue.mean_wait <= self.queue.max_wait
+
+    async def app_main(self):
+        self.queue = app.InterestQueue(max_concurrency=2)
+
+        @self.app.route('/not', queue=self.queue)
+        async def on_interest(_name, _app_param, _reply: app.ReplyFunc, _context):
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            await aio.sleep(0.01)
+            self.running -= 1
+
+
+class TestVerificationCache(NDNAppTestSuite):
+    validated = 0
+
+    async def comain(self):
+        face = DummyFace(self.face_proc)
+        self.app = app.NDNApp(face, verification_cache=VerificationCache())
+        face.app = self.app
+        await self.app.main_loop(self.app_main())
+
+    async def validator(self, _name, _sig, _context) -> types.ValidResult:
+        self.validated += 1
+        await aio.sleep(0.001)
+        return types.ValidResult.PASS
+
+    async def face_proc(self, face: DummyFace):
+        data = (b'\x06\x24\x07\x10\x08\x03not\x08\timportant\x14\x03\x18\x01\x00\x15\x04test'
+                b'\x16\x03\x1b\x01\xc8\x17\x00')
+        for _ in range(2):
+            await face.ignore_output(0)
+            await face.input_packet(data)
+
+    async def app_main(self):
+        for _ in range(2):
+            _, content, _ = await self.app.express('/not/important', self.validator, nonce=None)
+            assert content == b'test'
+        assert self.validated == 1
+        cache = self.app.verification_cache
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+class TestRetransmission(NDNAppTestSuite):
+    name_tlv = b'\x07\x06\x08\x01a\x08\x01b'
+
+    async def face_proc(self, face: DummyFace):
+        # The first Interest is lost. The second one is sent after the RTO
+        for _ in range(100):
+            if face.output_buf.count(self.name_tlv) >= 2:
+                break
+            await aio.sleep(0.002)
+        assert face.output_buf.count(self.name_tlv) == 2
+        face.output_buf = b''
+        await face.input_packet(b'\x06\x12\x07\x06\x08\x01a\x08\x01b\x14\x03\x18\x01\x00\x15\x03abc')
+        # The third Interest is answered at once
+        for _ in range(100):
+            if face.output_buf:
+                break
+            await aio.sleep(0.002)
+        await face.input_packet(b'\x06\x12\x07\x06\x08\x01a\x08\x01b\x14\x03\x18\x01\x00\x15\x03abc')
+
+    async def app_main(self):
+        estimator = self.app.rtt_estimator('/a')
+        estimator.rto = 0.01
+        retx = app.RetxPolicy(max_retries=2)
+        _, content, _ = await self.app.express('/a/b', app.pass_all, lifetime=1000, retx=retx)
+        assert content == b'abc'
+        # Karn's algorithm: no sample from a retransmitted Interest
+        assert estimator.srtt is None
+        assert estimator.rto == 0.02
+        _, content, _ = await self.app.express('/a/b', app.pass_all, lifetime=1000, retx=retx)
+        assert content == b'abc'
+        assert estimator.srtt is not None
+
+
+class TestRetransmissionBudget(NDNAppTestSuite):
+    async def face_proc(self, face: DummyFace):
+        await aio.sleep(0.15)
+        # One Interest and two retransmissions
+        assert face.output_buf.count(b'\x07\x06\x08\x01a\x08\x01b') == 3
+
+    async def app_main(self):
+        self.app.rtt_estimator('/a').rto = 0.01
+        with pytest.raises(types.InterestTimeout):
+            await self.app.express('/a/b', app.pass_all, lifetime=100, retx=app.RetxPolicy(max_retries=2))
+
+
+class TestRetransmissionAggregated(NDNAppTestSuite):
+    async def comain(self):
+        face = DummyFace(self.face_proc)
+        self.app = app.NDNApp(face, aggregate=True)
+        face.app = self.app
+        await self.app.main_loop(self.app_main())
+
+    async def face_proc(self, face: DummyFace):
+        await aio.sleep(0.15)
+        # Retransmissions do not join the pending first Interest
+        assert face.output_buf.count(b'\x07\x06\x08\x01a\x08\x01b') == 4
+
+    async def app_main(self):
+        self.app.rtt_estimator('/a').rto = 0.01
+        with pytest.raises(types.InterestTimeout):
+            await self.app.express('/a/b', app.pass_all, lifetime=100, retx=app.RetxPolicy(max_retries=3))
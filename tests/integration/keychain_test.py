@@ -74,6 +74,9 @@ class TestKeychainSqlite3:
         key_locator_name = self.verify(data)
         assert (Name.normalize(key_locator_name) ==
                 Name.normalize(self.keychain.default_identity().default_key().default_cert().name))
+        # The signer is cached by its KeyLocator name
+        cert_name = self.keychain.default_identity().default_key().default_cert().name
+        assert self.keychain.get_signer({'cert': cert_name}) is signer
 
     def verify_cert(self):
         key_locator_name = self.verify(self.cert)
@@ -0,0 +1,198 @@
+# -----------------------------------------------------------------------------
+# Copyright (C) 2019-2022 The python-ndn authors
+#
+# This file is part of python-ndn.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+import asyncio as aio
+from hashlib import sha256
+import pytest
+from ndn import appv2 as app
+from ndn import encoding as enc
+from ndn import security as sec
+from ndn import types
+from ndn.encoding import ndnlp_v2 as ndnlp
+from ndn.transport.dummy_face import DummyFace
+from ndn.app_support.manifest import MANIFEST_COMPONENT, ManifestValue, ManifestReader, make_manifests
+from ndn.app_support.segment_pipeline import SegmentPipeline, FixedWindow
+from ndn.app_support.verification_cache import VerificationCache
+
+
+SEGMENTS = 20
+DIGESTS_PER_MANIFEST = 6
+
+
+def make_segments():
+    template = enc.DataTemplate('/file', enc.MetaInfo(final_block_id=enc.Component.from_segment(SEGMENTS - 1)),
+                                sec.DigestSha256Signer())
+    return [bytes(template.make_data(enc.Component.from_segment(i), b'%d,' % i)) for i in range(SEGMENTS)]
+
+
+class TestMakeManifests:
+    def test_chain(self):
+        segments = make_segments()
+        digests = [sha256(wire).digest() for wire in segments]
+        manifests = make_manifests('/file', digests, sec.NullSigner(), digests_per_manifest=DIGESTS_PER_MANIFEST)
+        assert len(manifests) == 4
+
+        listed = []
+        for i, wire in enumerate(manifests):
+            name, meta_info, content, sig = enc.parse_data(wire)
+            assert name == enc.Name.from_str('/file/32=manifest') + [enc.Component.from_segment(i)]
+            assert meta_info.final_block_id == enc.Component.from_segment(3)
+            if i == 0:
+                assert sig.signature_info.signature_type != enc.SignatureType.DIGEST_SHA256
+            else:
+                assert sig.signature_info.signature_type == enc.SignatureType.DIGEST_SHA256
+            manifest = ManifestValue.parse(content)
+            listed.extend(bytes(d) for d in manifest.segment_digests)
+            if i < 3:
+                assert manifest.next_manifest == sha256(manifests[i + 1]).digest()
+            else:
+                assert manifest.next_manifest is None
+        assert listed == digests
+
+    def test_empty(self):
+        manifests = make_manifests('/file', [], sec.NullSigner())
+        assert len(manifests) == 1
+        _, _, content, _ = enc.parse_data(manifests[0])
+        manifest = ManifestValue.parse(content)
+        assert not manifest.segment_digests
+        assert manifest.next_manifest is None
+
+
+class ManifestProducerFace(DummyFace):
+    """
+    Reply to Interests for /file/<seg> and /file/32=manifest/<seg>, optionally tampering with a segment.
+    """
+
+    def __init__(self, test_func, tamper=None, nack_manifests=0):
+        super().__init__(test_func)
+        self.nack_manifests = nack_manifests
+        self.segments = make_segments()
+        if tamper is not None:
+            name, meta_info, _, _ = enc.parse_data(self.segments[tamper])
+            self.segments[tamper] = bytes(enc.make_data(name, meta_info, b'evil', signer=sec.DigestSha256Signer()))
+            digests = [sha256(wire).digest() for wire in make_segments()]
+        else:
+            digests = [sha256(wire).digest() for wire in self.segments]
+        self.manifests = make_manifests('/file', digests, sec.NullSigner(), digests_per_manifest=DIGESTS_PER_MANIFEST)
+        self.manifest_interests = []
+
+    def send(self, data: bytes):
+        name = enc.InterestView(data).name
+        if name[1] == MANIFEST_COMPONENT:
+            self.manifest_interests.append(name)
+            if self.nack_manifests > 0:
+                self.nack_manifests -= 1
+                nack = ndnlp.make_network_nack(data, ndnlp.NackReason.NO_ROUTE)
+                aio.get_running_loop().call_soon(self.callback, enc.LpTypeNumber.LP_PACKET, nack)
+                return
+            if enc.Component.get_type(name[-1]) == enc.Component.TYPE_IMPLICIT_SHA256:
+                name = name[:-1]
+            wire = self.manifests[enc.Component.to_number(name[-1])]
+        else:
+            wire = self.segments[enc.Component.to_number(name[-1])]
+        aio.get_running_loop().call_soon(self.callback, enc.TypeNumber.DATA, wire)
+
+
+class ManifestTestSuite:
+    tamper = None
+    nack_manifests = 0
+    cache_results = False
+
+    def test_main(self):
+        aio.run(self.comain())
+
+    async def comain(self):
+        self.finished = aio.Event()
+        face = ManifestProducerFace(self.face_proc, self.tamper, self.nack_manifests)
+        self.face = face
+        self.app = app.NDNApp(face, verification_cache=VerificationCache() if self.cache_results else None)
+        face.app = self.app
+        await self.app.main_loop(self.app_main())
+
+    async def face_proc(self, _face):
+        await aio.wait_for(self.finished.wait(), 5)
+
+    async def app_main(self):
+        try:
+            await self.fetch()
+        finally:
+            self.finished.set()
+
+    async def fetch(self):
+        pass
+
+
+class TestManifestPipeline(ManifestTestSuite):
+    async def fetch(self):
+        validated = []
+
+        async def validator(name, _sig, _context):
+            validated.append(name)
+            return types.ValidResult.PASS
+
+        reader = ManifestReader(self.app, '/file', validator, lifetime=100)
+        pipeline = SegmentPipeline(self.app, '/file', reader.validate, window_control=FixedWindow(4), lifetime=100)
+        content = b''.join([seg async for seg in pipeline])
+        assert content == b''.join(b'%d,' % i for i in range(SEGMENTS))
+        # Only the first manifest segment is validated by the validator
+        assert validated == [enc.Name.from_str('/file/32=manifest/seg=0')]
+        assert reader.manifests_fetched == 4
+        assert reader.complete
+        assert len(self.face.manifest_interests) == 4
+        for name in self.face.manifest_interests[1:]:
+            assert enc.Component.get_type(name[-1]) == enc.Component.TYPE_IMPLICIT_SHA256
+
+
+class TestManifestTamperedSegment(ManifestTestSuite):
+    tamper = 7
+
+    async def fetch(self):
+        reader = ManifestReader(self.app, '/file', lifetime=100)
+        pipeline = SegmentPipeline(self.app, '/file', reader.validate, window_control=FixedWindow(4), lifetime=100)
+        with pytest.raises(types.ValidationFailure) as e:
+            async for _ in pipeline:
+                pass
+        assert e.value.name == enc.Name.from_str('/file/seg=7')
+
+
+class TestManifestValidationFailure(ManifestTestSuite):
+    async def fetch(self):
+        async def validator(_name, _sig, _context):
+            return types.ValidResult.FAIL
+
+        reader = ManifestReader(self.app, '/file', validator, lifetime=100)
+        pipeline = SegmentPipeline(self.app, '/file', reader.validate, window_control=FixedWindow(4), lifetime=100)
+        with pytest.raises(types.ValidationFailure):
+            async for _ in pipeline:
+                pass
+        assert reader.manifests_fetched == 0
+
+
+class TestManifestFetchFailureNotCached(ManifestTestSuite):
+    # The first manifest Interest and all its retransmissions are Nacked
+    nack_manifests = 1 + app.RetxPolicy.max_retries
+    cache_results = True
+
+    async def fetch(self):
+        reader = ManifestReader(self.app, '/file', lifetime=100, max_retries=0)
+        with pytest.raises(types.ValidationFailure) as e:
+            await self.app.express('/file/seg=0', reader.validate)
+        assert e.value.result == types.ValidResult.TIMEOUT
+        # The same segment validates once the manifest can be fetched
+        _, content, _ = await self.app.express('/file/seg=0', reader.validate)
+        assert content == b'0,'
+        assert reader.manifests_fetched == 1
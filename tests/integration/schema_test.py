@@ -0,0 +1,171 @@
+# -----------------------------------------------------------------------------
+# Copyright (C) 2019-2022 The python-ndn authors
+#
+# This file is part of python-ndn.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+import asyncio as aio
+from hashlib import sha256
+import pytest
+from ndn.app import NDNApp
+from ndn.encoding import Name, Component, TypeNumber, InterestParam, MetaInfo, parse_data, parse_interest, \
+    make_data, SignatureType
+from ndn.security import KeychainDigest, DigestSha256Signer
+from ndn.transport.dummy_face import DummyFace
+from ndn.types import InterestTimeout
+from ndn.schema import policy
+from ndn.schema.schema_tree import Node
+from ndn.schema.simple_node import SegmentedNode, RDRNode
+from ndn.schema.simple_cache import MemoryCache, MemoryCachePolicy
+from ndn.app_support.manifest import MANIFEST_COMPONENT
+
+
+CONTENT = b''.join(b'%d,' % i for i in range(40))
+
+
+class LoopbackFace(DummyFace):
+    """
+    Pass Interests to the producer tree and Data back to the app.
+    If ``ignore_digest``, Interests with an implicit digest are answered from the cache by the name without it,
+    like a forwarder which does not check digests.
+    """
+
+    def __init__(self, test_func, producer, cache, ignore_digest=False):
+        super().__init__(test_func)
+        self.producer = producer
+        self.cache = cache
+        self.ignore_digest = ignore_digest
+        self.interests = []
+
+    def send(self, data: bytes):
+        if data[0] == TypeNumber.DATA:
+            aio.ensure_future(self.callback(TypeNumber.DATA, data))
+            return
+        name, param, app_param, _ = parse_interest(data)
+        self.interests.append(name)
+        if self.ignore_digest and Component.get_type(name[-1]) == Component.TYPE_IMPLICIT_SHA256:
+            self.send(self.cache.data[name[:-1]])
+        else:
+            self.producer._on_interest_root(name, param, app_param, data)
+
+
+class SchemaTestSuite:
+    ignore_digest = False
+
+    def test_main(self):
+        aio.run(self.comain())
+
+    async def comain(self):
+        self.finished = aio.Event()
+        self.cache = MemoryCache()
+        self.producer = Node()
+        self.producer['/file'] = self.make_node()
+        self.producer.set_policy(policy.Cache, MemoryCachePolicy(self.cache))
+        self.consumer = Node()
+        self.consumer['/file'] = self.make_node()
+        self.face = LoopbackFace(self.face_proc, self.producer, self.cache, self.ignore_digest)
+        self.app = NDNApp(self.face, KeychainDigest())
+        self.face.app = self.app
+        # Not attached, which would register prefixes
+        self.producer.app = self.app
+        self.consumer.app = self.app
+        await self.app.main_loop(self.app_main())
+
+    @staticmethod
+    def make_node():
+        return SegmentedNode(timeout=100, retry_times=1, segment_size=10, manifest=True, digests_per_manifest=4)
+
+    async def face_proc(self, _face):
+        await aio.wait_for(self.finished.wait(), 5)
+
+    async def app_main(self):
+        try:
+            await self.run()
+        finally:
+            self.finished.set()
+
+    async def run(self):
+        pass
+
+
+class TestSegmentedManifest(SchemaTestSuite):
+    async def run(self):
+        await self.producer.match('/file').provide(CONTENT, freshness_period=1000)
+        # 11 segments and 3 manifest segments
+        assert len(list(self.cache.data.itervalues(prefix=Name.from_str('/file')))) == 14
+        wire = self.cache.data[Name.from_str('/file/seg=0')]
+        _, _, _, sig = parse_data(wire)
+        assert sig.signature_info.signature_type == SignatureType.DIGEST_SHA256
+
+        content, meta_data = await self.consumer.match('/file').need()
+        assert content == CONTENT
+        assert meta_data['block_count'] == 11
+        # The first manifest segment is fetched by name. All others are fetched by their digests
+        assert self.face.interests[0] == Name.from_str('/file/32=manifest/seg=0')
+        for name in self.face.interests[1:]:
+            assert Component.get_type(name[-1]) == Component.TYPE_IMPLICIT_SHA256
+        assert sum(name[1] == MANIFEST_COMPONENT for name in self.face.interests) == 3
+        assert len(self.face.interests) == 14
+
+
+class TestSegmentedManifestTampered(SchemaTestSuite):
+    ignore_digest = True
+
+    async def run(self):
+        await self.producer.match('/file').provide(CONTENT, freshness_period=1000)
+        name = Name.from_str('/file/seg=5')
+        _, meta_info, _, _ = parse_data(self.cache.data[name])
+        self.cache.data[name] = bytes(make_data(name, meta_info, b'evil', signer=DigestSha256Signer()))
+
+        with pytest.raises(InterestTimeout):
+            await self.consumer.match('/file').need()
+        # Segments before the tampered one are fetched, and the tampered one is never accepted
+        assert Name.to_str(self.face.interests[-1]).startswith('/file/seg=5/')
+
+
+class TestRDRManifest(SchemaTestSuite):
+    @staticmethod
+    def make_node():
+        return RDRNode(timeout=100, retry_times=1, segment_size=10, manifest=True, digests_per_manifest=4)
+
+    async def run(self):
+        await self.producer.match('/file').provide(CONTENT, freshness_period=1000)
+        version = Component.from_version(self.producer['/file'].timestamp)
+        manifest_name = Name.from_str('/file') + [version, MANIFEST_COMPONENT, Component.from_segment(0)]
+        assert manifest_name in self.cache.data
+
+        content, meta_data = await self.consumer.match('/file').need()
+        assert content == CONTENT
+        assert meta_data['block_count'] == 11
+        # The metadata is followed by the first manifest segment of the version
+        assert self.face.interests[1] == manifest_name
+
+
+class TestMemoryCache:
+    @staticmethod
+    def test_implicit_digest():
+        async def test():
+            cache = MemoryCache()
+            name = Name.from_str('/file/seg=0')
+            wire = bytes(make_data(name, MetaInfo(), b'test', signer=DigestSha256Signer()))
+            await cache.save(name, wire)
+            digest = Component.from_bytes(sha256(wire).digest(), Component.TYPE_IMPLICIT_SHA256)
+            assert await cache.search(name + [digest], InterestParam()) == wire
+            assert await cache.search(Name.from_str('/file'), InterestParam(can_be_prefix=True)) == wire
+            wrong = Component.from_bytes(bytes(32), Component.TYPE_IMPLICIT_SHA256)
+            assert await cache.search(name + [wrong], InterestParam()) is None
+            missing = Name.from_str('/file/seg=1')
+            assert await cache.search(missing + [digest], InterestParam()) is None
+
+        aio.run(test())
@@ -0,0 +1,225 @@
+# -----------------------------------------------------------------------------
+# Copyright (C) 2019-2022 The python-ndn authors
+#
+# This file is part of python-ndn.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+import asyncio as aio
+import pytest
+from ndn import appv2 as app
+from ndn import encoding as enc
+from ndn import security as sec
+from ndn import types
+from ndn.encoding import ndnlp_v2 as ndnlp
+from ndn.transport.dummy_face import DummyFace
+from ndn.app_support.segment_pipeline import SegmentPipeline, FixedWindow, AimdWindow, CubicWindow
+
+
+SEGMENTS = 20
+
+
+class ProducerFace(DummyFace):
+    """
+    Reply to Interests for /file/<seg> after a delay, dropping or Nacking some of them.
+    """
+
+    def __init__(self, test_func, drop=(), mark=(), nack=None):
+        super().__init__(test_func)
+        self.drop = set(drop)
+        self.mark = set(mark)
+        self.nack = nack
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.interests = []
+
+    def send(self, data: bytes):
+        view = enc.InterestView(data)
+        seg_no = enc.Component.to_number(view.name[-1])
+        self.interests.append(seg_no)
+        if seg_no in self.drop:
+            self.drop.remove(seg_no)
+            return
+        if self.nack is not None:
+            nack = ndnlp.make_network_nack(data, self.nack)
+            aio.get_running_loop().call_soon(self.callback, enc.LpTypeNumber.LP_PACKET, nack)
+            return
+        wire = enc.make_data(view.name, enc.MetaInfo(final_block_id=enc.Component.from_segment(SEGMENTS - 1)),
+                             b'%d,' % seg_no, signer=sec.NullSigner())
+        if seg_no in self.mark:
+            lp_packet = ndnlp.LpPacket()
+            lp_packet.lp_packet = ndnlp.LpPacketValue()
+            lp_packet.lp_packet.congestion_mark = 1
+            lp_packet.lp_packet.fragment = wire
+            wire = lp_packet.encode()
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        aio.get_running_loop().call_later(0.002, self.reply, wire)
+
+    def reply(self, wire):
+        self.in_flight -= 1
+        if self.running:
+            typ, _ = enc.parse_tl_num(wire)
+            self.callback(typ, wire)
+
+
+class PipelineTestSuite:
+    drop = ()
+    mark = ()
+    nack = None
+
+    def test_main(self):
+        aio.run(self.comain())
+
+    async def comain(self):
+        self.finished = aio.Event()
+        face = ProducerFace(self.face_proc, self.drop, self.mark, self.nack)
+        self.face = face
+        self.app = app.NDNApp(face)
+        face.app = self.app
+        await self.app.main_loop(self.app_main())
+
+    async def face_proc(self, _face):
+        await aio.wait_for(self.finished.wait(), 5)
+
+    async def app_main(self):
+        try:
+            await self.fetch()
+        finally:
+            self.finished.set()
+
+    async def fetch(self):
+        pass
+
+
+class TestFixedPipeline(PipelineTestSuite):
+    async def fetch(self):
+        pipeline = SegmentPipeline(self.app, '/file', window_control=FixedWindow(4), lifetime=100)
+        content = b''.join([seg async for seg in pipeline])
+        assert content == b''.join(b'%d,' % i for i in range(SEGMENTS))
+        assert self.face.max_in_flight == 4
+        assert pipeline.final_segment == SEGMENTS - 1
+        assert pipeline.retransmissions == 0
+
+
+class TestAimdPipeline(PipelineTestSuite):
+    drop = (5, 6)
+
+    async def fetch(self):
+        window_control = AimdWindow()
+        pipeline = SegmentPipeline(self.app, '/file', window_control=window_control, lifetime=50)
+        content = b''.join([seg async for seg in pipeline])
+        assert content == b''.join(b'%d,' % i for i in range(SEGMENTS))
+        assert (pipeline.timeouts, pipeline.retransmissions) == (2, 2)
+        # Both losses are in the same window, so they only decrease it once
+        assert pipeline.window_decreases == 1
+        assert window_control.ssthresh < float('inf')
+
+
+class TestCongestionMark(PipelineTestSuite):
+    mark = (3, 15)
+
+    async def fetch(self):
+        pipeline = SegmentPipeline(self.app, '/file', lifetime=50)
+        content = b''.join([seg async for seg in pipeline])
+        assert content == b''.join(b'%d,' % i for i in range(SEGMENTS))
+        assert (pipeline.congestion_marks, pipeline.window_decreases, pipeline.retransmissions) == (2, 2, 0)
+
+
+class TestCubicPipeline(PipelineTestSuite):
+    drop = (3,)
+
+    async def fetch(self):
+        pipeline = SegmentPipeline(self.app, '/file', window_control=CubicWindow(), lifetime=50)
+        content = b''.join([seg async for seg in pipeline])
+        assert content == b''.join(b'%d,' % i for i in range(SEGMENTS))
+        assert pipeline.window_decreases == 1
+        # No Interest is sent for segments after the final one
+        assert max(self.face.interests) < SEGMENTS + pipeline.window_control.window
+
+
+class TestBoundedReorder(PipelineTestSuite):
+    drop = (2,)
+
+    async def fetch(self):
+        pipeline = SegmentPipeline(self.app, '/file', window_control=FixedWindow(4), lifetime=50,
+                                   bounded_reorder=True)
+        content = b''.join([seg async for seg in pipeline])
+        assert content == b''.join(b'%d,' % i for i in range(SEGMENTS))
+        # Segments after the lost one are not requested beyond a window until it is retransmitted
+        retx_index = self.face.interests.index(2, self.face.interests.index(2) + 1)
+        assert max(self.face.interests[:retx_index]) < 2 + 4
+        assert pipeline.interests_sent == SEGMENTS + 1
+        assert pipeline.content_bytes == len(content)
+        assert pipeline.bytes_received > pipeline.content_bytes
+        assert pipeline.elapsed > 0.05
+
+
+class TestRtoTimeout(PipelineTestSuite):
+    drop = (5,)
+
+    async def fetch(self):
+        pipeline = SegmentPipeline(self.app, '/file', window_control=FixedWindow(4), lifetime=4000)
+        content = b''.join([seg async for seg in pipeline])
+        assert content == b''.join(b'%d,' % i for i in range(SEGMENTS))
+        assert (pipeline.timeouts, pipeline.retransmissions) == (1, 1)
+        # The lost segment is retransmitted after the RTO rather than the lifetime
+        assert pipeline.elapsed < 2.0
+        assert pipeline.rtt_estimator is self.app.rtt_estimator('/file')
+
+
+class TestRttSamples(PipelineTestSuite):
+    drop = (5,)
+
+    async def fetch(self):
+        pipeline = SegmentPipeline(self.app, '/file', window_control=FixedWindow(4), lifetime=4000)
+        content = b''.join([seg async for seg in pipeline])
+        assert content == b''.join(b'%d,' % i for i in range(SEGMENTS))
+        # Segments answered in 2ms bring the RTO down to its minimum before segment 5 is lost
+        estimator = pipeline.rtt_estimator
+        assert estimator.srtt is not None and estimator.srtt < 0.1
+        assert pipeline.elapsed < estimator.initial_rto
+
+
+class TestPipelineNack(PipelineTestSuite):
+    nack = ndnlp.NackReason.NO_ROUTE
+
+    async def fetch(self):
+        pipeline = SegmentPipeline(self.app, '/file')
+        with pytest.raises(types.InterestNack):
+            async for _ in pipeline:
+                pass
+        assert self.face.interests == [0]
+
+
+class TestWindowControl:
+    @staticmethod
+    def test_aimd():
+        window = AimdWindow(initial_window=2, ssthresh=4)
+        for _ in range(4):
+            window.on_data()
+        before = window.window
+        assert before == pytest.approx(4 + 1 / 4 + 1 / 4.25)
+        window.on_congestion()
+        assert window.window == window.ssthresh == pytest.approx(before / 2)
+
+    @staticmethod
+    def test_cubic():
+        window = CubicWindow(initial_window=10)
+        window.on_congestion()
+        assert window.window == pytest.approx(7)
+        assert window.ssthresh == pytest.approx(7)
+        for _ in range(10):
+            window.on_data()
+        # Grows back towards the window before the congestion, not beyond it right away
+        assert 7 < window.window < 10
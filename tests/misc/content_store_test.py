@@ -0,0 +1,69 @@
+# -----------------------------------------------------------------------------
+# Copyright (C) 2019-2022 The python-ndn authors
+#
+# This file is part of python-ndn.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+from hashlib import sha256
+from ndn.encoding import Name, Component, MetaInfo, make_data
+from ndn.security import NullSigner
+from ndn.app_support.content_store import ContentStore, FifoPolicy
+
+
+def data(name, freshness_period=None, size=0):
+    return bytes(make_data(name, MetaInfo(freshness_period=freshness_period), b'\x00' * size, signer=NullSigner()))
+
+
+class TestContentStore:
+    @staticmethod
+    def test_match():
+        cs = ContentStore()
+        fresh = data('/a/b', freshness_period=10000)
+        stale = data('/a/c')
+        assert cs.insert(fresh)
+        assert cs.insert(stale)
+        assert cs.find(Name.from_str('/a/b')) == fresh
+        assert cs.find(Name.from_str('/a')) is None
+        assert cs.find(Name.from_str('/a'), can_be_prefix=True) in (fresh, stale)
+        assert cs.find(Name.from_str('/a/c'), must_be_fresh=True) is None
+        assert cs.find(Name.from_str('/a/c')) == stale
+        assert cs.find(Name.from_str('/a/b/c'), can_be_prefix=True) is None
+
+        digest = Component.from_bytes(sha256(stale).digest(), Component.TYPE_IMPLICIT_SHA256)
+        assert cs.find(Name.from_str('/a/c') + [digest]) == stale
+        assert cs.find(Name.from_str('/a/b') + [digest]) is None
+        assert (cs.hits, cs.misses) == (4, 4)
+
+    @staticmethod
+    def test_eviction():
+        packets = [data(f'/a/{i}', size=100) for i in range(5)]
+        cs = ContentStore(capacity=len(packets[0]) * 3)
+        for wire in packets[:3]:
+            cs.insert(wire)
+        # /a/0 becomes the most recently used
+        assert cs.find(Name.from_str('/a/0')) == packets[0]
+        cs.insert(packets[3])
+        assert len(cs) == 3
+        assert cs.evictions == 1
+        assert cs.find(Name.from_str('/a/1')) is None
+        assert cs.find(Name.from_str('/a/0')) == packets[0]
+
+        cs = ContentStore(capacity=len(packets[0]) * 3, policy=FifoPolicy())
+        for wire in packets[:3]:
+            cs.insert(wire)
+        assert cs.find(Name.from_str('/a/0')) == packets[0]
+        cs.insert(packets[3])
+        assert cs.find(Name.from_str('/a/0')) is None
+        assert cs.size == len(packets[0]) * 3
+        assert not cs.insert(b'\x06' + b'\x00' * 1000)
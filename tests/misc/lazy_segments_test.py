@@ -0,0 +1,86 @@
+# -----------------------------------------------------------------------------
+# Copyright (C) 2019-2022 The python-ndn authors
+#
+# This file is part of python-ndn.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+import asyncio as aio
+import mmap
+import os
+from hashlib import sha256
+from ndn.encoding import Name, Component, MetaInfo, DataTemplate, make_data
+from ndn.security import DigestSha256Signer
+from ndn.bin.tools.cmd_serve_rdrcontent import LazySegments
+
+
+PREFIX = Name.from_str('/test/file/v=1')
+
+
+def template(seg_cnt):
+    return DataTemplate(PREFIX, MetaInfo(freshness_period=1000, final_block_id=Component.from_segment(seg_cnt - 1)),
+                        signer=DigestSha256Signer())
+
+
+class TestLazySegments:
+    @staticmethod
+    def test_output(tmp_path):
+        content = os.urandom(1000)
+        path = tmp_path / 'file'
+        path.write_bytes(content)
+        with open(path, 'rb') as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            segments = LazySegments(buf, 300, template(4))
+            assert len(segments) == 4
+            for i in range(4):
+                expected = template(4).make_data(Component.from_segment(i), content[i * 300:(i + 1) * 300])
+                assert segments.get(i) == bytes(expected)
+                meta_info = MetaInfo(freshness_period=1000, final_block_id=Component.from_segment(3))
+                assert segments.get(i) == bytes(make_data(PREFIX + [Component.from_segment(i)], meta_info,
+                                                          content[i * 300:(i + 1) * 300], DigestSha256Signer()))
+            assert segments.digests() == [sha256(segments.get(i)).digest() for i in range(4)]
+        finally:
+            buf.close()
+
+    @staticmethod
+    def test_cache():
+        segments = LazySegments(b'\x00' * 100, 10, template(10), cache_size=2)
+        for i in range(3):
+            segments.get(i)
+        assert list(segments._cache) == [1, 2]
+        # A hit moves the segment to the end
+        wire = segments.get(1)
+        assert segments.get(1) is wire
+        assert list(segments._cache) == [2, 1]
+        segments.get(3)
+        assert list(segments._cache) == [1, 3]
+
+    @staticmethod
+    def test_presign():
+        async def test():
+            segments = LazySegments(b'\x00' * 100, 10, template(10), cache_size=4, presign=2)
+            segments.get(7)
+            assert segments._signing == {8, 9}
+            for _ in range(100):
+                if not segments._signing:
+                    break
+                await aio.sleep(0.01)
+            assert sorted(segments._cache) == [7, 8, 9]
+            assert segments._cache[8] == bytes(template(10).make_data(Component.from_segment(8), b'\x00' * 10))
+            # Presigned segments are not signed again
+            wire = segments._cache[9]
+            assert segments.get(9) is wire
+            assert not segments._signing
+
+        aio.run(test())
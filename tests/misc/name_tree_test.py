@@ -0,0 +1,55 @@
+# -----------------------------------------------------------------------------
+# Copyright (C) 2019-2022 The python-ndn authors
+#
+# This file is part of python-ndn.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+import pytest
+from ndn.encoding import Name
+from ndn.name_tree import NameFib
+
+
+class TestNameFib:
+    @staticmethod
+    def test_longest_prefix():
+        fib = NameFib()
+        assert not fib.longest_prefix(Name.from_str('/a'))
+        fib[[]] = 'root'
+        fib[Name.from_str('/a')] = 'a'
+        fib[Name.from_str('/a/b/c')] = 'abc'
+        assert fib.setdefault(Name.from_str('/a'), 'x') == 'a'
+        assert fib.setdefault(Name.from_str('/d/e'), 'de') == 'de'
+        assert len(fib) == 4
+
+        name = Name.from_bytes(b'\x07\x0c\x08\x01a\x08\x01b\x08\x01c\x08\x01d')
+        step = fib.longest_prefix(name)
+        assert step.value == 'abc'
+        assert step.key == name[:3]
+        assert fib.longest_prefix(Name.from_str('/a/b')).value == 'a'
+        assert fib.longest_prefix(Name.from_str('/d')).value == 'root'
+        assert fib.longest_prefix(Name.from_str('/d/e')).value == 'de'
+        # Component boundaries are respected
+        assert fib.longest_prefix(Name.from_str('/ab')).value == 'root'
+
+        del fib[Name.from_str('/a/b/c')]
+        assert fib.longest_prefix(name).value == 'a'
+        with pytest.raises(KeyError):
+            del fib[Name.from_str('/a/b/c')]
+        with pytest.raises(KeyError):
+            _ = fib[Name.from_str('/a/b')]
+        assert Name.from_str('/a') in fib
+        assert sorted(fib.itervalues()) == ['a', 'de', 'root']
+        fib.clear()
+        assert not fib
+        assert fib.longest_prefix(name) is None
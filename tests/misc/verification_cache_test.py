@@ -0,0 +1,57 @@
+# -----------------------------------------------------------------------------
+# Copyright (C) 2019-2022 The python-ndn authors
+#
+# This file is part of python-ndn.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+import time
+from ndn.types import ValidResult
+from ndn.app_support.verification_cache import VerificationCache
+
+
+def validator_a(_name, _sig, _context):
+    pass
+
+
+def validator_b(_name, _sig, _context):
+    pass
+
+
+class TestVerificationCache:
+    @staticmethod
+    def test_lookup():
+        cache = VerificationCache()
+        cache.put(b'1', validator_a, ValidResult.PASS)
+        cache.put(b'2', validator_a, ValidResult.FAIL)
+        cache.put(b'3', validator_a, ValidResult.TIMEOUT)
+        assert cache.get(b'1', validator_a) == ValidResult.PASS
+        assert cache.get(b'2', validator_a) == ValidResult.FAIL
+        assert cache.get(b'1', validator_b) is None
+        assert cache.get(b'3', validator_a) is None
+        assert len(cache) == 2
+        assert (cache.hits, cache.misses) == (2, 2)
+
+    @staticmethod
+    def test_bounds():
+        cache = VerificationCache(capacity=2, ttl=0.01)
+        cache.put(b'1', validator_a, ValidResult.PASS)
+        cache.put(b'2', validator_a, ValidResult.PASS)
+        # b'1' becomes the most recently used
+        assert cache.get(b'1', validator_a) == ValidResult.PASS
+        cache.put(b'3', validator_a, ValidResult.PASS)
+        assert len(cache) == 2
+        assert cache.get(b'2', validator_a) is None
+        time.sleep(0.02)
+        assert cache.get(b'1', validator_a) is None
+        assert len(cache) == 1
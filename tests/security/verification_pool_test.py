@@ -0,0 +1,150 @@
+# -----------------------------------------------------------------------------
+# Copyright (C) 2019-2022 The python-ndn authors
+#
+# This file is part of python-ndn.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# -----------------------------------------------------------------------------
+import asyncio as aio
+from concurrent.futures import ThreadPoolExecutor
+from Cryptodome.PublicKey import ECC
+from ndn.app import NDNApp
+from ndn.app_support.security_v2 import self_sign
+from ndn.encoding import make_data, MetaInfo, parse_data, Name, SignatureType
+from ndn.security import Sha256WithEcdsaSigner, HmacSha256Signer, EccChecker, HmacChecker, RsaChecker, \
+    VerificationPool, verify_signature, KeychainDigest
+from ndn.security.validator.cascade_validator import CascadeChecker, MemoryKeyStorage
+from ndn.transport.dummy_face import DummyFace
+
+
+def ecdsa_packets(count):
+    pri_key = ECC.generate(curve='P-256')
+    signer = Sha256WithEcdsaSigner('/K/KEY/x', pri_key.export_key(format='DER'))
+    pub_bits = bytes(pri_key.public_key().export_key(format='DER'))
+    packets = [make_data(f'/test/{i}', MetaInfo(), b'test content', signer=signer) for i in range(count)]
+    return pub_bits, [parse_data(pkt)[3] for pkt in packets]
+
+
+class TestVerificationPool:
+    @staticmethod
+    def test_verify_signature():
+        pub_bits, (sig_ptrs,) = ecdsa_packets(1)
+        assert verify_signature(SignatureType.SHA256_WITH_ECDSA, pub_bits, sig_ptrs)
+        assert not verify_signature(SignatureType.SHA256_WITH_RSA, pub_bits, sig_ptrs)
+        assert not verify_signature(SignatureType.SHA256_WITH_ECDSA, b'not a key', sig_ptrs)
+        signer = HmacSha256Signer('/K/KEY/x', b'secret')
+        _, _, _, sig_ptrs = parse_data(make_data('/test', MetaInfo(), b'', signer=signer))
+        assert verify_signature(SignatureType.HMAC_WITH_SHA256, b'secret', sig_ptrs)
+        assert not verify_signature(SignatureType.HMAC_WITH_SHA256, b'wrong', sig_ptrs)
+
+    @staticmethod
+    def test_batch():
+        pub_bits, sig_ptrs_list = ecdsa_packets(5)
+        pool = VerificationPool(max_batch=2)
+
+        async def test():
+            tampered = sig_ptrs_list[0]
+            tampered.signature_covered_part = [b'tampered'] + tampered.signature_covered_part[1:]
+            return await aio.gather(*(pool.verify(SignatureType.SHA256_WITH_ECDSA, pub_bits, sig_ptrs)
+                                      for sig_ptrs in sig_ptrs_list))
+
+        try:
+            assert aio.run(test()) == [False, True, True, True, True]
+        finally:
+            pool.shutdown()
+
+    @staticmethod
+    def test_spread():
+        class RecordingExecutor(ThreadPoolExecutor):
+            def __init__(self):
+                super().__init__(max_workers=4)
+                self.batches = []
+
+            def submit(self, fn, jobs):
+                self.batches.append(len(jobs))
+                return super().submit(fn, jobs)
+
+        pub_bits, sig_ptrs_list = ecdsa_packets(10)
+        executor = RecordingExecutor()
+        pool = VerificationPool(executor, max_batch=4)
+
+        async def test(sig_ptrs_list):
+            return await aio.gather(*(pool.verify(SignatureType.SHA256_WITH_ECDSA, pub_bits, sig_ptrs)
+                                      for sig_ptrs in sig_ptrs_list))
+
+        try:
+            # A burst is split over the workers
+            assert aio.run(test(sig_ptrs_list[:6])) == [True] * 6
+            assert executor.batches == [2, 2, 2]
+            # Batches do not grow over max_batch
+            executor.batches = []
+            assert aio.run(test(sig_ptrs_list * 2)) == [True] * 20
+            assert executor.batches == [4] * 5
+        finally:
+            pool.shutdown()
+
+    @staticmethod
+    def test_checker():
+        pub_bits, (sig_ptrs,) = ecdsa_packets(1)
+        pool = VerificationPool()
+        try:
+            validator = EccChecker.from_key('/K/KEY/x', pub_bits, pool)
+            assert aio.run(validator(Name.from_str('/test/0'), sig_ptrs))
+            # KeyLocator not under the key name
+            validator = EccChecker.from_key('/K/KEY/y', pub_bits, pool)
+            assert not aio.run(validator(Name.from_str('/test/0'), sig_ptrs))
+            # Signature type not matching the checker
+            validator = RsaChecker.from_key('/K/KEY/x', pub_bits, pool)
+            assert not aio.run(validator(Name.from_str('/test/0'), sig_ptrs))
+            # Wrong key
+            other_bits = bytes(ECC.generate(curve='P-256').public_key().export_key(format='DER'))
+            validator = EccChecker.from_key('/K/KEY/x', other_bits, pool)
+            assert not aio.run(validator(Name.from_str('/test/0'), sig_ptrs))
+
+            signer = HmacSha256Signer('/K/KEY/x', b'secret')
+            _, _, _, sig_ptrs = parse_data(make_data('/test', MetaInfo(), b'', signer=signer))
+            validator = HmacChecker.from_key('/K/KEY/x', b'secret', pool)
+            assert aio.run(validator(Name.from_str('/test'), sig_ptrs))
+            validator = HmacChecker.from_key('/K/KEY/x', b'wrong', pool)
+            assert not aio.run(validator(Name.from_str('/test'), sig_ptrs))
+        finally:
+            pool.shutdown()
+
+    @staticmethod
+    def test_cascade_checker():
+        anchor_key = ECC.generate(curve='P-256')
+        anchor_pub = bytes(anchor_key.public_key().export_key(format='DER'))
+        anchor_signer = Sha256WithEcdsaSigner('/K/KEY/x', anchor_key.export_key(format='DER'))
+        anchor_name, anchor = self_sign('/K/KEY/x', anchor_pub, anchor_signer)
+        signer = Sha256WithEcdsaSigner(anchor_name, anchor_key.export_key(format='DER'))
+        _, _, _, sig_ptrs = parse_data(make_data('/test/0', MetaInfo(), b'test content', signer=signer))
+        _, _, _, bad_sig_ptrs = parse_data(make_data('/test/1', MetaInfo(), b'test content', signer=signer))
+        bad_sig_ptrs.signature_covered_part = [b'tampered'] + bad_sig_ptrs.signature_covered_part[1:]
+
+        # A cached key signing another Data
+        other_key = ECC.generate(curve='P-256')
+        other_name = Name.from_str('/K/KEY/y/self/v=1')
+        other_signer = Sha256WithEcdsaSigner(other_name, other_key.export_key(format='DER'))
+        _, _, _, other_sig_ptrs = parse_data(make_data('/test/2', MetaInfo(), b'', signer=other_signer))
+
+        pool = VerificationPool()
+        app = NDNApp(DummyFace(None), KeychainDigest(), verification_pool=pool)
+        try:
+            checker = CascadeChecker(app, anchor, MemoryKeyStorage())
+            assert checker.pool is pool
+            checker.storage.save(other_name, bytes(other_key.public_key().export_key(format='DER')))
+            assert aio.run(checker(Name.from_str('/test/0'), sig_ptrs))
+            assert not aio.run(checker(Name.from_str('/test/1'), bad_sig_ptrs))
+            assert aio.run(checker(Name.from_str('/test/2'), other_sig_ptrs))
+        finally:
+            pool.shutdown()